@@ -2,9 +2,11 @@
 RAcourse-Algorithm 메인 애플리케이션
 러닝 코스 추천 시스템 - Streamlit UI
 """
+import os
 import streamlit as st
 import time
 import logging
+from typing import Tuple
 
 # 페이지 설정 (가장 먼저 호출되어야 함)
 st.set_page_config(
@@ -14,11 +16,13 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-from src.presentation.state import init_session_state, set_loading, set_error, clear_error
+from src.presentation.state import init_session_state, set_loading, set_error, clear_error, set_routes
 from src.presentation.components.sidebar import render_sidebar
 from src.presentation.components.map_view import render_map, render_map_instructions
 from src.presentation.components.route_cards import render_route_cards, render_route_summary
 from src.presentation.mock_data import generate_mock_routes
+from src.domain.entities import BoundingBox
+from src.data.entities import RoadGraph
 from src.service.route_search_service import (
     RouteSearchService, SearchStatus, create_search_request
 )
@@ -27,6 +31,10 @@ from src.service.route_search_service import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Mock 검색 단계별 연출 지연 (초). 기본값 0 = 지연 없음 (운영 환경에서는 비활성)
+# 데모용 애니메이션이 필요하면 MOCK_STEP_DELAY=0.3 처럼 환경 변수로 지정
+MOCK_STEP_DELAY = float(os.environ.get("MOCK_STEP_DELAY", "0.0"))
+
 
 def main():
     """메인 애플리케이션 진입점"""
@@ -89,12 +97,13 @@ def _render_main_content():
         render_route_cards(
             routes=routes,
             selected_route_id=selected_route_id,
+            metrics=st.session_state.get('route_metrics'),
             on_select=_handle_route_select,
         )
         
         # 경로 요약
         if routes:
-            render_route_summary(routes)
+            render_route_summary(routes, st.session_state.get('route_metrics'))
 
 
 def _render_loading_state():
@@ -113,11 +122,36 @@ def _render_loading_state():
             _perform_mock_search()
 
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _load_graph_cached(bbox_key: Tuple[float, float, float, float]) -> RoadGraph:
+    """
+    영역별 도로 그래프를 재실행/세션 간 공유 (OSM 조회 및 그래프 구성 1회)
+    
+    Args:
+        bbox_key: 소수 4자리로 반올림한 (north, south, east, west)
+        
+    Returns:
+        도로 그래프 (읽기 전용으로 사용)
+    """
+    north, south, east, west = bbox_key
+    service = RouteSearchService(use_cache=True)
+    return service.fetch_graph(BoundingBox(north=north, south=south, east=east, west=west))
+
+
+def _cached_graph_loader(bbox: BoundingBox) -> RoadGraph:
+    """확장된 영역을 캐시 키로 변환하여 그래프 로딩"""
+    bbox_key = (
+        round(bbox.north, 4), round(bbox.south, 4),
+        round(bbox.east, 4), round(bbox.west, 4),
+    )
+    return _load_graph_cached(bbox_key)
+
+
 def _perform_real_search():
     """실제 경로 탐색 수행"""
     progress_bar = st.progress(0)
-    status_text = st.empty()
-    info_text = st.empty()
+    # 상태 문구와 안내 문구를 하나의 자리표시자에 함께 표시 (갱신 메시지 1회)
+    status_slot = st.empty()
     
     status_messages = {
         SearchStatus.LOADING_DATA: "🗺️ 지도 데이터 로딩 중...",
@@ -135,14 +169,32 @@ def _perform_real_search():
         SearchStatus.FILTERING_RESULTS: "",
     }
     
+    # 프론트엔드 왕복을 줄이기 위해 갱신을 100ms / 1% 단위로 제한
+    last_update = [0.0]
+    last_progress = [-1.0]
+    last_status = [None]
+
     def update_progress(status: SearchStatus, progress: float):
-        status_text.text(status_messages.get(status, "처리 중..."))
-        progress_bar.progress(min(progress, 1.0))
-        info = status_info.get(status, "")
-        if info:
-            info_text.caption(info)
-        else:
-            info_text.empty()
+        progress = min(progress, 1.0)
+        now = time.monotonic()
+        status_changed = status != last_status[0]
+
+        if not status_changed and progress < 1.0:
+            if now - last_update[0] < 0.1 or abs(progress - last_progress[0]) < 0.01:
+                return
+
+        last_update[0] = now
+        last_progress[0] = progress
+        progress_bar.progress(progress)
+
+        # 상태 문구와 안내 문구는 상태가 바뀔 때만 갱신
+        if status_changed:
+            last_status[0] = status
+            message = f"**{status_messages.get(status, '처리 중...')}**"
+            info = status_info.get(status, "")
+            if info:
+                message += f"\n\n{info}"
+            status_slot.markdown(message)
     
     try:
         # 검색 요청 생성
@@ -160,12 +212,12 @@ def _perform_real_search():
             max_traffic_lights=max_traffic_lights
         )
         
-        # 서비스 호출
-        service = RouteSearchService(use_cache=True)
+        # 서비스 호출 (그래프는 프로세스 단위 캐시에서 공유, 결과는 요청마다 계산)
+        service = RouteSearchService(use_cache=True, graph_loader=_cached_graph_loader)
         response = service.search(request, progress_callback=update_progress)
         
         if response.status == SearchStatus.COMPLETED:
-            st.session_state.routes = response.routes
+            set_routes(response.routes)
             if not response.routes:
                 set_error("조건에 맞는 경로를 찾지 못했습니다. 영역을 넓히거나 조건을 완화해보세요.")
         else:
@@ -198,15 +250,17 @@ def _perform_mock_search():
         for i, step in enumerate(steps):
             status_text.text(step)
             progress_bar.progress((i + 1) * 20)
-            time.sleep(0.3)
+            if MOCK_STEP_DELAY > 0:
+                time.sleep(MOCK_STEP_DELAY)
         
         status_text.text("완료!")
-        time.sleep(0.2)
+        if MOCK_STEP_DELAY > 0:
+            time.sleep(MOCK_STEP_DELAY)
     
     # Mock 데이터로 결과 설정
     center = st.session_state.get('map_center', [37.5665, 126.9780])
     mock_routes = generate_mock_routes(center[0], center[1])
-    st.session_state.routes = mock_routes
+    set_routes(mock_routes)
     st.session_state.is_loading = False
     st.rerun()
 
@@ -232,7 +286,7 @@ def _handle_search():
 def _handle_route_select(route_id: int):
     """경로 선택 핸들러"""
     st.session_state.selected_route_id = route_id
-    # rerun 제거 - session_state 변경만으로 다음 렌더링에 반영됨
+    # 버튼 on_click 콜백으로 호출되어 이어지는 재실행에 바로 반영됨 (별도 rerun 불필요)
 
 
 # 커스텀 CSS
@@ -0,0 +1,35 @@
+"""
+선택적 JIT 컴파일 지원
+numba가 설치되어 있으면 njit으로 컴파일하고, 없으면 원래 Python 함수를 그대로 사용
+"""
+try:
+    from numba import njit as _numba_njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba는 선택 의존성
+    _numba_njit = None
+    prange = range
+    HAS_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """
+    numba.njit 래퍼
+
+    @njit, @njit(cache=True, fastmath=True) 두 형태를 모두 지원하며
+    numba가 없으면 데코레이터가 함수를 그대로 반환
+
+    Args:
+        *args: 데코레이트할 함수 또는 numba 시그니처
+        **kwargs: numba.njit 옵션
+
+    Returns:
+        컴파일된 함수 또는 데코레이터
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        func = args[0]
+        return _numba_njit(func) if HAS_NUMBA else func
+
+    def decorator(func):
+        return _numba_njit(*args, **kwargs)(func) if HAS_NUMBA else func
+
+    return decorator
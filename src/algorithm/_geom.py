@@ -0,0 +1,124 @@
+"""
+A* 휴리스틱용 기하 커널
+numba가 있으면 네이티브 코드로 컴파일된 루프를, 없으면 NumPy 벡터 연산을 사용
+
+두 경로의 결과가 어긋나지 않도록 fastmath(연산 순서 재배치)는 사용하지 않음
+"""
+import math
+from typing import Tuple
+
+import numpy as np
+
+from src._jit import HAS_NUMBA, njit
+
+
+EARTH_RADIUS_KM = 6371.0
+DEG2RAD = math.pi / 180.0
+
+
+@njit(cache=True)
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 거리 (km)"""
+    lat1_r = lat1 * DEG2RAD
+    lat2_r = lat2 * DEG2RAD
+    dlat = lat2_r - lat1_r
+    dlng = (lng2 - lng1) * DEG2RAD
+
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+@njit(cache=True)
+def fast_distance(lat1: float, lng1: float, lat2: float, lng2: float, cos_lat: float) -> float:
+    """
+    두 좌표 사이의 근사 거리 (km)
+
+    등장방형 투영으로 삼각함수 호출 없이 계산하며,
+    경도 보정은 탐색 영역 위도의 코사인(cos_lat)을 사용
+    """
+    dy = lat2 - lat1
+    dx = (lng2 - lng1) * cos_lat
+    return EARTH_RADIUS_KM * DEG2RAD * math.sqrt(dx * dx + dy * dy)
+
+
+@njit(cache=True)
+def point_to_segment_distance(
+    px: float, py: float,
+    x1: float, y1: float,
+    x2: float, y2: float,
+    cos_lat: float
+) -> float:
+    """점(위도, 경도)에서 선분까지의 근사 거리 (km)"""
+    dx = x2 - x1
+    dy = y2 - y1
+
+    if dx == 0 and dy == 0:
+        return fast_distance(px, py, x1, y1, cos_lat)
+
+    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+
+    return fast_distance(px, py, x1 + t * dx, y1 + t * dy, cos_lat)
+
+
+@njit(cache=True)
+def _min_distance_to_curve_loop(
+    px: float, py: float,
+    curve_lat: np.ndarray, curve_lng: np.ndarray,
+    cos_lat: float
+) -> float:
+    """곡선의 모든 선분에 대한 최소 거리 (컴파일된 루프)"""
+    min_dist = np.inf
+    for i in range(curve_lat.shape[0] - 1):
+        dist = point_to_segment_distance(
+            px, py,
+            curve_lat[i], curve_lng[i],
+            curve_lat[i + 1], curve_lng[i + 1],
+            cos_lat
+        )
+        if dist < min_dist:
+            min_dist = dist
+    return min_dist
+
+
+def curve_segments(
+    curve_lat: np.ndarray, curve_lng: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    벡터 커널용 곡선 선분 배열 (곡선마다 한 번 계산)
+    
+    Args:
+        curve_lat: 곡선 위도 배열
+        curve_lng: 곡선 경도 배열
+        
+    Returns:
+        (선분 시작 위도, 시작 경도, 위도 차이, 경도 차이, 길이 제곱).
+        길이 0인 선분은 길이 제곱을 1로 두어 t=0 (시작점까지의 거리)이 되도록 함
+    """
+    seg_lat1 = curve_lat[:-1]
+    seg_lng1 = curve_lng[:-1]
+    seg_dlat = curve_lat[1:] - seg_lat1
+    seg_dlng = curve_lng[1:] - seg_lng1
+
+    seg_len_sq = seg_dlat * seg_dlat + seg_dlng * seg_dlng
+    seg_len_sq[seg_len_sq == 0] = 1.0
+    return seg_lat1, seg_lng1, seg_dlat, seg_dlng, seg_len_sq
+
+
+def _min_distance_to_curve_vec(
+    px: float, py: float,
+    seg_lat1: np.ndarray, seg_lng1: np.ndarray,
+    seg_dlat: np.ndarray, seg_dlng: np.ndarray,
+    seg_len_sq: np.ndarray,
+    cos_lat: float
+) -> float:
+    """곡선의 모든 선분에 대한 최소 거리 (NumPy 벡터 연산, 선분 배열은 curve_segments 결과)"""
+    if seg_lat1.shape[0] == 0:
+        return float('inf')
+
+    t = ((px - seg_lat1) * seg_dlat + (py - seg_lng1) * seg_dlng) / seg_len_sq
+    np.clip(t, 0.0, 1.0, out=t)
+
+    dy = seg_lat1 + t * seg_dlat - px
+    dx = (seg_lng1 + t * seg_dlng - py) * cos_lat
+    return EARTH_RADIUS_KM * DEG2RAD * math.sqrt((dx * dx + dy * dy).min())
@@ -0,0 +1,106 @@
+"""
+Pareto 순위/혼잡 거리 JIT 커널
+(n, 3) 연속 float64 목적 함수 행렬을 스칼라 루프로 처리하여
+NumPy 브로드캐스트의 (n, n, 3) 임시 배열 없이 계산 (numba 미설치 시 ParetoFilter가 NumPy 경로 사용)
+"""
+import numpy as np
+
+from src._jit import njit
+
+
+# parallel=True(prange)는 사용하지 않음: RouteFinder가 이미 작업을 스레드 풀(기본)이나
+# spawn 프로세스 풀에 나눠 돌리므로 numba 스레드 풀을 더하면 코어를 과다 점유하고,
+# 후보 수(수백 개 이하)에서는 스레드 분배 이득도 작음
+@njit(fastmath=True, cache=True)
+def dominance_matrix(A: np.ndarray) -> np.ndarray:
+    """D[i, j] = i가 j를 지배 (모든 값 <= 이고 하나 이상 <)"""
+    n = A.shape[0]
+    m = A.shape[1]
+    D = np.zeros((n, n), dtype=np.bool_)
+    for j in range(n):
+        for i in range(n):
+            all_leq = True
+            any_lt = False
+            for k in range(m):
+                if A[i, k] > A[j, k]:
+                    all_leq = False
+                    break
+                if A[i, k] < A[j, k]:
+                    any_lt = True
+            if all_leq and any_lt:
+                D[i, j] = True
+    return D
+
+
+@njit(cache=True)
+def fast_nds(A: np.ndarray) -> np.ndarray:
+    """
+    빠른 비지배 정렬: 각 행의 Pareto 순위 (0이 최상위)
+
+    지배당한 횟수가 0인 행을 현재 front로 떼어내고,
+    그 행이 지배하던 행의 횟수를 줄여 0이 되면 다음 front에 넣는다.
+    """
+    n = A.shape[0]
+    D = dominance_matrix(A)
+
+    counts = np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        for j in range(n):
+            if D[i, j]:
+                counts[j] += 1
+
+    ranks = np.zeros(n, dtype=np.int64)
+    front = np.empty(n, dtype=np.int64)
+    next_front = np.empty(n, dtype=np.int64)
+    front_size = 0
+    for i in range(n):
+        if counts[i] == 0:
+            front[front_size] = i
+            front_size += 1
+
+    rank = 0
+    while front_size > 0:
+        next_size = 0
+        for f in range(front_size):
+            i = front[f]
+            ranks[i] = rank
+            for j in range(n):
+                if D[i, j]:
+                    counts[j] -= 1
+                    if counts[j] == 0:
+                        next_front[next_size] = j
+                        next_size += 1
+        front, next_front = next_front, front
+        front_size = next_size
+        rank += 1
+
+    return ranks
+
+
+@njit(cache=True)
+def crowding(A: np.ndarray) -> np.ndarray:
+    """
+    혼잡 거리: 목적 함수별 정렬 후 양 옆 이웃 간 간격(범위로 정규화)의 합
+
+    inf 경계값을 다루므로 fastmath를 사용하지 않음
+    """
+    n = A.shape[0]
+    dist = np.zeros(n)
+    if n <= 2:
+        dist[:] = np.inf
+        return dist
+
+    for m in range(A.shape[1]):
+        column = A[:, m].copy()
+        order = np.argsort(column, kind='mergesort')
+        dist[order[0]] = np.inf
+        dist[order[n - 1]] = np.inf
+
+        obj_range = column[order[n - 1]] - column[order[0]]
+        if obj_range == 0:
+            continue
+
+        for i in range(1, n - 1):
+            dist[order[i]] += (column[order[i + 1]] - column[order[i - 1]]) / obj_range
+
+    return dist
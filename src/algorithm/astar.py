@@ -3,13 +3,25 @@ A* 경로 탐색 알고리즘
 목표 도형을 따라가는 최적 경로 탐색
 """
 import heapq
+import itertools
+import logging
 import math
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass
+from typing import List, Dict, FrozenSet, Optional, Tuple
+
+import numpy as np
 
 from src.domain.entities import Coordinate
-from src.data.entities import Node, Edge, RoadGraph
+from src.data.entities import Node, RoadGraph, CSRAdjacency
 from src.cost.cost_function import CostCalculator
+from src._jit import HAS_NUMBA
+from src.algorithm._geom import (
+    DEG2RAD, haversine, curve_segments,
+    _min_distance_to_curve_loop, _min_distance_to_curve_vec
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -37,15 +49,16 @@ class PathCandidate:
     traffic_light_count: int = 0
 
 
-@dataclass(order=True)
-class PriorityItem:
-    """우선순위 큐 아이템"""
-    priority: float
-    node_id: int = field(compare=False)
-    path: List[int] = field(compare=False)
-    g_cost: float = field(compare=False)
-    path_length_km: float = field(compare=False)
-    traffic_light_count: int = field(compare=False)
+# 우선순위 큐 아이템 튜플:
+# (f_cost, entry_id, node, depth, g_cost,
+#  path_length_km, traffic_light_count, shape_distance_km, prev_nodes)
+# entry_id는 came_from 인덱스이자 단조 증가하는 동순위 비교 키이므로
+# 튜플 비교가 앞의 두 원소에서 끝남. prev_nodes는 node 이전까지의 경로 노드 집합으로
+# 형제 항목이 부모의 집합을 그대로 공유하고, 꺼내서 확장할 때만 node를 더한 집합을 만든다
+# (집합 복사는 넣을 때가 아니라 확장할 때 한 번, O(1) 중복 확인)
+# 길이/신호등/도형 거리는 엣지마다 누적하여 경로 완성 시 재계산 없이 비용 산출
+# find_path / find_path_to_goal에서 node와 prev_nodes는 CSR 노드 인덱스
+QueueItem = Tuple[float, int, int, int, float, float, int, float, FrozenSet[int]]
 
 
 class AStarPathFinder:
@@ -61,7 +74,8 @@ class AStarPathFinder:
         target_curve: List[Coordinate],
         target_distance_km: float,
         max_crossings: int,
-        weights: Tuple[float, float, float] = (1.0, 1.0, 1.0)
+        weights: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        target_curve_arr: Optional[np.ndarray] = None
     ):
         """
         Args:
@@ -70,6 +84,8 @@ class AStarPathFinder:
             target_distance_km: 목표 거리 (km)
             max_crossings: 허용 최대 횡단보도 개수
             weights: (shape, length, crossing) 가중치 튜플
+            target_curve_arr: target_curve와 같은 (N, 2) [lat, lng] 배열.
+                주어지면 Coordinate 목록을 다시 순회하지 않고 그대로 사용
         """
         self.graph = graph
         self.target_curve = target_curve
@@ -83,27 +99,69 @@ class AStarPathFinder:
             max_crossings=max_crossings,
             weights=weights
         )
+        
+        # 목표 곡선 좌표 배열 (곡선 거리 커널 입력, 연속 float64)
+        if target_curve_arr is not None:
+            curve_lat = np.ascontiguousarray(target_curve_arr[:, 0], dtype=np.float64)
+            curve_lng = np.ascontiguousarray(target_curve_arr[:, 1], dtype=np.float64)
+        else:
+            curve_lat = np.ascontiguousarray([c.lat for c in target_curve], dtype=np.float64)
+            curve_lng = np.ascontiguousarray([c.lng for c in target_curve], dtype=np.float64)
+        self._curve_lat = curve_lat
+        self._curve_lng = curve_lng
+        # numba 미설치 시 벡터 커널용 선분 배열 (노드마다 다시 자르지 않도록 한 번만 계산)
+        self._curve_segments = None if HAS_NUMBA else curve_segments(curve_lat, curve_lng)
+        
+        # 등장방형 근사용: 탐색 영역(목표 곡선) 평균 위도의 코사인
+        mean_lat = float(curve_lat.mean()) if curve_lat.size else 0.0
+        self._cos_mean_lat = math.cos(mean_lat * DEG2RAD)
+        # 곡선 거리 휴리스틱 축소 배율 (그래프 위도 범위에 맞춰 _sync_csr에서 갱신)
+        self._curve_dist_scale = 1.0
+        
+        # 노드별 휴리스틱 캐시: 곡선 거리는 노드에만 의존, 목표 거리는 탐색마다 초기화
+        self._curve_dist_cache: Dict[int, float] = {}
+        self._goal_dist_cache: Dict[int, float] = {}
+        
+        # CSR 인접 구조와 내부 루프용 리스트 사본 (그래프가 바뀌면 _sync_csr에서 재구성)
+        self._csr: Optional[CSRAdjacency] = None
+        self._indptr: List[int] = []
+        self._nbr_idx: List[int] = []
+        self._edge_len: List[float] = []
+        self._edge_light: List[int] = []
+        self._src_idx: List[int] = []
+        self._slot_order: List[int] = []
+        self._rev_indptr: List[int] = []
+        self._rev_slot: List[int] = []
+        self._nodes_by_idx: List[Node] = []
+        
+        # CSR 슬롯(방향 엣지)별 비용 테이블: slot -> (엣지 비용, 도형 거리 km)
+        # 경로와 무관한 값이므로 CSR을 가져올 때 모든 슬롯을 배열 연산으로 한 번에 계산
+        self._slot_terms: List[Tuple[float, float]] = []
     
     def find_path(
         self,
         start_node_id: int,
-        max_iterations: int = 10000
+        max_iterations: int = 10000,
+        beam_width: Optional[int] = None
     ) -> Optional[PathCandidate]:
         """
         시작점에서 순환 경로 탐색 (시작점으로 돌아오는 경로)
         
         목표 거리 제한 없음 - ShapeDistance와 LengthPenalty로 최적 경로 선택
         
+        첫 후보를 찾은 뒤에는 최종 비용의 하한(누적 도형 거리, 목표 초과 길이,
+        허용 초과 신호등은 줄어들지 않음)이 최선 비용 이상인 상태를 큐에 넣지 않는다.
+        이 가지치기는 결과를 바꾸지 않는다.
+        
         Args:
             start_node_id: 시작 노드 ID
             max_iterations: 최대 반복 횟수
+            beam_width: 우선순위 큐 최대 크기 (None이면 제한 없음).
+                큐가 2배를 넘으면 f_cost 상위 beam_width개만 남김 (최적성 대신 속도)
             
         Returns:
             최적 경로 후보 (없으면 None)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         start_node = self.graph.get_node(start_node_id)
         if not start_node:
             logger.warning(f"시작 노드 {start_node_id}를 찾을 수 없음")
@@ -117,20 +175,71 @@ class AStarPathFinder:
             logger.warning("시작 노드에 연결된 이웃이 없음")
             return None
         
-        # 우선순위 큐: (f_cost, node_id, path, g_cost, path_length, traffic_lights)
-        open_set: List[PriorityItem] = []
-        heapq.heappush(open_set, PriorityItem(
-            priority=0.0,
-            node_id=start_node_id,
-            path=[start_node_id],
-            g_cost=0.0,
-            path_length_km=0.0,
-            traffic_light_count=0
-        ))
-        
-        # 방문 기록: (node_id, path_length_bucket) -> best_cost
+        # 목표(시작점)가 바뀌었을 수 있으므로 목표 거리 캐시 초기화
+        self._goal_dist_cache.clear()
+        
+        # CSR 배열 (노드 인덱스 기준 연속 리스트)
+        csr = self._sync_csr()
+        start_idx = csr.index_of[start_node_id]
+        indptr = self._indptr
+        nbr_idx = self._nbr_idx
+        edge_len = self._edge_len
+        edge_light = self._edge_light
+        nodes = self._nodes_by_idx
+        slot_terms = self._slot_terms
+        
+        # 부모 포인터 테이블: entry_id -> (node_idx, parent_entry_id)
+        came_from: List[Tuple[int, int]] = [(start_idx, -1)]
+        
+        open_set: List[QueueItem] = [
+            (0.0, 0, start_idx, 1, 0.0, 0.0, 0, 0.0, frozenset())
+        ]
+        
+        # 내부 루프에서 반복되는 속성 조회를 지역 변수로 고정
+        finalize = self.cost_calculator.finalize
+        push = heapq.heappush
+        pop = heapq.heappop
+        
+        # 가중치/목표 거리 상수 (휴리스틱과 최종 비용 하한에서 공유)
+        w_shape, w_length, w_crossing = self.weights
+        target_km = self.target_distance_km
+        inv_target = 1.0 / target_km
+        
+        # 휴리스틱: 목표 곡선까지 거리 + |남은 거리 - 시작점까지 직선 거리|
+        # 가중치/정규화 상수를 캡처한 지역 함수로 특수화 (속성 조회 생략)
+        # 0.5 스케일로 과대추정 방지 (admissible 유지)
+        curve_cache = self._curve_dist_cache
+        goal_cache = self._goal_dist_cache
+        compute_curve_dist = self._compute_min_distance_to_curve
+        start_lat, start_lng = start_node.lat, start_node.lng
+        h_shape = 0.5 * w_shape * inv_target * self._curve_dist_scale
+        h_length = 0.5 * w_length * inv_target
+        
+        def heuristic(node: Node, current_length: float) -> float:
+            node_id = node.id
+            curve_dist = curve_cache.get(node_id)
+            if curve_dist is None:
+                curve_dist = curve_cache[node_id] = compute_curve_dist(node)
+            dist_to_goal = goal_cache.get(node_id)
+            if dist_to_goal is None:
+                dist_to_goal = goal_cache[node_id] = haversine(
+                    node.lat, node.lng, start_lat, start_lng
+                )
+            remaining = target_km - current_length
+            if remaining < 0.0:
+                remaining = 0.0
+            return h_shape * curve_dist + h_length * abs(remaining - dist_to_goal)
+        max_crossings = self.max_crossings
+        crossing_unit = w_crossing / (max_crossings + 1)
+        light_allowance = max_crossings + start_node.has_traffic_light
+        beam_limit = 2 * beam_width if beam_width else 0
+        
+        # 방문 기록: (node_idx, path_length_bucket) -> best_cost
         # 버킷 크기를 500m로 늘려서 더 많은 경로 탐색 허용
-        visited: Dict[Tuple[int, int], float] = {}
+        # 키는 (node_idx << 20) | length_bucket 으로 패킹한 정수 (튜플 생성/해시 생략)
+        visited: Dict[int, float] = {}
+        visited_get = visited.get
+        INF = float('inf')
         
         best_candidate: Optional[PathCandidate] = None
         best_cost = float('inf')
@@ -138,32 +247,34 @@ class AStarPathFinder:
         
         iterations = 0
         max_path_length = 0.0
+        pruned = 0
         
         while open_set and iterations < max_iterations:
             iterations += 1
             
-            current = heapq.heappop(open_set)
-            current_node_id = current.node_id
-            current_path = current.path
-            current_g = current.g_cost
-            current_length = current.path_length_km
-            current_lights = current.traffic_light_count
+            (_, current_entry, current_idx, current_depth,
+             current_g, current_length, current_lights, current_shape,
+             prev_nodes) = pop(open_set)
             
             max_path_length = max(max_path_length, current_length)
             
             # 시작점으로 돌아온 순환 경로 발견 (최소 4개 노드 필요)
-            if (current_node_id == start_node_id and 
-                len(current_path) > 3):
+            if (current_idx == start_idx and 
+                current_depth > 3):
                 
                 candidates_found += 1
                 
-                # 비용 계산 (ShapeDistance + LengthPenalty + CrossingPenalty)
-                cost_result = self.cost_calculator.calculate(current_path, self.graph)
+                # 누적 값으로 비용 계산 (ShapeDistance + LengthPenalty + CrossingPenalty)
+                # 신호등은 끝점(=시작점)을 제외하여 calculate()와 동일하게 맞춤
+                cost_result = finalize(
+                    current_shape, current_length,
+                    current_lights - start_node.has_traffic_light
+                )
                 
                 if cost_result.total_cost < best_cost:
                     best_cost = cost_result.total_cost
                     best_candidate = PathCandidate(
-                        path=current_path.copy(),
+                        path=self._reconstruct_node_ids(came_from, current_entry),
                         g_cost=current_g,
                         f_cost=cost_result.total_cost,
                         shape_distance=cost_result.shape_distance,
@@ -176,58 +287,63 @@ class AStarPathFinder:
             
             # 방문 체크 (거리 버킷 기준) - 500m 단위로 완화
             length_bucket = int(current_length * 2)  # 500m 단위 버킷
-            visit_key = (current_node_id, length_bucket)
+            visit_key = (current_idx << 20) | length_bucket
             
-            if visit_key in visited and visited[visit_key] <= current_g:
+            if visited_get(visit_key, INF) <= current_g:
                 continue
             visited[visit_key] = current_g
+            path_nodes = prev_nodes | {current_idx}
             
-            # 이웃 노드 탐색
-            current_node = self.graph.get_node(current_node_id)
-            if not current_node:
-                continue
-            
-            for neighbor_id in self.graph.get_neighbors(current_node_id):
+            # 이웃 노드 탐색: 현재 노드의 CSR 슬롯 구간을 순회
+            for slot in range(indptr[current_idx], indptr[current_idx + 1]):
+                neighbor_idx = nbr_idx[slot]
+                
                 # 시작점은 항상 허용 (순환 경로 완성을 위해)
                 # 다른 노드는 경로에 없어야 함 (단순 경로 유지)
-                if neighbor_id != start_node_id and neighbor_id in current_path:
+                if neighbor_idx != start_idx and neighbor_idx in path_nodes:
                     continue
                 
-                neighbor_node = self.graph.get_node(neighbor_id)
-                if not neighbor_node:
-                    continue
+                # 엣지 비용 조회 (_sync_csr에서 모든 슬롯을 미리 계산해 둔 테이블)
+                terms = slot_terms[slot]
+                edge_cost, shape_dist = terms
                 
-                edge = self.graph.get_edge_between(current_node_id, neighbor_id)
-                if not edge:
-                    continue
+                new_length = current_length + edge_len[slot]
+                new_shape = current_shape + shape_dist
                 
-                # 새 경로 생성
-                new_path = current_path + [neighbor_id]
-                new_length = current_length + edge.length_km
+                # 신호등 카운트 (끝점 보정은 경로 완성 시 수행)
+                new_lights = current_lights + edge_light[slot]
                 
-                # 신호등 카운트
-                new_lights = current_lights
-                if neighbor_node.has_traffic_light and neighbor_id != start_node_id:
-                    new_lights += 1
+                # 하한 가지치기: 도형 거리/길이/신호등은 누적만 되므로
+                # 이 상태에서 완성되는 어떤 경로도 최선 비용보다 나을 수 없으면 제외
+                if best_cost < INF:
+                    lower_bound = w_shape * new_shape * inv_target
+                    if new_length > target_km:
+                        lower_bound += w_length * (new_length - target_km) * inv_target
+                    if new_lights > light_allowance:
+                        lower_bound += crossing_unit * (new_lights - light_allowance)
+                    if lower_bound >= best_cost:
+                        pruned += 1
+                        continue
                 
-                # 엣지 비용 계산
-                edge_cost = self.cost_calculator.calculate_edge_cost(
-                    current_node, neighbor_node, edge, self.graph
-                )
+                # 엣지 비용 및 도형 거리 누적
                 new_g = current_g + edge_cost
                 
                 # 휴리스틱 계산
-                h_cost = self._heuristic(neighbor_node, start_node, new_length)
+                h_cost = heuristic(nodes[neighbor_idx], new_length)
                 f_cost = new_g + h_cost
                 
-                heapq.heappush(open_set, PriorityItem(
-                    priority=f_cost,
-                    node_id=neighbor_id,
-                    path=new_path,
-                    g_cost=new_g,
-                    path_length_km=new_length,
-                    traffic_light_count=new_lights
+                # 새 경로는 부모 포인터로만 기록
+                came_from.append((neighbor_idx, current_entry))
+                
+                push(open_set, (
+                    f_cost, len(came_from) - 1, neighbor_idx, current_depth + 1,
+                    new_g, new_length, new_lights, new_shape,
+                    path_nodes
                 ))
+            
+            # 빔 폭 제한: 큐가 커지면 f_cost 상위 항목만 유지 (정렬된 리스트는 유효한 힙)
+            if beam_limit and len(open_set) > beam_limit:
+                open_set = heapq.nsmallest(beam_width, open_set)
         
         # 탐색 결과 로깅
         if iterations >= max_iterations:
@@ -235,7 +351,10 @@ class AStarPathFinder:
         else:
             logger.info(f"탐색 공간 소진: {iterations}회 반복, 후보 {candidates_found}개 발견")
         
-        logger.info(f"최대 탐색 거리: {max_path_length:.2f}km, 방문 상태: {len(visited)}개")
+        logger.info(
+            f"최대 탐색 거리: {max_path_length:.2f}km, 방문 상태: {len(visited)}개, "
+            f"하한 가지치기: {pruned}개"
+        )
         
         return best_candidate
     
@@ -262,34 +381,49 @@ class AStarPathFinder:
         if not start_node or not goal_node:
             return None
         
-        open_set: List[PriorityItem] = []
-        heapq.heappush(open_set, PriorityItem(
-            priority=0.0,
-            node_id=start_node_id,
-            path=[start_node_id],
-            g_cost=0.0,
-            path_length_km=0.0,
-            traffic_light_count=0
-        ))
+        self._goal_dist_cache.clear()
+        
+        csr = self._sync_csr()
+        start_idx = csr.index_of[start_node_id]
+        goal_idx = csr.index_of[goal_node_id]
+        indptr = self._indptr
+        nbr_idx = self._nbr_idx
+        edge_len = self._edge_len
+        edge_light = self._edge_light
+        nodes = self._nodes_by_idx
+        slot_terms = self._slot_terms
+        
+        came_from: List[Tuple[int, int]] = [(start_idx, -1)]
+        
+        open_set: List[QueueItem] = [
+            (0.0, 0, start_idx, 1, 0.0, 0.0, 0, 0.0, frozenset())
+        ]
+        
+        finalize = self.cost_calculator.finalize
+        heuristic = self._simple_heuristic
+        push = heapq.heappush
+        pop = heapq.heappop
         
         visited: Dict[int, float] = {}
+        visited_get = visited.get
+        INF = float('inf')
         
         iterations = 0
         while open_set and iterations < max_iterations:
             iterations += 1
             
-            current = heapq.heappop(open_set)
-            current_node_id = current.node_id
-            current_path = current.path
-            current_g = current.g_cost
-            current_length = current.path_length_km
-            current_lights = current.traffic_light_count
+            (_, current_entry, current_idx, current_depth,
+             current_g, current_length, current_lights, current_shape,
+             prev_nodes) = pop(open_set)
             
             # 목표 도달
-            if current_node_id == goal_node_id:
-                cost_result = self.cost_calculator.calculate(current_path, self.graph)
+            if current_idx == goal_idx:
+                cost_result = finalize(
+                    current_shape, current_length,
+                    current_lights - goal_node.has_traffic_light
+                )
                 return PathCandidate(
-                    path=current_path.copy(),
+                    path=self._reconstruct_node_ids(came_from, current_entry),
                     g_cost=current_g,
                     f_cost=cost_result.total_cost,
                     shape_distance=cost_result.shape_distance,
@@ -300,139 +434,292 @@ class AStarPathFinder:
                 )
             
             # 방문 체크
-            if current_node_id in visited and visited[current_node_id] <= current_g:
-                continue
-            visited[current_node_id] = current_g
-            
-            current_node = self.graph.get_node(current_node_id)
-            if not current_node:
+            if visited_get(current_idx, INF) <= current_g:
                 continue
+            visited[current_idx] = current_g
+            path_nodes = prev_nodes | {current_idx}
             
-            for neighbor_id in self.graph.get_neighbors(current_node_id):
-                if neighbor_id in current_path:
+            for slot in range(indptr[current_idx], indptr[current_idx + 1]):
+                neighbor_idx = nbr_idx[slot]
+                if neighbor_idx in path_nodes:
                     continue
                 
-                neighbor_node = self.graph.get_node(neighbor_id)
-                if not neighbor_node:
-                    continue
-                
-                edge = self.graph.get_edge_between(current_node_id, neighbor_id)
-                if not edge:
-                    continue
+                edge_cost, shape_dist = slot_terms[slot]
                 
-                new_path = current_path + [neighbor_id]
-                new_length = current_length + edge.length_km
+                new_length = current_length + edge_len[slot]
                 
-                new_lights = current_lights
-                if neighbor_node.has_traffic_light:
-                    new_lights += 1
+                new_lights = current_lights + edge_light[slot]
                 
-                edge_cost = self.cost_calculator.calculate_edge_cost(
-                    current_node, neighbor_node, edge, self.graph
-                )
                 new_g = current_g + edge_cost
                 
-                h_cost = self._simple_heuristic(neighbor_node, goal_node)
+                h_cost = heuristic(nodes[neighbor_idx], goal_node)
                 f_cost = new_g + h_cost
                 
-                heapq.heappush(open_set, PriorityItem(
-                    priority=f_cost,
-                    node_id=neighbor_id,
-                    path=new_path,
-                    g_cost=new_g,
-                    path_length_km=new_length,
-                    traffic_light_count=new_lights
+                # 새 경로는 부모 포인터로만 기록
+                came_from.append((neighbor_idx, current_entry))
+                
+                push(open_set, (
+                    f_cost, len(came_from) - 1, neighbor_idx, current_depth + 1,
+                    new_g, new_length, new_lights, current_shape + shape_dist,
+                    path_nodes
                 ))
         
         return None
     
-    def _heuristic(
+    def find_path_to_goal_bidir(
         self,
-        current_node: Node,
-        goal_node: Node,
-        current_length: float
-    ) -> float:
+        start_node_id: int,
+        goal_node_id: int,
+        max_iterations: int = 10000
+    ) -> Optional[PathCandidate]:
         """
-        휴리스틱 함수: 목표까지의 추정 비용
+        양방향 A*로 시작점에서 목표점까지 경로 탐색
+        
+        시작점(정방향)과 목표점(역방향)에서 동시에 탐색하여 중간에서 만나면 종료.
+        두 방향이 일관되도록 평균 포텐셜 p(v) = (h_goal(v) - h_start(v)) / 2 를
+        정방향에는 +p, 역방향에는 -p로 사용하고, 매 반복마다 더 작은 프론티어를 확장.
+        두 프론티어 최소 키의 합이 최선 연결 비용 이상이 되면 더 좋은 경로가 없으므로 중단
         
         Args:
-            current_node: 현재 노드
-            goal_node: 목표 노드 (시작점)
-            current_length: 현재까지의 경로 길이
+            start_node_id: 시작 노드 ID
+            goal_node_id: 목표 노드 ID
+            max_iterations: 최대 반복 횟수 (양방향 확장 합계)
             
         Returns:
-            추정 비용
+            최적 경로 후보 (없으면 None)
         """
-        # 목표점까지의 직선 거리
-        dist_to_goal = current_node.distance_to(goal_node)
-        
-        # 남은 거리 추정
-        remaining_distance = max(0, self.target_distance_km - current_length)
-        
-        # 목표 곡선까지의 거리 추정
-        min_curve_dist = self._min_distance_to_curve(current_node)
+        get_node = self.graph.get_node
+        start_node = get_node(start_node_id)
+        goal_node = get_node(goal_node_id)
         
-        # 가중치 적용 휴리스틱
-        h = (
-            self.weights[0] * (min_curve_dist / self.target_distance_km) +
-            self.weights[1] * (abs(remaining_distance - dist_to_goal) / self.target_distance_km)
+        if not start_node or not goal_node:
+            return None
+        if start_node_id == goal_node_id:
+            return self.find_path_to_goal(start_node_id, goal_node_id, max_iterations)
+        
+        self._goal_dist_cache.clear()
+        
+        csr = self._sync_csr()
+        start_idx = csr.index_of[start_node_id]
+        goal_idx = csr.index_of[goal_node_id]
+        nodes = self._nodes_by_idx
+        slot_terms = self._slot_terms
+        src_idx = self._src_idx
+        
+        push = heapq.heappush
+        pop = heapq.heappop
+        counter = itertools.count(1)
+        INF = float('inf')
+        h_scale = self.weights[1] / self.target_distance_km
+        
+        def potential(node: Node) -> float:
+            """정방향 평균 포텐셜 (역방향은 부호 반전)"""
+            to_goal = haversine(node.lat, node.lng, goal_node.lat, goal_node.lng)
+            to_start = haversine(node.lat, node.lng, start_node.lat, start_node.lng)
+            return 0.5 * (to_goal - to_start) * h_scale
+        
+        # 방향별 상태: (open_set, g_score, parent, 슬롯 구간, 슬롯 순서, 반대편 끝 노드, 포텐셜 부호)
+        # 정방향은 출발 노드별 슬롯, 역방향은 도착 노드별 슬롯(rev_slot)을 순회
+        # open_set 아이템: (key, counter, node_idx, g_cost)
+        forward = (
+            [(potential(start_node), 0, start_idx, 0.0)],
+            {start_idx: 0.0}, {start_idx: -1},
+            self._indptr, self._slot_order, self._nbr_idx, 1.0
+        )
+        backward = (
+            [(-potential(goal_node), 0, goal_idx, 0.0)],
+            {goal_idx: 0.0}, {goal_idx: -1},
+            self._rev_indptr, self._rev_slot, src_idx, -1.0
         )
         
-        return h * 0.5  # 휴리스틱 스케일 조정 (admissible 유지)
-    
-    def _simple_heuristic(self, current_node: Node, goal_node: Node) -> float:
-        """단순 휴리스틱: 직선 거리 기반"""
-        dist = current_node.distance_to(goal_node)
-        return dist / self.target_distance_km * self.weights[1]
-    
-    def _min_distance_to_curve(self, node: Node) -> float:
-        """노드에서 목표 곡선까지의 최소 거리"""
-        min_dist = float('inf')
+        best_total = INF
+        meeting_idx: Optional[int] = None
         
-        for i in range(len(self.target_curve) - 1):
-            p1 = self.target_curve[i]
-            p2 = self.target_curve[i + 1]
+        iterations = 0
+        while forward[0] and backward[0] and iterations < max_iterations:
+            # 종료 조건: 두 프론티어 최소 키의 합이 최선 연결 비용 이상이면 더 나은 경로 없음
+            if forward[0][0][0] + backward[0][0][0] >= best_total:
+                break
             
-            dist = self._point_to_segment_distance(
-                node.lat, node.lng,
-                p1.lat, p1.lng,
-                p2.lat, p2.lng
-            )
-            min_dist = min(min_dist, dist)
-        
-        return min_dist
-    
-    def _point_to_segment_distance(
-        self,
-        px: float, py: float,
-        x1: float, y1: float,
-        x2: float, y2: float
-    ) -> float:
-        """점에서 선분까지의 거리 (km)"""
-        dx = x2 - x1
-        dy = y2 - y1
+            iterations += 1
+            
+            # 더 작은 프론티어를 확장
+            if len(forward[0]) <= len(backward[0]):
+                this, other = forward, backward
+            else:
+                this, other = backward, forward
+            open_set, g_score, parent, ptr, slot_order, far_end, sign = this
+            other_g = other[1]
+            
+            _, _, node_idx, g = pop(open_set)
+            if g > g_score[node_idx]:
+                continue  # 더 좋은 값으로 갱신된 오래된 항목
+            
+            # 역방향은 neighbor → node 슬롯을 거꾸로 따라감 (비용은 정방향 기준)
+            for slot in slot_order[ptr[node_idx]:ptr[node_idx + 1]]:
+                neighbor_idx = far_end[slot]
+                terms = slot_terms[slot]
+                
+                new_g = g + terms[0]
+                if new_g >= g_score.get(neighbor_idx, INF):
+                    continue
+                
+                g_score[neighbor_idx] = new_g
+                parent[neighbor_idx] = node_idx
+                push(open_set, (
+                    new_g + sign * potential(nodes[neighbor_idx]),
+                    next(counter), neighbor_idx, new_g
+                ))
+                
+                # 반대 방향에서 이미 도달한 노드면 연결 후보 갱신
+                joined = new_g + other_g.get(neighbor_idx, INF)
+                if joined < best_total:
+                    best_total = joined
+                    meeting_idx = neighbor_idx
         
-        if dx == 0 and dy == 0:
-            return self._haversine(px, py, x1, y1)
+        if meeting_idx is None:
+            return None
         
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
+        # 정방향 경로(시작점→만남점) + 역방향 경로(만남점→목표점) 연결
+        path_idx = []
+        node_idx = meeting_idx
+        while node_idx != -1:
+            path_idx.append(node_idx)
+            node_idx = forward[2][node_idx]
+        path_idx.reverse()
+        node_idx = backward[2][meeting_idx]
+        while node_idx != -1:
+            path_idx.append(node_idx)
+            node_idx = backward[2][node_idx]
+        
+        path = [nodes[idx].id for idx in path_idx]
+        path = self._remove_loops(path)
+        cost_result = self.cost_calculator.calculate(path, self.graph)
+        
+        return PathCandidate(
+            path=path,
+            g_cost=best_total,
+            f_cost=cost_result.total_cost,
+            shape_distance=cost_result.shape_distance,
+            length_penalty=cost_result.length_penalty,
+            crossing_penalty=cost_result.crossing_penalty,
+            path_length_km=cost_result.path_length_km,
+            traffic_light_count=cost_result.traffic_light_count
+        )
+    
+    def _sync_csr(self) -> CSRAdjacency:
+        """
+        그래프의 CSR 구조를 가져오고, 바뀌었으면 내부 루프용 리스트와 슬롯 테이블 재구성
         
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
+        numpy 배열 원소를 파이썬 루프에서 하나씩 읽으면 박싱 비용이 크므로
+        스냅샷마다 한 번 tolist()로 변환해 둔다.
         
-        return self._haversine(px, py, proj_x, proj_y)
+        Returns:
+            CSR 인접 구조
+        """
+        csr = self.graph.build_csr()
+        if csr is not self._csr:
+            self._csr = csr
+            self._indptr = csr.indptr.tolist()
+            self._nbr_idx = csr.nbr_idx.tolist()
+            self._edge_len = csr.edge_len.tolist()
+            self._edge_light = csr.edge_light.tolist()
+            self._src_idx = csr.src_idx.tolist()
+            self._slot_order = list(range(csr.slot_count))
+            self._rev_indptr = csr.rev_indptr.tolist()
+            self._rev_slot = csr.rev_slot.tolist()
+            self._nodes_by_idx = [self.graph.nodes[node_id] for node_id in csr.node_ids.tolist()]
+            edge_cost, shape_dist = self.cost_calculator.precompute_edge_costs(self.graph)
+            self._slot_terms = list(zip(edge_cost.tolist(), shape_dist.tolist()))
+            self._curve_dist_scale = self._equirect_error_scale(csr.node_lat)
+        return csr
     
-    def _haversine(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """두 좌표 사이의 거리 (km)"""
-        R = 6371
+    def _equirect_error_scale(self, node_lat: np.ndarray) -> float:
+        """
+        등장방형 곡선 거리가 Haversine 거리를 넘지 않도록 하는 축소 배율
         
-        lat1_r, lng1_r = math.radians(lat1), math.radians(lng1)
-        lat2_r, lng2_r = math.radians(lat2), math.radians(lng2)
+        경도 차는 곡선 평균 위도의 코사인으로 줄이므로, 두 점 사이 실제 코사인이 그보다 작은
+        (더 고위도) 구간에서는 근사 거리가 최대 cos(평균 위도) / cos(최고 위도)배까지 길어진다.
+        그래프와 곡선의 위도 범위에서 가장 작은 코사인으로 그 비율을 되돌리고,
+        같은 위도에서도 평행선 거리가 대원 거리보다 조금 긴 만큼 (수백 km 이내에서 1e-4 미만) 여유를 더 둔다.
         
-        dlat = lat2_r - lat1_r
-        dlng = lng2_r - lng1_r
+        Args:
+            node_lat: 그래프 노드 위도 배열 (도)
+            
+        Returns:
+            (0, 1] 배율
+        """
+        cos_mean = self._cos_mean_lat
+        if node_lat.size == 0 or cos_mean <= 0.0:
+            return 1.0
+        max_abs_lat = max(float(np.abs(node_lat).max()), float(np.abs(self._curve_lat).max(initial=0.0)))
+        cos_min = math.cos(min(max_abs_lat, 90.0) * DEG2RAD)
+        return min(1.0, cos_min / cos_mean) * (1.0 - 1e-4)
+    
+    def _reconstruct_node_ids(self, came_from: List[Tuple[int, int]], entry_id: int) -> List[int]:
+        """CSR 인덱스로 기록된 부모 포인터를 따라 경로를 복원하고 노드 ID로 변환"""
+        nodes = self._nodes_by_idx
+        return [nodes[idx].id for idx in self._reconstruct_path(came_from, entry_id)]
+    
+    @staticmethod
+    def _remove_loops(path: List[int]) -> List[int]:
+        """
+        경로 내 중복 방문 구간 제거 (단순 경로로 축약)
         
-        a = math.sin(dlat/2)**2 + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlng/2)**2
-        c = 2 * math.asin(math.sqrt(a))
+        양방향 탐색의 두 탐색 트리가 같은 노드를 지날 수 있으므로,
+        노드가 다시 나타나면 그 사이의 순환 구간을 잘라냄
+        """
+        result: List[int] = []
+        position: Dict[int, int] = {}
+        for node_id in path:
+            if node_id in position:
+                cut = position[node_id] + 1
+                for removed in result[cut:]:
+                    del position[removed]
+                del result[cut:]
+            else:
+                position[node_id] = len(result)
+                result.append(node_id)
+        return result
+    
+    @staticmethod
+    def _reconstruct_path(came_from: List[Tuple[int, int]], entry_id: int) -> List[int]:
+        """
+        부모 포인터를 따라 경로 복원
         
-        return R * c
+        Args:
+            came_from: entry_id -> (node_id, parent_entry_id) 테이블
+            entry_id: 마지막 노드의 entry_id
+            
+        Returns:
+            시작 노드부터의 노드 ID 목록
+        """
+        path = []
+        while entry_id >= 0:
+            node_id, entry_id = came_from[entry_id]
+            path.append(node_id)
+        path.reverse()
+        return path
+    
+    def _simple_heuristic(self, current_node: Node, goal_node: Node) -> float:
+        """단순 휴리스틱: 직선 거리 기반"""
+        dist = self._distance_to_goal(current_node, goal_node)
+        return dist / self.target_distance_km * self.weights[1]
+    
+    def _distance_to_goal(self, node: Node, goal_node: Node) -> float:
+        """목표 노드까지의 직선 거리 (노드 ID 기준 캐시)"""
+        dist = self._goal_dist_cache.get(node.id)
+        if dist is None:
+            dist = haversine(node.lat, node.lng, goal_node.lat, goal_node.lng)
+            self._goal_dist_cache[node.id] = dist
+        return dist
+    
+    def _compute_min_distance_to_curve(self, node: Node) -> float:
+        """노드에서 목표 곡선까지의 최소 거리 (모든 선분을 한 번에 계산)"""
+        if self._curve_segments is None:
+            return _min_distance_to_curve_loop(
+                node.lat, node.lng, self._curve_lat, self._curve_lng, self._cos_mean_lat
+            )
+        return _min_distance_to_curve_vec(
+            node.lat, node.lng, *self._curve_segments, self._cos_mean_lat
+        )
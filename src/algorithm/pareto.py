@@ -3,11 +3,279 @@ Pareto 최적화
 다목적 최적화를 위한 Pareto dominance 및 필터링
 """
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Callable, List, Tuple, Optional
 
+import numpy as np
+
+from src._jit import HAS_NUMBA
+from src.algorithm import _pareto_nb
 from src.algorithm.astar import PathCandidate
 
 
+def dominates3(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> bool:
+    """
+    3목적 지배 판정 (a가 b를 지배하면 True)
+    
+    목적 함수 개수가 3으로 고정된 경우의 특수화: zip/길이 검사 없이 언패킹 후 비교
+    """
+    a0, a1, a2 = a
+    b0, b1, b2 = b
+    return (a0 <= b0 and a1 <= b1 and a2 <= b2 and
+            (a0 < b0 or a1 < b1 or a2 < b2))
+
+
+@lru_cache(maxsize=None)
+def _dominates_for(d: int) -> Callable[[Tuple[float, ...], Tuple[float, ...]], bool]:
+    """
+    목적 함수 개수 d에 특수화된 지배 판정 함수 (차원별로 한 번 생성 후 재사용)
+    
+    dominates3와 같은 형태로 비교식을 펼친 소스를 생성하여 컴파일하므로
+    파이썬 수준의 zip/루프 없이 비교만 수행한다. d=3이면 dominates3를 그대로 반환.
+    
+    Args:
+        d: 목적 함수 개수
+        
+    Returns:
+        (a, b) -> a가 b를 지배하면 True
+    """
+    if d == 3:
+        return dominates3
+    if d == 0:
+        return lambda a, b: False
+    
+    a_names = ", ".join(f"a{i}" for i in range(d))
+    b_names = ", ".join(f"b{i}" for i in range(d))
+    all_leq = " and ".join(f"a{i} <= b{i}" for i in range(d))
+    any_lt = " or ".join(f"a{i} < b{i}" for i in range(d))
+    source = (
+        f"def dominates{d}(a, b):\n"
+        f"    {a_names}, = a\n"
+        f"    {b_names}, = b\n"
+        f"    return {all_leq} and ({any_lt})\n"
+    )
+    
+    namespace: dict = {}
+    exec(compile(source, f"<dominates{d}>", "exec"), namespace)
+    return namespace[f"dominates{d}"]
+
+
+def _pareto_front_mask(A: np.ndarray) -> np.ndarray:
+    """
+    목적 함수 행렬에서 non-dominated 행 마스크 계산 (최소화 기준)
+    
+    값이 일정한 목적 함수는 지배 관계에 영향이 없으므로 제외하고,
+    남은 목적 함수가 2개 이하면 정렬 기반 2D 경로, 아니면 Kung 방식 스윕 사용.
+    동일한 목적 함수 값을 가진 행은 서로 지배하지 않으므로 함께 남는다.
+    
+    Args:
+        A: (n, d) 목적 함수 행렬
+        
+    Returns:
+        (n,) bool 마스크 (True = non-dominated)
+    """
+    n = A.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    
+    varying = np.flatnonzero((A != A[0]).any(axis=0))
+    if len(varying) <= 2:
+        A2 = np.zeros((n, 2), dtype=np.float64)
+        A2[:, :len(varying)] = A[:, varying]
+        return _is_pareto_front_2d(A2)
+    
+    return _is_pareto_front_nd(A[:, varying])
+
+
+def _is_pareto_front_2d(A: np.ndarray) -> np.ndarray:
+    """
+    2D Pareto front 마스크 (정렬 + 누적 최소값, O(n log n))
+    
+    첫 번째 값 오름차순(동률이면 두 번째 값 오름차순)으로 정렬하면,
+    어떤 점을 지배할 수 있는 점은 모두 그 앞에 온다.
+    - 첫 번째 값이 더 작은 점들의 두 번째 값 최소가 자신보다 작거나 같으면 지배됨
+    - 첫 번째 값이 같은 점들 중 두 번째 값이 자신보다 작은 점이 있으면 지배됨
+    """
+    order = np.lexsort((A[:, 1], A[:, 0]))
+    x = A[order, 0]
+    y = A[order, 1]
+    
+    cummin = np.minimum.accumulate(y)
+    group_start = np.searchsorted(x, x, side='left')
+    
+    # 첫 번째 값이 더 작은 점들의 두 번째 값 최소 (없으면 inf)
+    prev_min = np.full(len(x), np.inf)
+    has_prev = group_start > 0
+    prev_min[has_prev] = cummin[group_start[has_prev] - 1]
+    
+    front_sorted = (y < prev_min) & (y == y[group_start])
+    
+    mask = np.empty(len(x), dtype=bool)
+    mask[order] = front_sorted
+    return mask
+
+
+def _is_pareto_front_nd(A: np.ndarray) -> np.ndarray:
+    """
+    N차원 Pareto front 마스크 (사전순 정렬 후 Kung 방식 스윕)
+    
+    남은 행 중 사전순 최소 행은 지배되지 않으므로 front에 넣고,
+    그 행이 지배하는 행을 한 번의 벡터 비교로 제거하는 과정을 반복.
+    n x n 지배 행렬을 만들지 않아 후보가 많아도 메모리 사용이 작다.
+    """
+    order = np.lexsort(A.T[::-1])
+    rest = A[order]
+    rest_idx = order
+    front = []
+    
+    while len(rest_idx):
+        head = rest[0]
+        front.append(rest_idx[0])
+        dominated = np.all(rest >= head, axis=1) & np.any(rest > head, axis=1)
+        dominated[0] = True
+        keep = ~dominated
+        rest = rest[keep]
+        rest_idx = rest_idx[keep]
+    
+    mask = np.zeros(A.shape[0], dtype=bool)
+    mask[front] = True
+    return mask
+
+
+def _dominance_matrix(A: np.ndarray) -> np.ndarray:
+    """
+    지배 행렬 계산: D[i, j] = i가 j를 지배 (모든 값 <= 이고 하나 이상 <)
+    
+    Args:
+        A: (n, d) 목적 함수 행렬
+        
+    Returns:
+        (n, n) bool 행렬
+    """
+    n = A.shape[0]
+    
+    # (n, n, d) 임시 배열 대신 목적 함수별로 (n, n) 행렬에 누적
+    leq = np.ones((n, n), dtype=bool)
+    lt_any = np.zeros((n, n), dtype=bool)
+    tmp = np.empty((n, n), dtype=bool)
+    for m in range(A.shape[1]):
+        col = A[:, m]
+        np.less_equal(col[:, None], col[None, :], out=tmp)
+        leq &= tmp
+        np.less(col[:, None], col[None, :], out=tmp)
+        lt_any |= tmp
+    
+    leq &= lt_any
+    return leq
+
+
+def _pareto_ranks(A: np.ndarray) -> np.ndarray:
+    """
+    빠른 비지배 정렬 (NSGA-II): 각 행의 Pareto 순위 계산
+    
+    지배 행렬을 한 번 만들고, 지배당한 횟수가 0인 행들을 현재 순위로 떼어낸 뒤
+    그 행들이 지배하던 행의 횟수를 빼는 과정을 반복.
+    numba가 있으면 JIT 커널(_pareto_nb.fast_nds) 사용.
+    
+    Args:
+        A: (n, d) 목적 함수 행렬
+        
+    Returns:
+        (n,) 순위 배열 (0이 최상위)
+    """
+    n = A.shape[0]
+    ranks = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return ranks
+    
+    if HAS_NUMBA:
+        return _pareto_nb.fast_nds(np.ascontiguousarray(A, dtype=np.float64))
+    
+    D = _dominance_matrix(A)
+    counts = D.sum(axis=0).astype(np.int64)
+    
+    # 아직 순위가 없는 행 (순위를 받으면 제자리에서 False로 전환)
+    alive = np.ones(n, dtype=bool)
+    
+    rank = 0
+    front = np.flatnonzero(counts == 0)
+    while len(front):
+        ranks[front] = rank
+        alive[front] = False
+        counts -= D[front].sum(axis=0)
+        front = np.flatnonzero(alive & (counts == 0))
+        rank += 1
+    
+    return ranks
+
+
+def _crowding_distance(A: np.ndarray) -> np.ndarray:
+    """
+    목적 함수 행렬의 혼잡 거리 계산
+    
+    목적 함수별로 정렬한 뒤 양 옆 이웃 간 간격(범위로 정규화)을 합산.
+    각 목적 함수의 양 끝 후보는 무한대.
+    numba가 있으면 JIT 커널(_pareto_nb.crowding) 사용.
+    
+    Args:
+        A: (n, d) 목적 함수 행렬
+        
+    Returns:
+        (n,) 혼잡 거리 배열
+    """
+    n = A.shape[0]
+    if n <= 2:
+        return np.full(n, np.inf)
+    
+    if HAS_NUMBA:
+        return _pareto_nb.crowding(np.ascontiguousarray(A, dtype=np.float64))
+    
+    dist = np.zeros(n)
+    for m in range(A.shape[1]):
+        column = A[:, m]
+        order = np.argsort(column, kind='stable')
+        dist[order[0]] = np.inf
+        dist[order[-1]] = np.inf
+        
+        obj_range = column[order[-1]] - column[order[0]]
+        if obj_range == 0:
+            continue
+        
+        # 정렬 순서에서 각 후보는 한 번씩만 나오므로 인덱스 덧셈으로 충분
+        dist[order[1:-1]] += (column[order[2:]] - column[order[:-2]]) / obj_range
+    
+    return dist
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 내림차순 상위 k개 인덱스 (전체 정렬 없이 부분 선택)
+    
+    argpartition으로 k번째 점수를 구한 뒤, 그보다 큰 항목과
+    같은 점수 중 앞쪽 항목으로 k개를 채운다. 결과 순서는 점수 내림차순,
+    동률은 원래 순서로 안정 정렬과 동일.
+    
+    Args:
+        scores: (n,) 점수 배열
+        k: 선택할 개수
+        
+    Returns:
+        (min(k, n),) 인덱스 배열
+    """
+    n = scores.shape[0]
+    if k >= n:
+        return np.argsort(-scores, kind='stable')
+    
+    neg = -scores
+    threshold = np.partition(neg, k - 1)[k - 1]
+    better = np.flatnonzero(neg < threshold)
+    tied = np.flatnonzero(neg == threshold)[:k - better.size]
+    selected = np.concatenate([better, tied])
+    
+    # 선택된 k개만 정렬 (동률은 인덱스 순)
+    return selected[np.lexsort((selected, neg[selected]))]
+
+
 @dataclass
 class ParetoCandidate:
     """
@@ -37,6 +305,70 @@ class ParetoCandidate:
         )
 
 
+@dataclass
+class ParetoBatch:
+    """
+    Pareto 후보 묶음 (후보별 객체 대신 병렬 배열로 보관)
+    
+    filter/crowding/rank 단계가 같은 (n, 3) 행렬을 공유하도록 호출당 한 번만 생성하고,
+    ParetoCandidate는 외부로 반환할 때만 만든다.
+    
+    Attributes:
+        path_candidates: 원본 경로 후보 목록
+        objectives: (n, 3) 목적 함수 행렬 (shape_distance, length_penalty, crossing_penalty)
+        ranks: (n,) Pareto 순위 (0이 최상위)
+        crowding: (n,) 혼잡 거리
+    """
+    path_candidates: List[PathCandidate]
+    objectives: np.ndarray
+    ranks: Optional[np.ndarray] = None
+    crowding: Optional[np.ndarray] = None
+    
+    def __post_init__(self):
+        n = len(self.path_candidates)
+        if self.ranks is None:
+            self.ranks = np.zeros(n, dtype=np.int64)
+        if self.crowding is None:
+            self.crowding = np.zeros(n)
+    
+    def __len__(self) -> int:
+        return len(self.path_candidates)
+    
+    @classmethod
+    def from_candidates(cls, candidates: List[PathCandidate]) -> 'ParetoBatch':
+        """PathCandidate 목록에서 목적 함수 행렬을 한 번에 생성"""
+        objectives = np.fromiter(
+            (v for c in candidates
+             for v in (c.shape_distance, c.length_penalty, c.crossing_penalty)),
+            dtype=np.float64, count=3 * len(candidates)
+        ).reshape(-1, 3)
+        return cls(path_candidates=list(candidates), objectives=objectives)
+    
+    def subset(self, idx: np.ndarray) -> 'ParetoBatch':
+        """인덱스 순서대로 일부 후보만 담은 묶음"""
+        return ParetoBatch(
+            path_candidates=[self.path_candidates[i] for i in idx.tolist()],
+            objectives=self.objectives[idx],
+            ranks=self.ranks[idx],
+            crowding=self.crowding[idx]
+        )
+    
+    def to_pareto_candidates(self) -> List[ParetoCandidate]:
+        """외부 API용 ParetoCandidate 목록으로 변환"""
+        return [
+            ParetoCandidate(
+                path_candidate=candidate,
+                objectives=tuple(objectives),
+                rank=rank,
+                crowding_distance=crowding
+            )
+            for candidate, objectives, rank, crowding in zip(
+                self.path_candidates, self.objectives.tolist(),
+                self.ranks.tolist(), self.crowding.tolist()
+            )
+        ]
+
+
 class ParetoFilter:
     """
     Pareto 필터
@@ -66,17 +398,8 @@ class ParetoFilter:
         if len(obj1) != len(obj2):
             raise ValueError("목적 함수 차원이 일치해야 합니다")
         
-        all_leq = True  # 모든 값이 작거나 같은지
-        any_lt = False  # 적어도 하나가 작은지
-        
-        for v1, v2 in zip(obj1, obj2):
-            if v1 > v2:
-                all_leq = False
-                break
-            if v1 < v2:
-                any_lt = True
-        
-        return all_leq and any_lt
+        # 모든 값이 작거나 같고, 적어도 하나가 작은지 (차원별 특수화 함수)
+        return _dominates_for(len(obj1))(obj1, obj2)
     
     def filter_non_dominated(
         self,
@@ -94,86 +417,61 @@ class ParetoFilter:
         if not candidates:
             return []
         
-        pareto_candidates = [
-            ParetoCandidate.from_path_candidate(c) for c in candidates
-        ]
+        batch = ParetoBatch.from_candidates(candidates)
+        return self._front_of(batch).to_pareto_candidates()
+    
+    @staticmethod
+    def _front_of(batch: 'ParetoBatch') -> 'ParetoBatch':
+        """
+        non-dominated 후보만 남긴 묶음 반환
         
-        non_dominated = []
+        여러 (회전, 가중치) 조합이 같은 경로를 찾는 경우가 많으므로, 중복 목적 함수
+        벡터를 하나로 합쳐 front를 계산한 뒤 원래 후보로 되돌린다.
+        동일한 벡터는 서로 지배하지 않으므로 중복 후보는 모두 함께 남거나 빠진다.
+        부동소수점 잡음은 소수 9자리 반올림으로 흡수한다.
+        """
+        A = batch.objectives
+        unique_rows, inverse = np.unique(A.round(decimals=9), axis=0, return_inverse=True)
+        front_mask = _pareto_front_mask(unique_rows)[inverse.reshape(-1)]
+        return batch.subset(np.flatnonzero(front_mask))
+    
+    @staticmethod
+    def _objectives_array(candidates: List[ParetoCandidate]) -> np.ndarray:
+        """
+        Pareto 후보의 목적 함수 값을 (n, 3) 행렬로 변환
         
-        for i, candidate in enumerate(pareto_candidates):
-            is_dominated = False
-            
-            for j, other in enumerate(pareto_candidates):
-                if i == j:
-                    continue
-                
-                if self.dominates(other.objectives, candidate.objectives):
-                    is_dominated = True
-                    break
+        Args:
+            candidates: Pareto 후보 목록
             
-            if not is_dominated:
-                non_dominated.append(candidate)
-        
-        return non_dominated
+        Returns:
+            목적 함수 행렬 (float64)
+        """
+        return np.asarray([c.objectives for c in candidates], dtype=np.float64)
     
     def calculate_crowding_distance(
         self,
-        candidates: List[ParetoCandidate]
+        candidates: List[ParetoCandidate],
+        objectives: Optional[np.ndarray] = None
     ) -> List[ParetoCandidate]:
         """
         혼잡 거리 계산 (다양성 측정)
         
         Args:
             candidates: Pareto 후보 목록
+            objectives: 후보 순서와 같은 (n, 3) 목적 함수 행렬 (없으면 후보에서 생성)
             
         Returns:
             혼잡 거리가 계산된 후보 목록
         """
-        if len(candidates) <= 2:
-            for c in candidates:
-                c.crowding_distance = float('inf')
+        if not candidates:
             return candidates
         
-        n = len(candidates)
-        n_objectives = len(candidates[0].objectives)
+        if objectives is None:
+            objectives = self._objectives_array(candidates)
         
-        # 초기화
-        for c in candidates:
-            c.crowding_distance = 0.0
-        
-        # 각 목적 함수별로 혼잡 거리 계산
-        for m in range(n_objectives):
-            # 목적 함수 값으로 정렬
-            sorted_indices = sorted(
-                range(n),
-                key=lambda i: candidates[i].objectives[m]
-            )
-            
-            # 경계값 설정
-            candidates[sorted_indices[0]].crowding_distance = float('inf')
-            candidates[sorted_indices[-1]].crowding_distance = float('inf')
-            
-            # 범위 계산
-            obj_range = (
-                candidates[sorted_indices[-1]].objectives[m] -
-                candidates[sorted_indices[0]].objectives[m]
-            )
-            
-            if obj_range == 0:
-                continue
-            
-            # 중간 값들의 혼잡 거리 계산
-            for i in range(1, n - 1):
-                prev_idx = sorted_indices[i - 1]
-                curr_idx = sorted_indices[i]
-                next_idx = sorted_indices[i + 1]
-                
-                distance = (
-                    candidates[next_idx].objectives[m] -
-                    candidates[prev_idx].objectives[m]
-                ) / obj_range
-                
-                candidates[curr_idx].crowding_distance += distance
+        dist = _crowding_distance(objectives)
+        for c, d in zip(candidates, dist.tolist()):
+            c.crowding_distance = d
         
         return candidates
     
@@ -202,19 +500,17 @@ class ParetoFilter:
         if len(candidates) <= k:
             return candidates
         
-        # Non-dominated 필터링
-        pareto_front = self.filter_non_dominated(candidates)
-        
-        if len(pareto_front) <= k:
-            return [p.path_candidate for p in pareto_front]
+        # Non-dominated 필터링 (목적 함수 행렬은 한 번만 생성하여 공유)
+        front = self._front_of(ParetoBatch.from_candidates(candidates))
         
-        # 혼잡 거리 계산
-        pareto_front = self.calculate_crowding_distance(pareto_front)
+        if len(front) <= k:
+            return front.path_candidates
         
-        # 혼잡 거리 기준 정렬 (내림차순 - 다양성 높은 순)
-        pareto_front.sort(key=lambda x: x.crowding_distance, reverse=True)
+        # 혼잡 거리 계산 후 상위 k개만 부분 선택 (내림차순 - 다양성 높은 순)
+        front.crowding = _crowding_distance(front.objectives)
+        top = _top_k_indices(front.crowding, k)
         
-        return [p.path_candidate for p in pareto_front[:k]]
+        return [front.path_candidates[i] for i in top.tolist()]
     
     def get_pareto_ranks(
         self,
@@ -232,38 +528,7 @@ class ParetoFilter:
         if not candidates:
             return []
         
-        pareto_candidates = [
-            ParetoCandidate.from_path_candidate(c) for c in candidates
-        ]
-        
-        remaining = list(range(len(pareto_candidates)))
-        current_rank = 0
-        
-        while remaining:
-            # 현재 남은 것들 중 non-dominated 찾기
-            non_dominated_indices = []
-            
-            for i in remaining:
-                is_dominated = False
-                for j in remaining:
-                    if i == j:
-                        continue
-                    if self.dominates(
-                        pareto_candidates[j].objectives,
-                        pareto_candidates[i].objectives
-                    ):
-                        is_dominated = True
-                        break
-                
-                if not is_dominated:
-                    non_dominated_indices.append(i)
-            
-            # 순위 할당
-            for idx in non_dominated_indices:
-                pareto_candidates[idx].rank = current_rank
-            
-            # 처리된 것들 제거
-            remaining = [i for i in remaining if i not in non_dominated_indices]
-            current_rank += 1
+        batch = ParetoBatch.from_candidates(candidates)
+        batch.ranks = _pareto_ranks(batch.objectives)
         
-        return pareto_candidates
+        return batch.to_pareto_candidates()
@@ -3,20 +3,76 @@
 가중치 샘플링, A* 탐색, Pareto 필터링을 통합
 """
 import logging
+import math
+import multiprocessing
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, List, Literal, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import numpy as np
 
 from src.domain.entities import Coordinate, RouteInfo
 from src.data.entities import RoadGraph
 from src.shape.transformer import ShapeTransformer
-from src.algorithm.weight_sampler import WeightSampler, WeightVector
+from src.algorithm.weight_sampler import WeightSampler
 from src.algorithm.astar import AStarPathFinder, PathCandidate
 from src.algorithm.pareto import ParetoFilter
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 풀 워커에서 공유하는 읽기 전용 그래프 (워커 초기화 시 한 번 설정)
+_WORKER_GRAPH: Optional[RoadGraph] = None
+
+
+def _init_worker(graph: RoadGraph) -> None:
+    """프로세스 풀 워커 초기화: 그래프를 워커당 한 번만 전달받아 보관"""
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = graph
+
+
+def _run_search(
+    graph: RoadGraph,
+    target_curve: List[Coordinate],
+    target_curve_arr: Optional[np.ndarray],
+    weights: Tuple[float, float, float],
+    target_distance_km: float,
+    max_crossings: int,
+    start_node_id: int,
+    max_iterations: int,
+    beam_width: Optional[int]
+) -> Optional[PathCandidate]:
+    """단일 (도형, 가중치) 조합에 대한 A* 경로 탐색 (target_curve_arr: (N, 2) [lat, lng] 또는 None)"""
+    pathfinder = AStarPathFinder(
+        graph=graph,
+        target_curve=target_curve,
+        target_distance_km=target_distance_km,
+        max_crossings=max_crossings,
+        weights=weights,
+        target_curve_arr=target_curve_arr
+    )
+    
+    return pathfinder.find_path(
+        start_node_id=start_node_id,
+        max_iterations=max_iterations,
+        beam_width=beam_width
+    )
+
+
+def _search_task(*args) -> Optional[PathCandidate]:
+    """프로세스 풀 작업: 워커에 보관된 그래프로 _run_search 수행 (pickle 가능한 모듈 함수)"""
+    return _run_search(_WORKER_GRAPH, *args)
+
+
+def _guarded_search(search_fn: Callable[..., Optional[PathCandidate]], args: tuple) -> Optional[PathCandidate]:
+    """executor.map 작업: 한 조합의 실패가 전체 결과 수집을 중단하지 않도록 None으로 처리"""
+    try:
+        return search_fn(*args)
+    except Exception as e:
+        logger.warning(f"경로 탐색 작업 실패: {e}")
+        return None
+
+
 @dataclass
 class RouteSearchConfig:
     """
@@ -26,16 +82,32 @@ class RouteSearchConfig:
         n_weight_samples: 가중치 샘플 개수
         n_rotations: 도형 회전 개수
         max_iterations: A* 최대 반복 횟수
+        beam_width: A* 우선순위 큐 최대 크기 (None이면 제한 없음)
         max_results: 최대 결과 개수
         use_parallel: 병렬 처리 사용 여부
         max_workers: 병렬 처리 워커 수
+        executor_type: 병렬 실행기 종류 ('thread' 또는 'process').
+            A*는 순수 파이썬 CPU 작업이라 스레드는 GIL에 막히므로,
+            'process'는 워커 프로세스마다 그래프를 한 번 전달받아 코어 단위로 병렬 실행.
+            워커는 spawn으로 시작하므로 (멀티스레드 서버에서 fork 시 잠금 상속 방지)
+            탐색마다 프로세스 기동 비용이 든다
+        weight_strategy: 가중치 생성 방식.
+            'dirichlet'은 코너 4개 + Dirichlet 샘플 (n_weight_samples개),
+            'cyclic'은 목적 함수 우선순위 순환 3개 + 코너 4개 (탐색 조합 수 약 1/3)
+        max_perimeter_ratio: 회전 도형 둘레의 허용 배율 r (None이면 비활성).
+            둘레가 [목표 거리 / r, 목표 거리 × r] 밖인 회전은 탐색하지 않음.
+            모두 밖이면 둘레가 목표에 가장 가까운 회전 하나만 탐색
     """
     n_weight_samples: int = 20
     n_rotations: int = 6
     max_iterations: int = 10000
+    beam_width: Optional[int] = None
     max_results: int = 5
     use_parallel: bool = True
     max_workers: int = 4
+    executor_type: Literal['thread', 'process'] = 'thread'
+    weight_strategy: Literal['dirichlet', 'cyclic'] = 'dirichlet'
+    max_perimeter_ratio: Optional[float] = 2.0
 
 
 class RouteFinder:
@@ -62,6 +134,13 @@ class RouteFinder:
         self.weight_sampler = WeightSampler()
         self.pareto_filter = ParetoFilter()
         self.transformer = ShapeTransformer()
+        
+        # 시작 노드 선택용 노드 배열 (그래프의 변경 번호가 바뀌면 재구성)
+        self._start_index_revision: Optional[int] = None
+        self._node_ids = np.empty(0, dtype=np.int64)
+        self._node_coords_rad = np.empty((0, 2), dtype=np.float64)
+        self._is_intersection = np.empty(0, dtype=bool)
+        self._build_start_index()
     
     def find_routes(
         self,
@@ -102,13 +181,14 @@ class RouteFinder:
         logger.info(f"시작 노드: {start_node_id}")
         
         # 가중치 샘플링
-        weights = self.weight_sampler.sample_with_corners(
-            self.config.n_weight_samples - 4
-        )
+        weights = self._generate_weights()
         logger.info(f"가중치 샘플: {len(weights)}개")
         
-        # 도형 회전 생성
-        rotated_curves = self._generate_rotated_curves(target_curve)
+        # 도형 회전 생성 (배열 형태는 탐색기에 그대로 전달)
+        curve_arrays = self._prune_infeasible_curves(
+            self._rotate_curve_arrays(target_curve), target_distance_km
+        )
+        rotated_curves = self._to_coordinate_curves(curve_arrays)
         logger.info(f"회전 변형: {len(rotated_curves)}개")
         
         # 모든 조합에 대해 경로 탐색
@@ -119,12 +199,12 @@ class RouteFinder:
         if self.config.use_parallel:
             all_candidates = self._search_parallel(
                 rotated_curves, weights, target_distance_km,
-                max_crossings, start_node_id
+                max_crossings, start_node_id, curve_arrays
             )
         else:
             all_candidates = self._search_sequential(
                 rotated_curves, weights, target_distance_km,
-                max_crossings, start_node_id
+                max_crossings, start_node_id, curve_arrays
             )
         
         logger.info(f"A* 탐색 결과: {len(all_candidates)}개 후보 경로 발견")
@@ -139,6 +219,40 @@ class RouteFinder:
         # RouteInfo로 변환
         return self._to_route_infos(top_candidates)
     
+    def _generate_weights(self) -> np.ndarray:
+        """
+        설정된 방식으로 탐색할 가중치 생성
+        
+        Returns:
+            (K, 3) 가중치 배열 (행: shape, length, crossing)
+        """
+        if self.config.weight_strategy == 'cyclic':
+            # 각 목적 함수를 한 번씩 주 목적으로 두는 순환 순열 + 코너 가중치
+            return np.array([
+                w.to_tuple() for w in (
+                    self.weight_sampler.get_cyclic_weights() +
+                    self.weight_sampler.get_corner_weights()
+                )
+            ])
+        
+        return self.weight_sampler.sample_with_corners_array(
+            self.config.n_weight_samples - 4
+        )
+    
+    def _build_start_index(self) -> None:
+        """노드 ID, 라디안 좌표, 교차로(이웃 2개 이상) 여부 배열 생성"""
+        graph = self.graph
+        self._start_index_revision = graph.revision
+        
+        self._node_ids = np.fromiter(graph.nodes.keys(), dtype=np.int64, count=graph.node_count)
+        self._node_coords_rad = np.radians(np.array(
+            [(node.lat, node.lng) for node in graph.nodes.values()], dtype=np.float64
+        ).reshape(-1, 2))
+        self._is_intersection = np.fromiter(
+            (len(graph.get_neighbors(node_id)) >= 2 for node_id in graph.nodes),
+            dtype=bool, count=graph.node_count
+        )
+    
     def _find_start_node(self, target_curve: List[Coordinate]) -> Optional[int]:
         """
         목표 곡선에서 시작점에 가장 가까운 교차로 노드 찾기
@@ -150,25 +264,26 @@ class RouteFinder:
         
         start_coord = target_curve[0]
         
-        # 이웃이 2개 이상인 노드(교차로) 중에서 가장 가까운 노드 찾기
-        best_node = None
-        best_distance = float('inf')
-        
-        for node in self.graph.nodes.values():
-            neighbor_count = len(self.graph.get_neighbors(node.id))
-            
-            # 이웃이 2개 이상인 노드만 고려 (순환 경로 가능)
-            if neighbor_count < 2:
-                continue
+        if self._start_index_revision != self.graph.revision:
+            self._build_start_index()
+        
+        # 이웃이 2개 이상인 노드(교차로)만 고려 (순환 경로 가능)
+        if self._is_intersection.any():
+            # Haversine 거리를 한 번에 계산 (Node.distance_to_coord와 같은 식)
+            lat1 = self._node_coords_rad[:, 0]
+            lng1 = self._node_coords_rad[:, 1]
+            lat2 = math.radians(start_coord.lat)
+            lng2 = math.radians(start_coord.lng)
+            a = (
+                np.sin((lat2 - lat1) / 2) ** 2 +
+                np.cos(lat1) * math.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+            )
+            distances = 2 * 6371 * np.arcsin(np.sqrt(a))
             
-            distance = node.distance_to_coord(start_coord.lat, start_coord.lng)
-            if distance < best_distance:
-                best_distance = distance
-                best_node = node
-        
-        if best_node:
-            logger.info(f"시작 노드 선택: {best_node.id} (이웃 {len(self.graph.get_neighbors(best_node.id))}개, 거리 {best_distance:.3f}km)")
-            return best_node.id
+            best = int(np.argmin(np.where(self._is_intersection, distances, np.inf)))
+            best_id = int(self._node_ids[best])
+            logger.info(f"시작 노드 선택: {best_id} (이웃 {len(self.graph.get_neighbors(best_id))}개, 거리 {distances[best]:.3f}km)")
+            return best_id
         
         # 교차로가 없으면 가장 가까운 노드 사용 (fallback)
         logger.warning("교차로 노드를 찾을 수 없어 가장 가까운 노드 사용")
@@ -180,47 +295,96 @@ class RouteFinder:
         target_curve: List[Coordinate]
     ) -> List[List[Coordinate]]:
         """도형을 여러 각도로 회전"""
-        # 좌표를 정규화 좌표로 변환
-        center_lat = sum(c.lat for c in target_curve) / len(target_curve)
-        center_lng = sum(c.lng for c in target_curve) / len(target_curve)
-        
-        # 간단한 변환 (위도/경도 -> x/y)
-        normalized = [
-            (c.lng - center_lng, c.lat - center_lat)
-            for c in target_curve
-        ]
+        return self._to_coordinate_curves(self._rotate_curve_arrays(target_curve))
+    
+    def _rotate_curve_arrays(self, target_curve: List[Coordinate]) -> np.ndarray:
+        """
+        도형을 여러 각도로 회전한 좌표 배열
+        
+        Returns:
+            (K, N, 2) [lat, lng] 배열 (K: 회전 개수)
+        """
+        # (x=경도, y=위도) 배열로 한 번에 회전 (중심 기준)
+        coords = np.array([(c.lng, c.lat) for c in target_curve], dtype=np.float64)
+        center = coords.mean(axis=0)
         
         # 회전 각도
         angles = [0, 60, 120, 180, 240, 300][:self.config.n_rotations]
         
-        rotated_curves = []
-        for angle in angles:
-            rotated = self.transformer.rotate(normalized, angle)
-            # 다시 지리 좌표로 변환
-            geo_coords = [
-                Coordinate(lat=center_lat + y, lng=center_lng + x)
-                for x, y in rotated
-            ]
-            rotated_curves.append(geo_coords)
-        
-        return rotated_curves
+        rotated = self.transformer.rotate_many(coords, angles, center=tuple(center))
+        
+        # (lng, lat) -> (lat, lng) 순서로 변환
+        return np.ascontiguousarray(rotated[:, :, ::-1])
+    
+    def _prune_infeasible_curves(
+        self,
+        curve_arrays: np.ndarray,
+        target_distance_km: float
+    ) -> np.ndarray:
+        """
+        둘레로 보아 목표 거리를 맞출 수 없는 회전 도형 제외
+        
+        회전은 위경도 공간에서 이루어지므로 위도에 따라 실제 둘레가 달라진다.
+        A* 탐색 전에 둘레(연속 점 사이 Haversine 거리 합)가
+        [목표 거리 / max_perimeter_ratio, 목표 거리 × max_perimeter_ratio] 밖인 회전을 거른다.
+        
+        Args:
+            curve_arrays: (K, N, 2) [lat, lng] 회전 도형 배열
+            target_distance_km: 목표 거리 (km)
+            
+        Returns:
+            남은 회전 도형 배열 (모두 구간 밖이면 둘레가 목표에 가장 가까운 회전 하나)
+        """
+        ratio = self.config.max_perimeter_ratio
+        if ratio is None or target_distance_km <= 0 or len(curve_arrays) == 0:
+            return curve_arrays
+        
+        # 회전별 둘레를 한 번에 계산 (Node.distance_to_coord와 같은 Haversine 식)
+        rad = np.radians(curve_arrays)
+        lat1, lat2 = rad[:, :-1, 0], rad[:, 1:, 0]
+        dlng = rad[:, 1:, 1] - rad[:, :-1, 1]
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+        perimeters = (2 * 6371 * np.arcsin(np.sqrt(a))).sum(axis=1)
+        
+        keep = (perimeters >= target_distance_km / ratio) & (perimeters <= target_distance_km * ratio)
+        if not keep.any():
+            # 구간 밖으로 벗어난 만큼 남는 회전이 줄어들도록 전부가 아닌 가장 가까운 하나만 유지
+            keep[np.argmin(np.abs(perimeters - target_distance_km))] = True
+        
+        logger.info(
+            f"둘레 기준 회전 제외: {int((~keep).sum())}/{len(keep)}개 "
+            f"(둘레 {perimeters.min():.2f}~{perimeters.max():.2f}km, 목표 {target_distance_km}km)"
+        )
+        return curve_arrays[keep]
+    
+    @staticmethod
+    def _to_coordinate_curves(curve_arrays: np.ndarray) -> List[List[Coordinate]]:
+        """(K, N, 2) [lat, lng] 배열을 지리 좌표 목록으로 변환"""
+        return [
+            [Coordinate(lat=lat, lng=lng) for lat, lng in curve]
+            for curve in curve_arrays.tolist()
+        ]
     
     def _search_sequential(
         self,
         rotated_curves: List[List[Coordinate]],
-        weights: List[WeightVector],
+        weights: np.ndarray,
         target_distance_km: float,
         max_crossings: int,
-        start_node_id: int
+        start_node_id: int,
+        curve_arrays: Optional[np.ndarray] = None
     ) -> List[PathCandidate]:
-        """순차 탐색"""
+        """순차 탐색 (weights: (K, 3) 가중치 배열, curve_arrays: 회전별 (N, 2) 배열)"""
         candidates = []
+        weight_rows = [tuple(row) for row in np.asarray(weights).tolist()]
+        if curve_arrays is None:
+            curve_arrays = [None] * len(rotated_curves)
         
-        for curve in rotated_curves:
-            for weight in weights:
+        for curve, curve_arr in zip(rotated_curves, curve_arrays):
+            for weight in weight_rows:
                 candidate = self._search_single(
                     curve, weight, target_distance_km,
-                    max_crossings, start_node_id
+                    max_crossings, start_node_id, curve_arr
                 )
                 if candidate:
                     candidates.append(candidate)
@@ -230,61 +394,70 @@ class RouteFinder:
     def _search_parallel(
         self,
         rotated_curves: List[List[Coordinate]],
-        weights: List[WeightVector],
+        weights: np.ndarray,
         target_distance_km: float,
         max_crossings: int,
-        start_node_id: int
+        start_node_id: int,
+        curve_arrays: Optional[np.ndarray] = None
     ) -> List[PathCandidate]:
-        """병렬 탐색"""
+        """병렬 탐색 (weights: (K, 3) 가중치 배열, curve_arrays: 회전별 (N, 2) 배열)"""
         candidates = []
+        weight_rows = [tuple(row) for row in np.asarray(weights).tolist()]
+        if curve_arrays is None:
+            curve_arrays = [None] * len(rotated_curves)
+        
+        search_args = (
+            target_distance_km, max_crossings, start_node_id,
+            self.config.max_iterations, self.config.beam_width
+        )
         
         # 작업 목록 생성
         tasks = [
-            (curve, weight)
-            for curve in rotated_curves
-            for weight in weights
+            (curve, curve_arr, weight, *search_args)
+            for curve, curve_arr in zip(rotated_curves, curve_arrays)
+            for weight in weight_rows
         ]
         
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self._search_single,
-                    curve, weight, target_distance_km,
-                    max_crossings, start_node_id
-                ): (curve, weight)
-                for curve, weight in tasks
-            }
-            
-            for future in as_completed(futures):
-                try:
-                    candidate = future.result()
-                    if candidate:
-                        candidates.append(candidate)
-                except Exception:
-                    pass
+        # 프로세스 풀은 작업을 묶어서 전달 (워커당 약 4묶음, 스레드 풀에서는 무시됨)
+        chunksize = max(1, len(tasks) // (4 * self.config.max_workers))
+        
+        if self.config.executor_type == 'process':
+            # fork는 다른 스레드가 잡고 있던 잠금(logging 등)까지 복제해 워커가 멈출 수 있으므로 spawn 사용
+            executor = ProcessPoolExecutor(
+                max_workers=self.config.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.graph,)
+            )
+            search_fn = _search_task
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+            search_fn = partial(_run_search, self.graph)
+        
+        with executor:
+            results = executor.map(
+                partial(_guarded_search, search_fn), tasks, chunksize=chunksize
+            )
+            for candidate in results:
+                if candidate:
+                    candidates.append(candidate)
         
         return candidates
     
     def _search_single(
         self,
         target_curve: List[Coordinate],
-        weight: WeightVector,
+        weight: Tuple[float, float, float],
         target_distance_km: float,
         max_crossings: int,
-        start_node_id: int
+        start_node_id: int,
+        target_curve_arr: Optional[np.ndarray] = None
     ) -> Optional[PathCandidate]:
         """단일 조합에 대한 경로 탐색"""
-        pathfinder = AStarPathFinder(
-            graph=self.graph,
-            target_curve=target_curve,
-            target_distance_km=target_distance_km,
-            max_crossings=max_crossings,
-            weights=weight.to_tuple()
-        )
-        
-        return pathfinder.find_path(
-            start_node_id=start_node_id,
-            max_iterations=self.config.max_iterations
+        return _run_search(
+            self.graph, target_curve, target_curve_arr, weight,
+            target_distance_km, max_crossings, start_node_id,
+            self.config.max_iterations, self.config.beam_width
         )
     
     def _to_route_infos(
@@ -293,14 +466,22 @@ class RouteFinder:
     ) -> List[RouteInfo]:
         """PathCandidate를 RouteInfo로 변환"""
         route_infos = []
+        csr = self.graph.build_csr()
         
         for i, candidate in enumerate(candidates):
-            # 노드 ID를 좌표로 변환
-            coordinates = []
-            for node_id in candidate.path:
-                node = self.graph.get_node(node_id)
-                if node:
-                    coordinates.append(Coordinate(lat=node.lat, lng=node.lng))
+            # 노드 ID를 좌표로 변환 (CSR 좌표 배열에서 한 번에 수집)
+            coordinates_arr = None
+            idx = csr.path_indices(candidate.path)
+            if idx is not None:
+                coordinates_arr = np.column_stack((csr.node_lat[idx], csr.node_lng[idx]))
+                coordinates = [Coordinate(lat=lat, lng=lng) for lat, lng in coordinates_arr.tolist()]
+            else:
+                # 그래프에 없는 노드는 건너뜀
+                coordinates = []
+                for node_id in candidate.path:
+                    node = self.graph.get_node(node_id)
+                    if node:
+                        coordinates.append(Coordinate(lat=node.lat, lng=node.lng))
             
             # 도형 유사도 계산 (shape_distance의 역수)
             shape_similarity = 1.0 / (1.0 + candidate.shape_distance)
@@ -310,7 +491,8 @@ class RouteFinder:
                 coordinates=coordinates,
                 total_distance_km=candidate.path_length_km,
                 traffic_light_count=candidate.traffic_light_count,
-                shape_similarity=shape_similarity
+                shape_similarity=shape_similarity,
+                coordinates_arr=coordinates_arr
             )
             route_infos.append(route_info)
         
@@ -338,21 +520,22 @@ class RouteFinder:
                 return [], []
             start_node_id = start_node
         
-        weights = self.weight_sampler.sample_with_corners(
-            self.config.n_weight_samples - 4
-        )
+        weights = self._generate_weights()
         
-        rotated_curves = self._generate_rotated_curves(target_curve)
+        curve_arrays = self._prune_infeasible_curves(
+            self._rotate_curve_arrays(target_curve), target_distance_km
+        )
+        rotated_curves = self._to_coordinate_curves(curve_arrays)
         
         if self.config.use_parallel:
             all_candidates = self._search_parallel(
                 rotated_curves, weights, target_distance_km,
-                max_crossings, start_node_id
+                max_crossings, start_node_id, curve_arrays
             )
         else:
             all_candidates = self._search_sequential(
                 rotated_curves, weights, target_distance_km,
-                max_crossings, start_node_id
+                max_crossings, start_node_id, curve_arrays
             )
         
         top_candidates = self.pareto_filter.select_top_k(
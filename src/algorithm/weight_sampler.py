@@ -39,6 +39,15 @@ class WeightSampler:
     다양한 탐색 방향을 생성
     """
     
+    # 코너 가중치 (행: alpha, beta, gamma) - 도형 중심, 길이 중심, 횡단보도 중심, 균형
+    _CORNERS = np.array([
+        [0.8, 0.1, 0.1],
+        [0.1, 0.8, 0.1],
+        [0.1, 0.1, 0.8],
+        [0.34, 0.33, 0.33],
+    ])
+    _CORNERS.setflags(write=False)
+    
     def __init__(self, seed: int = None):
         """
         Args:
@@ -108,16 +117,44 @@ class WeightSampler:
             도형 중심, 길이 중심, 횡단보도 중심 가중치
         """
         return [
-            WeightVector(alpha=0.8, beta=0.1, gamma=0.1),  # 도형 중심
-            WeightVector(alpha=0.1, beta=0.8, gamma=0.1),  # 길이 중심
-            WeightVector(alpha=0.1, beta=0.1, gamma=0.8),  # 횡단보도 중심
-            WeightVector(alpha=0.34, beta=0.33, gamma=0.33),  # 균형
+            WeightVector(alpha=a, beta=b, gamma=g)
+            for a, b, g in self._CORNERS.tolist()
+        ]
+    
+    def get_cyclic_weights(
+        self,
+        primary: float = 0.7,
+        secondary: float = 0.2
+    ) -> List[WeightVector]:
+        """
+        목적 함수 순서를 순환시킨 가중치 반환 (각 목적 함수가 한 번씩 주 목적이 됨)
+        
+        (도형, 길이, 횡단보도) 우선순위를 순환 순열로 돌려서
+        (p, s, t), (t, p, s), (s, t, p) 세 가지 조합 생성
+        
+        Args:
+            primary: 주 목적 함수 가중치
+            secondary: 다음 순위 목적 함수 가중치 (나머지는 1 - primary - secondary)
+            
+        Returns:
+            순환 가중치 3개
+        """
+        tertiary = 1.0 - primary - secondary
+        if min(primary, secondary, tertiary) < 0:
+            raise ValueError("가중치는 음수일 수 없습니다")
+        
+        base = (primary, secondary, tertiary)
+        return [
+            WeightVector(alpha=base[-k % 3], beta=base[(1 - k) % 3], gamma=base[(2 - k) % 3])
+            for k in range(3)
         ]
     
     def sample_with_corners(self, n_samples: int = 16) -> List[WeightVector]:
         """
         코너 가중치를 포함한 샘플링
         
+        탐색 루프에서는 객체 생성/검증이 없는 sample_with_corners_array를 사용한다.
+        
         Args:
             n_samples: 추가 샘플 개수 (코너 4개 + n_samples)
             
@@ -127,3 +164,33 @@ class WeightSampler:
         corners = self.get_corner_weights()
         additional = self.sample(n_samples)
         return corners + additional
+    
+    def sample_array(self, n_samples: int = 20) -> np.ndarray:
+        """
+        Dirichlet 분포에서 가중치 샘플링 (배열 반환)
+        
+        WeightVector 객체 생성/검증 없이 탐색 루프에서 바로 사용하는 경로.
+        Dirichlet 샘플은 정의상 합이 1이므로 검증을 생략한다.
+        
+        Args:
+            n_samples: 샘플 개수 (기본: 20)
+            
+        Returns:
+            (n_samples, 3) 가중치 배열 (행: alpha, beta, gamma)
+        """
+        if n_samples <= 0:
+            raise ValueError("샘플 개수는 양수여야 합니다")
+        
+        return self.rng.dirichlet(np.array([1.0, 1.0, 1.0]), size=n_samples)
+    
+    def sample_with_corners_array(self, n_samples: int = 16) -> np.ndarray:
+        """
+        코너 가중치를 포함한 샘플링 (배열 반환)
+        
+        Args:
+            n_samples: 추가 샘플 개수 (코너 4개 + n_samples)
+            
+        Returns:
+            (4 + n_samples, 3) 가중치 배열
+        """
+        return np.vstack([self._CORNERS, self.sample_array(n_samples)])
@@ -0,0 +1,101 @@
+"""
+Edge-Curve 거리 JIT 커널
+엣지 샘플점을 목표 곡선의 모든 선분에 투영하는 계산을 스칼라 루프로 처리
+(numba 미설치 시 ShapeDistanceCalculator가 NumPy 배열 연산 경로 사용)
+
+첫 호출 시 numba 컴파일(수백 ms~1초)이 한 번 발생하며,
+cache=True로 컴파일 결과를 __pycache__에 저장해 다음 프로세스부터는 로드만 한다.
+새로 컴파일한 코드와 캐시에서 로드한 코드(spawn 워커)의 결과가 비트 단위로 같도록 fastmath는 사용하지 않는다.
+"""
+import math
+
+import numpy as np
+
+from src._jit import njit
+
+
+EARTH_RADIUS_KM = 6371.0
+DEG2RAD = math.pi / 180.0
+
+
+@njit(cache=True)
+def edge_curve_distance(
+    n1_lat: float, n1_lng: float,
+    n2_lat: float, n2_lng: float,
+    k: int,
+    cs_lat: np.ndarray, cs_lng: np.ndarray,
+    seg_dy: np.ndarray, seg_dx: np.ndarray,
+    cos_lat0: float = 0.0
+) -> float:
+    """
+    엣지 샘플 k개와 목표 곡선 사이의 평균 최소 거리 (km)
+
+    샘플 위치는 _sample_ratios와 같은 i/(k-1) (k=1이면 중점)이며,
+    거리는 단조 증가 함수이므로 선분별 최소는 중간값(haversine a 또는 평면 거리 제곱)으로
+    비교하고 마지막에 한 번만 거리로 변환한다.
+
+    Args:
+        n1_lat, n1_lng: 시작 노드 좌표 (도)
+        n2_lat, n2_lng: 끝 노드 좌표 (도)
+        k: 샘플 수 (1 이상)
+        cs_lat, cs_lng: 곡선 선분 시작점 (라디안)
+        seg_dy, seg_dx: 곡선 선분 방향 벡터 (위도, 경도 차이, 라디안)
+        cos_lat0: 0보다 크면 이 값으로 경도를 보정하는 등장방형 근사 거리 사용 (0이면 haversine)
+
+    Returns:
+        평균 최소 거리 (km)
+    """
+    total = 0.0
+    for s in range(k):
+        ratio = s / (k - 1) if k > 1 else 0.5
+        lat = (n1_lat + ratio * (n2_lat - n1_lat)) * DEG2RAD
+        lng = (n1_lng + ratio * (n2_lng - n1_lng)) * DEG2RAD
+        cos_lat = math.cos(lat)
+
+        best = np.inf
+        for i in range(cs_lat.shape[0]):
+            dx = seg_dx[i]
+            dy = seg_dy[i]
+            len_sq = dx * dx + dy * dy
+
+            # 길이 0인 선분은 시작점까지의 거리
+            t = 0.0
+            if len_sq > 0:
+                t = ((lng - cs_lng[i]) * dx + (lat - cs_lat[i]) * dy) / len_sq
+                t = max(0.0, min(1.0, t))
+
+            proj_lat = cs_lat[i] + t * dy
+            dlat = proj_lat - lat
+            dlng = cs_lng[i] + t * dx - lng
+            if cos_lat0 > 0:
+                dlng *= cos_lat0
+                a = dlat * dlat + dlng * dlng
+            else:
+                a = math.sin(dlat / 2) ** 2 + cos_lat * math.cos(proj_lat) * math.sin(dlng / 2) ** 2
+            if a < best:
+                best = a
+
+        if cos_lat0 > 0:
+            total += EARTH_RADIUS_KM * math.sqrt(best)
+        else:
+            total += 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(best))
+    return total / k
+
+
+@njit(cache=True)
+def edge_curve_distances(
+    lat1: np.ndarray, lng1: np.ndarray,
+    lat2: np.ndarray, lng2: np.ndarray,
+    k: int,
+    cs_lat: np.ndarray, cs_lng: np.ndarray,
+    seg_dy: np.ndarray, seg_dx: np.ndarray,
+    cos_lat0: float = 0.0
+) -> np.ndarray:
+    """여러 엣지에 대한 edge_curve_distance (엣지별 결과 배열, km)"""
+    out = np.empty(lat1.shape[0])
+    for e in range(lat1.shape[0]):
+        out[e] = edge_curve_distance(
+            lat1[e], lng1[e], lat2[e], lng2[e], k,
+            cs_lat, cs_lng, seg_dy, seg_dx, cos_lat0
+        )
+    return out
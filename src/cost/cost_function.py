@@ -3,11 +3,79 @@
 경로 평가를 위한 ShapeDistance, LengthPenalty, CrossingPenalty 계산
 """
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+from scipy.spatial import cKDTree
+
+from src._jit import HAS_NUMBA
+from src.cost._kernels import edge_curve_distance, edge_curve_distances
 from src.domain.entities import Coordinate
-from src.data.entities import Node, Edge, RoadGraph
+from src.data.entities import CSRAdjacency, Node, Edge, RoadGraph
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _haversine_vec(lat1, lng1, lat2, lng2, lat_offset: float = 0.0):
+    """
+    Haversine 거리 (km) - 배열 입력 지원
+    
+    입력은 라디안 단위이며 NumPy 브로드캐스트 규칙을 따른다.
+    곡선 좌표를 미리 라디안으로 변환해 두면 이동하는 점만 변환하면 된다.
+    
+    Args:
+        lat1, lng1: 첫 번째 좌표 (라디안, 스칼라 또는 배열)
+        lat2, lng2: 두 번째 좌표 (라디안, 스칼라 또는 배열)
+        lat_offset: 위도가 기준점 상대값일 때 더할 기준 위도 (라디안)
+        
+    Returns:
+        거리 (km, 브로드캐스트된 배열)
+    """
+    dlat = lat2 - lat1
+    dlng = lng2 - lng1
+    if lat_offset:
+        lat1 = lat1 + lat_offset
+        lat2 = lat2 + lat_offset
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(a))
+
+
+def _equirect_vec(lat1, lng1, lat2, lng2, cos_lat0: float):
+    """
+    등장방형 근사 거리 (km) - 배열 입력 지원
+    
+    좁은 영역에서 경도 차이를 기준 위도의 코사인으로 보정한 평면 거리로,
+    수 km 이내에서는 Haversine과 거의 같고 삼각함수 호출이 없다.
+    
+    Args:
+        lat1, lng1: 첫 번째 좌표 (라디안, 스칼라 또는 배열)
+        lat2, lng2: 두 번째 좌표 (라디안, 스칼라 또는 배열)
+        cos_lat0: 기준 위도의 코사인
+        
+    Returns:
+        거리 (km, 브로드캐스트된 배열)
+    """
+    return EARTH_RADIUS_KM * np.hypot((lng2 - lng1) * cos_lat0, lat2 - lat1)
+
+
+# 배치 거리 계산 시 한 번에 만드는 (엣지 × 샘플 × 선분) 임시 배열 원소 수 상한
+_BATCH_ELEMENTS = 1 << 18
+
+
+# 선분 수가 이 값 이상인 목표 곡선은 KD-tree로 후보 선분만 계산 (NumPy 경로)
+KDTREE_MIN_SEGMENTS = 128
+# 점마다 계산할 후보 선분 수 (선분 중점 기준 최근접). 확인되지 않은 점만 다음 단계로 넓혀 재계산
+_KDTREE_CANDIDATES = (16, 64, 256)
+# 부동소수점 오차와 선분(위경도 직선)과 대원 호의 차이에 대한 여유 비율
+_KDTREE_MARGIN = 1e-6
+
+
+def _sample_ratios(k: int) -> np.ndarray:
+    """엣지 샘플 위치 비율 (_sample_edge_points와 같은 i/(k-1), k=1이면 중점)"""
+    return np.arange(k) / (k - 1) if k > 1 else np.array([0.5])
 
 
 @dataclass
@@ -38,11 +106,21 @@ class ShapeDistanceCalculator:
     각 엣지를 샘플링하여 목표 곡선과의 거리를 계산
     """
     
-    def __init__(self, target_curve: List[Coordinate], target_distance_km: float):
+    def __init__(
+        self,
+        target_curve: List[Coordinate],
+        target_distance_km: float,
+        fast_distance: bool = False,
+        use_float32: bool = False
+    ):
         """
         Args:
             target_curve: 목표 도형 좌표 목록
             target_distance_km: 목표 거리 (정규화용)
+            fast_distance: True면 점-투영점 거리를 Haversine 대신 등장방형 근사로 계산
+                (곡선 평균 위도 기준, 수 km 영역에서 오차는 무시할 수준)
+            use_float32: True면 NumPy 배열 경로를 float32로 계산 (메모리 이동량 절반).
+                곡선 첫 점 기준 상대 좌표를 사용해 정밀도를 유지하며, 이 모드에서는 JIT 커널을 쓰지 않음
         """
         if not target_curve or len(target_curve) < 2:
             raise ValueError("목표 곡선은 최소 2개 이상의 점이 필요합니다")
@@ -51,11 +129,81 @@ class ShapeDistanceCalculator:
         
         self.target_curve = target_curve
         self.target_distance_km = target_distance_km
+        
+        # 목표 곡선 선분 배열 (라디안: 선분 시작점, 방향 벡터, 길이 제곱)
+        # 투영 비율 t는 좌표 단위와 무관하므로 투영과 거리 계산 모두 라디안으로 수행
+        curve_lat = np.radians(np.array([c.lat for c in target_curve], dtype=np.float64))
+        curve_lng = np.radians(np.array([c.lng for c in target_curve], dtype=np.float64))
+        
+        # float32 모드는 곡선 첫 점 기준 상대 좌표(작은 값)로 저장해 float32에서도 미터 이하 정밀도 유지
+        # (기본 float64 모드는 기준점 0 = 절대 좌표)
+        self.use_float32 = use_float32
+        self._dtype = np.float32 if use_float32 else np.float64
+        self._lat0 = float(curve_lat[0]) if use_float32 else 0.0
+        self._lng0 = float(curve_lng[0]) if use_float32 else 0.0
+        local_lat = (curve_lat - self._lat0).astype(self._dtype)
+        local_lng = (curve_lng - self._lng0).astype(self._dtype)
+        
+        self._cs_lat = local_lat[:-1]
+        self._cs_lng = local_lng[:-1]
+        self._seg_dx = local_lng[1:] - local_lng[:-1]
+        self._seg_dy = local_lat[1:] - local_lat[:-1]
+        seg_len_sq = self._seg_dx * self._seg_dx + self._seg_dy * self._seg_dy
+        
+        # 길이가 0인 선분(점)은 분모를 1로 두고 투영 비율을 0으로 고정 → 투영점 = 시작점
+        self._seg_is_point = seg_len_sq == 0
+        self._seg_len_sq = np.where(self._seg_is_point, 1.0, seg_len_sq).astype(self._dtype)
+        
+        # 근사 거리 모드의 경도 보정 계수 (0이면 Haversine)
+        self.fast_distance = fast_distance
+        self._cos_lat0 = float(np.cos(curve_lat.mean())) if fast_distance else 0.0
+        
+        # 긴 곡선은 선분 중점의 KD-tree로 후보 선분을 좁힘
+        self._curve_tree: Optional[cKDTree] = None
+        if len(self._cs_lat) >= KDTREE_MIN_SEGMENTS:
+            mid_lat = self._cs_lat + 0.5 * self._seg_dy
+            mid_lng = self._cs_lng + 0.5 * self._seg_dx
+            self._curve_tree = cKDTree(self._tree_coords(mid_lat + self._lat0, mid_lng + self._lng0))
+            # 선분 위 어느 점도 중점에서 이 거리(km) 이내
+            self._max_half_km = float(self._distance_vec(self._cs_lat, self._cs_lng, mid_lat, mid_lng).max())
+            # 후보 밖 선분 판정 여유 (float32는 계산 오차가 더 큼)
+            self._tree_margin = 1e-4 if use_float32 else _KDTREE_MARGIN
+        
+        # 기본 샘플 위치와 (점, 선분) 계산 버퍼 (_scratch_buffers에서 재사용)
+        self._t_default = _sample_ratios(3)
+        self._scratch: Optional[Tuple[np.ndarray, ...]] = None
+        
+        # 엣지 거리 캐시: (시작 노드 ID, 끝 노드 ID, 샘플 수) -> 거리 (km)
+        # 목표 곡선은 계산기 수명 동안 고정이므로 방향 엣지당 한 번만 계산
+        self._edge_dist_cache: Dict[Tuple[int, int, int], float] = {}
+    
+    def clear_cache(self) -> None:
+        """엣지 거리 캐시 비우기 (다른 그래프에 재사용할 때 호출)"""
+        self._edge_dist_cache.clear()
+    
+    def put_edge_distances(
+        self, source_ids: List[int], target_ids: List[int],
+        distances: List[float], min_samples: int = 3
+    ) -> None:
+        """
+        배열 연산으로 계산한 엣지 거리를 캐시에 저장 (calculate_edge_distance와 같은 키, 이미 있는 값은 유지)
+        
+        Args:
+            source_ids: 시작 노드 ID 목록
+            target_ids: 끝 노드 ID 목록
+            distances: 엣지별 거리 (km)
+            min_samples: 샘플 수
+        """
+        cache_setdefault = self._edge_dist_cache.setdefault
+        for u, v, dist in zip(source_ids, target_ids, distances):
+            cache_setdefault((u, v, min_samples), dist)
     
     def calculate_edge_distance(self, node1: Node, node2: Node, min_samples: int = 3) -> float:
         """
         엣지와 목표 곡선 사이의 거리 계산
         
+        노드 ID는 그래프 안에서 노드를 식별한다고 보고 (ID, ID, 샘플 수)로 결과를 캐시한다.
+        
         Args:
             node1: 시작 노드
             node2: 끝 노드
@@ -64,14 +212,280 @@ class ShapeDistanceCalculator:
         Returns:
             거리 합 (km)
         """
-        samples = self._sample_edge_points(node1, node2, min_samples)
+        if min_samples <= 0:
+            return 0.0
         
-        total_distance = 0.0
-        for sample in samples:
-            min_dist = self._point_to_curve_distance(sample)
-            total_distance += min_dist
+        key = (node1.id, node2.id, min_samples)
+        distance = self._edge_dist_cache.get(key)
+        if distance is None:
+            if HAS_NUMBA and not self.use_float32:
+                distance = edge_curve_distance(
+                    node1.lat, node1.lng, node2.lat, node2.lng, min_samples,
+                    self._cs_lat, self._cs_lng, self._seg_dy, self._seg_dx, self._cos_lat0
+                )
+            else:
+                distance = self._edge_to_curve_distance_np(
+                    node1.lat, node1.lng, node2.lat, node2.lng, min_samples
+                )
+            self._edge_dist_cache[key] = distance
+        return distance
+    
+    def _edge_to_curve_distance_np(
+        self,
+        n1_lat: float,
+        n1_lng: float,
+        n2_lat: float,
+        n2_lng: float,
+        k: int
+    ) -> float:
+        """
+        엣지 샘플 k개와 목표 곡선 사이의 평균 최소 거리 (배열 연산 한 번)
         
-        return total_distance / len(samples) if samples else 0.0
+        _sample_edge_points와 같은 위치의 샘플을 Coordinate 생성 없이 만들고,
+        (k, 선분 수) 투영/거리 행렬에서 샘플별 최소값의 평균을 구한다.
+        
+        Args:
+            n1_lat, n1_lng: 시작 노드 좌표
+            n2_lat, n2_lng: 끝 노드 좌표
+            k: 샘플 수 (1이면 중점)
+            
+        Returns:
+            평균 최소 거리 (km)
+        """
+        t = self._t_default if k == 3 else _sample_ratios(k)
+        lat = np.radians(n1_lat + t * (n2_lat - n1_lat))
+        lng = np.radians(n1_lng + t * (n2_lng - n1_lng))
+        
+        return float(self._min_distance_to_segments(lat, lng).mean(dtype=np.float64))
+    
+    def calculate_edge_distances(
+        self,
+        lat1: np.ndarray,
+        lng1: np.ndarray,
+        lat2: np.ndarray,
+        lng2: np.ndarray,
+        min_samples: int = 3
+    ) -> np.ndarray:
+        """
+        여러 엣지와 목표 곡선 사이의 거리를 한 번에 계산 (calculate_edge_distance의 배열 버전)
+        
+        (엣지, 샘플, 선분) 임시 배열이 커지지 않도록 엣지를 나눠서 처리한다.
+        
+        Args:
+            lat1, lng1: (E,) 시작 노드 좌표 (도)
+            lat2, lng2: (E,) 끝 노드 좌표 (도)
+            min_samples: 엣지당 샘플 수
+            
+        Returns:
+            (E,) 엣지별 평균 최소 거리 (km)
+        """
+        lat1, lng1, lat2, lng2 = (np.asarray(a, dtype=np.float64) for a in (lat1, lng1, lat2, lng2))
+        n_edges = lat1.shape[0]
+        if min_samples <= 0:
+            return np.zeros(n_edges)
+        
+        if HAS_NUMBA and not self.use_float32:
+            return edge_curve_distances(
+                lat1, lng1, lat2, lng2, min_samples,
+                self._cs_lat, self._cs_lng, self._seg_dy, self._seg_dx, self._cos_lat0
+            )
+        
+        t = self._t_default if min_samples == 3 else _sample_ratios(min_samples)
+        dists = np.empty(n_edges)
+        chunk = max(1, _BATCH_ELEMENTS // (min_samples * max(1, len(self._cs_lat))))
+        
+        for start in range(0, n_edges, chunk):
+            end = start + chunk
+            lat = np.radians(lat1[start:end, None] + t * (lat2[start:end, None] - lat1[start:end, None]))
+            lng = np.radians(lng1[start:end, None] + t * (lng2[start:end, None] - lng1[start:end, None]))
+            dists[start:end] = self._min_distance_to_segments(lat, lng).mean(axis=1, dtype=np.float64)
+        
+        return dists
+    
+    def _min_distance_to_segments(self, lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+        """
+        점 배열(라디안)에서 목표 곡선까지의 최소 거리
+        
+        Args:
+            lat, lng: 임의 형태의 점 좌표 배열 (라디안)
+            
+        Returns:
+            입력과 같은 형태의 최소 거리 배열 (km)
+        """
+        if self._curve_tree is not None:
+            return self._min_distance_kdtree(lat, lng)
+        return self._min_distance_full(*self._to_local(lat, lng))
+    
+    def _to_local(self, lat: np.ndarray, lng: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """절대 좌표(라디안)를 곡선 배열과 같은 기준점/정밀도로 변환 (float64 모드는 그대로)"""
+        if not self.use_float32:
+            return lat, lng
+        return ((lat - self._lat0).astype(np.float32, copy=False),
+                (lng - self._lng0).astype(np.float32, copy=False))
+    
+    def _tree_coords(self, lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+        """
+        KD-tree 좌표 (라디안 입력)
+        
+        트리 좌표의 유클리드 거리가 실제 거리와 단조 관계가 되도록,
+        Haversine 모드는 단위 구 위의 3차원 좌표(현 길이), 근사 모드는 등장방형 평면 좌표를 사용
+        """
+        if self.fast_distance:
+            return np.column_stack([lng * self._cos_lat0, lat])
+        cos_lat = np.cos(lat)
+        return np.column_stack([cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)])
+    
+    def _tree_distance_km(self, tree_dist: np.ndarray) -> np.ndarray:
+        """KD-tree 좌표 거리를 실제 거리(km)로 변환"""
+        if self.fast_distance:
+            return EARTH_RADIUS_KM * tree_dist
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(tree_dist / 2, 1.0))
+    
+    def _min_distance_kdtree(self, lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+        """
+        KD-tree 후보 선분만으로 최소 거리 계산 (전체 계산과 같은 결과)
+        
+        중점이 가까운 선분 몇 개로 최소 거리를 구한 뒤, 후보 밖 선분이 더 가까울 수 없음
+        (가장 먼 후보 중점까지 거리 - 선분 절반 길이 >= 구한 거리)을 확인한다.
+        확인되지 않은 점만 후보 수를 늘려 다시 계산하고, 마지막에는 전체 선분으로 계산한다.
+        
+        Args:
+            lat, lng: 임의 형태의 점 좌표 배열 (라디안)
+            
+        Returns:
+            입력과 같은 형태의 최소 거리 배열 (km)
+        """
+        shape = np.shape(lat)
+        coords = self._tree_coords(np.ravel(lat), np.ravel(lng))
+        lat, lng = self._to_local(np.ravel(lat), np.ravel(lng))
+        dists = np.empty(lat.shape[0], dtype=self._dtype)
+        
+        pending = np.arange(lat.shape[0])
+        for k in _KDTREE_CANDIDATES:
+            if k >= len(self._cs_lat) or len(pending) == 0:
+                break
+            tree_dist, cand = self._curve_tree.query(coords[pending], k=k)
+            p_lat = lat[pending, None]
+            p_lng = lng[pending, None]
+            
+            # 후보 선분에 대해 전체 계산과 같은 식으로 투영/거리 계산
+            t_proj = ((p_lng - self._cs_lng[cand]) * self._seg_dx[cand] +
+                      (p_lat - self._cs_lat[cand]) * self._seg_dy[cand]) / self._seg_len_sq[cand]
+            t_proj = np.clip(t_proj, 0.0, 1.0)
+            t_proj[self._seg_is_point[cand]] = 0.0
+            
+            proj_lat = t_proj * self._seg_dy[cand] + self._cs_lat[cand]
+            proj_lng = t_proj * self._seg_dx[cand] + self._cs_lng[cand]
+            found = self._min_distance_in_place(
+                p_lat, p_lng, proj_lat, proj_lng, t_proj, np.empty_like(t_proj)
+            )
+            
+            # 후보 밖 선분까지 거리의 하한
+            lower = (self._tree_distance_km(tree_dist[:, -1]) * (1 - self._tree_margin) -
+                     self._max_half_km * (1 + self._tree_margin))
+            sure = found <= lower
+            dists[pending[sure]] = found[sure]
+            pending = pending[~sure]
+        
+        if len(pending):
+            dists[pending] = self._min_distance_full(lat[pending], lng[pending])
+        
+        return dists.reshape(shape)
+    
+    def _min_distance_full(self, lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+        """
+        점 배열(라디안)에서 모든 선분에 대한 최소 거리
+        
+        (점, 선분) 임시 배열은 재사용 버퍼에 in-place로 계산한다.
+        
+        Args:
+            lat, lng: 임의 형태의 점 좌표 배열 (라디안, _to_local로 변환된 좌표)
+            
+        Returns:
+            입력과 같은 형태의 최소 거리 배열 (km)
+        """
+        lat = lat[..., None]
+        lng = lng[..., None]
+        t_proj, proj_lat, proj_lng, work = self._scratch_buffers(lat.shape[:-1] + self._cs_lat.shape)
+        
+        # 모든 점을 모든 선분에 투영 (0~1로 제한, 길이 0 선분은 시작점)
+        np.subtract(lng, self._cs_lng, out=t_proj)
+        t_proj *= self._seg_dx
+        np.subtract(lat, self._cs_lat, out=work)
+        work *= self._seg_dy
+        t_proj += work
+        t_proj /= self._seg_len_sq
+        np.clip(t_proj, 0.0, 1.0, out=t_proj)
+        t_proj[..., self._seg_is_point] = 0.0
+        
+        np.multiply(t_proj, self._seg_dy, out=proj_lat)
+        proj_lat += self._cs_lat
+        np.multiply(t_proj, self._seg_dx, out=proj_lng)
+        proj_lng += self._cs_lng
+        
+        return self._min_distance_in_place(lat, lng, proj_lat, proj_lng, t_proj, work)
+    
+    def _scratch_buffers(self, shape: Tuple[int, ...]) -> Tuple[np.ndarray, ...]:
+        """
+        (점, 선분) 계산용 버퍼 4개 (직전과 같은 형태면 재사용)
+        
+        엣지 하나(샘플 3개)나 같은 크기의 배치 청크가 반복되므로 할당을 한 번으로 줄인다.
+        계산기는 탐색마다 따로 만들어지므로 스레드 간에 공유되지 않는다.
+        """
+        if self._scratch is None or self._scratch[0].shape != shape:
+            self._scratch = tuple(np.empty(shape, dtype=self._dtype) for _ in range(4))
+        return self._scratch
+    
+    def _min_distance_in_place(
+        self,
+        lat: np.ndarray,
+        lng: np.ndarray,
+        proj_lat: np.ndarray,
+        proj_lng: np.ndarray,
+        tmp: np.ndarray,
+        work: np.ndarray
+    ) -> np.ndarray:
+        """
+        점-투영점 거리의 마지막 축 최소값 (km, _distance_vec과 같은 식)
+        
+        거리는 중간값(haversine a 또는 평면 거리 제곱)에 대해 단조 증가이므로
+        중간값의 최소만 거리로 변환한다. proj_lat, proj_lng, tmp, work는 덮어쓴다.
+        """
+        if self.fast_distance:
+            np.subtract(proj_lat, lat, out=work)
+            np.square(work, out=work)
+            np.subtract(proj_lng, lng, out=tmp)
+            tmp *= self._cos_lat0
+            np.square(tmp, out=tmp)
+            work += tmp
+            return EARTH_RADIUS_KM * np.sqrt(work.min(axis=-1))
+        
+        # a = sin²(dlat/2) + cos(lat1)·cos(lat2)·sin²(dlng/2)
+        np.subtract(proj_lat, lat, out=work)
+        work /= 2
+        np.sin(work, out=work)
+        np.square(work, out=work)
+        
+        np.subtract(proj_lng, lng, out=tmp)
+        tmp /= 2
+        np.sin(tmp, out=tmp)
+        np.square(tmp, out=tmp)
+        
+        if self._lat0:
+            lat = lat + self._lat0
+            proj_lat += self._lat0
+        np.cos(proj_lat, out=proj_lat)
+        np.multiply(np.cos(lat), proj_lat, out=proj_lat)
+        proj_lat *= tmp
+        work += proj_lat
+        
+        return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(work.min(axis=-1)))
+    
+    def _distance_vec(self, lat1, lng1, lat2, lng2):
+        """점-투영점 거리 (km, 라디안 입력): 설정에 따라 Haversine 또는 등장방형 근사"""
+        if self.fast_distance:
+            return _equirect_vec(lat1, lng1, lat2, lng2, self._cos_lat0)
+        return _haversine_vec(lat1, lng1, lat2, lng2, self._lat0)
     
     def calculate_path_distance(self, path: List[int], graph: RoadGraph) -> float:
         """
@@ -142,22 +556,19 @@ class ShapeDistanceCalculator:
         """
         점에서 목표 곡선까지의 최소 거리 계산
         
+        모든 선분에 대한 투영과 Haversine 거리를 배열 연산 한 번으로 계산
+        (_point_to_segment_distance를 선분마다 호출하는 것과 같은 결과, 긴 곡선은 KD-tree 후보만 계산)
+        
         Args:
             point: 대상 점
             
         Returns:
             최소 거리 (km)
         """
-        min_distance = float('inf')
-        
-        for i in range(len(self.target_curve) - 1):
-            seg_start = self.target_curve[i]
-            seg_end = self.target_curve[i + 1]
-            
-            dist = self._point_to_segment_distance(point, seg_start, seg_end)
-            min_distance = min(min_distance, dist)
+        lat = np.array([math.radians(point.lat)])
+        lng = np.array([math.radians(point.lng)])
         
-        return min_distance
+        return float(self._min_distance_to_segments(lat, lng)[0])
     
     def _point_to_segment_distance(
         self,
@@ -247,6 +658,15 @@ class LengthPenaltyCalculator:
         if len(path) < 2:
             return 0.0
         
+        # CSR 배열에서 구간별 슬롯을 한 번에 조회 (엣지 없는 구간은 제외)
+        csr = graph.build_csr()
+        idx = csr.path_indices(path)
+        if idx is not None:
+            slots = csr.find_slots(idx[:-1], idx[1:])
+            # 순차 합산으로 A* 누적 길이(finalize 입력)와 같은 값 유지
+            return sum(csr.edge_len[slots[slots >= 0]].tolist())
+        
+        # 그래프에 없는 노드가 포함된 경로는 엣지 조회로 계산
         total_length = 0.0
         for i in range(len(path) - 1):
             edge = graph.get_edge_between(path[i], path[i + 1])
@@ -315,8 +735,14 @@ class CrossingPenaltyCalculator:
         if len(path) <= 2:
             return 0
         
+        # 중간 노드만 카운트 (시작점, 끝점 제외): 노드 인덱스별 0/1 마스크를 한 번에 수집
+        csr = graph.build_csr()
+        idx = csr.path_indices(path[1:-1])
+        if idx is not None:
+            return int(csr.node_light[idx].sum())
+        
+        # 그래프에 없는 노드가 포함된 경로는 노드별 조회
         count = 0
-        # 중간 노드만 카운트 (시작점, 끝점 제외)
         for node_id in path[1:-1]:
             node = graph.get_node(node_id)
             if node and node.has_traffic_light:
@@ -360,12 +786,17 @@ class CostCalculator:
     ShapeDistance, LengthPenalty, CrossingPenalty를 통합하여 계산
     """
     
+    # 경로 비용 캐시 최대 항목 수
+    COST_CACHE_SIZE = 4096
+    
     def __init__(
         self,
         target_curve: List[Coordinate],
         target_distance_km: float,
         max_crossings: int,
-        weights: Tuple[float, float, float] = (1.0, 1.0, 1.0)
+        weights: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        fast_distance: bool = False,
+        use_float32: bool = False
     ):
         """
         Args:
@@ -373,12 +804,44 @@ class CostCalculator:
             target_distance_km: 목표 거리 (km)
             max_crossings: 허용 최대 횡단보도 개수
             weights: (shape, length, crossing) 가중치 튜플
+            fast_distance: 도형 거리에 등장방형 근사 거리 사용 여부
+            use_float32: 도형 거리 NumPy 경로를 float32로 계산할지 여부
         """
-        self.shape_calculator = ShapeDistanceCalculator(target_curve, target_distance_km)
+        self.shape_calculator = ShapeDistanceCalculator(
+            target_curve, target_distance_km,
+            fast_distance=fast_distance, use_float32=use_float32
+        )
         self.length_calculator = LengthPenaltyCalculator(target_distance_km)
         self.crossing_calculator = CrossingPenaltyCalculator(max_crossings)
         self.weights = weights
         self.target_distance_km = target_distance_km
+        
+        # 경로 비용 캐시 (LRU): 노드 ID 튜플 -> CostResult
+        # 캐시를 채운 그래프의 CSR 스냅샷이 바뀌면(다른 그래프, 그래프 변경) 비움
+        self._cost_cache: "OrderedDict[Tuple[int, ...], CostResult]" = OrderedDict()
+        self._cost_cache_csr = None
+    
+    def clear_cost_cache(self) -> None:
+        """경로 비용 캐시 비우기"""
+        self._cost_cache.clear()
+        self._cost_cache_csr = None
+    
+    def _sync_graph(self, graph: RoadGraph) -> CSRAdjacency:
+        """
+        그래프의 CSR 스냅샷이 바뀌었으면 (다른 그래프, 그래프 변경) 경로 비용 캐시와 엣지 거리 캐시를 함께 비움
+        
+        Args:
+            graph: 도로 그래프
+            
+        Returns:
+            graph.build_csr() 결과
+        """
+        csr = graph.build_csr()
+        if csr is not self._cost_cache_csr:
+            self._cost_cache.clear()
+            self.shape_calculator.clear_cache()
+            self._cost_cache_csr = csr
+        return csr
     
     def calculate(self, path: List[int], graph: RoadGraph) -> CostResult:
         """
@@ -397,10 +860,84 @@ class CostCalculator:
         if len(path) < 2:
             raise ValueError("경로는 최소 2개 이상의 노드가 필요합니다")
         
-        # 각 비용 계산 (정규화)
-        shape_distance = self.shape_calculator.calculate_normalized_distance(path, graph)
-        length_penalty = self.length_calculator.calculate_normalized_penalty(path, graph)
-        crossing_penalty = self.crossing_calculator.calculate_normalized_penalty(path, graph)
+        self._sync_graph(graph)
+        
+        key = tuple(path)
+        cached = self._cost_cache.get(key)
+        if cached is not None:
+            self._cost_cache.move_to_end(key)
+            return cached
+        
+        # 원시 값 계산 후 정규화/가중치 적용은 finalize에 위임
+        shape_distance_km, path_length_km, traffic_light_count = self._walk_path(path, graph)
+        result = self.finalize(shape_distance_km, path_length_km, traffic_light_count)
+        
+        self._cost_cache[key] = result
+        if len(self._cost_cache) > self.COST_CACHE_SIZE:
+            self._cost_cache.popitem(last=False)
+        return result
+
+    def _walk_path(self, path: List[int], graph: RoadGraph) -> Tuple[float, float, int]:
+        """
+        경로를 한 번만 순회하여 원시 값 계산
+        
+        노드 ID → CSR 인덱스 변환을 한 번 하고 그 인덱스로 엣지 길이와 신호등을 함께 조회한다.
+        그래프에 없는 노드가 있으면 계산기별 메서드로 계산한다 (결과 동일).
+        
+        Args:
+            path: 노드 ID 목록 (2개 이상)
+            graph: 도로 그래프
+            
+        Returns:
+            (도형 거리 합 km, 경로 길이 km, 신호등 개수)
+        """
+        csr = graph.build_csr()
+        idx = csr.path_indices(path)
+        if idx is None:
+            return (
+                self.shape_calculator.calculate_path_distance(path, graph),
+                self.length_calculator.calculate_path_length(path, graph),
+                self.crossing_calculator.count_traffic_lights(path, graph),
+            )
+        
+        nodes = graph.nodes
+        edge_distance = self.shape_calculator.calculate_edge_distance
+        shape_distance_km = 0.0
+        for u, v in zip(path, path[1:]):
+            shape_distance_km += edge_distance(nodes[u], nodes[v])
+        
+        slots = csr.find_slots(idx[:-1], idx[1:])
+        path_length_km = sum(csr.edge_len[slots[slots >= 0]].tolist())
+        traffic_light_count = int(csr.node_light[idx[1:-1]].sum())
+        
+        return shape_distance_km, path_length_km, traffic_light_count
+    
+    def finalize(
+        self,
+        shape_distance_km: float,
+        path_length_km: float,
+        traffic_light_count: int
+    ) -> CostResult:
+        """
+        누적된 원시 값으로 비용 결과 생성 (경로 재순회 없음)
+        
+        A* 탐색 중 엣지마다 누적한 값으로 calculate()와 동일한 결과를 O(1)에 계산
+        
+        Args:
+            shape_distance_km: 엣지별 도형 거리 합 (km)
+            path_length_km: 경로 길이 (km)
+            traffic_light_count: 신호등 개수 (시작점, 끝점 제외)
+            
+        Returns:
+            CostResult 객체
+        """
+        target = self.target_distance_km
+        max_crossings = self.crossing_calculator.max_crossings
+        
+        # 각 비용 정규화
+        shape_distance = shape_distance_km / target
+        length_penalty = abs(path_length_km - target) / target
+        crossing_penalty = max(0, traffic_light_count - max_crossings) / (max_crossings + 1)
         
         # 가중치 적용 총 비용
         total_cost = (
@@ -409,10 +946,6 @@ class CostCalculator:
             self.weights[2] * crossing_penalty
         )
         
-        # 추가 정보
-        path_length_km = self.length_calculator.calculate_path_length(path, graph)
-        traffic_light_count = self.crossing_calculator.count_traffic_lights(path, graph)
-        
         return CostResult(
             shape_distance=shape_distance,
             length_penalty=length_penalty,
@@ -422,6 +955,41 @@ class CostCalculator:
             traffic_light_count=traffic_light_count
         )
     
+    def precompute_edge_costs(self, graph: RoadGraph) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        그래프의 모든 방향 엣지(CSR 슬롯) 비용을 배열 연산으로 한 번에 계산
+        
+        calculate_edge_terms를 엣지마다 호출하는 것과 같은 값이며,
+        도형 거리는 ShapeDistanceCalculator 캐시에도 채워서 이후 calculate()와 일치시킨다.
+        
+        Args:
+            graph: 도로 그래프
+            
+        Returns:
+            (엣지 비용, 도형 거리 km) 배열 튜플 (graph.build_csr() 슬롯 순서)
+        """
+        csr = self._sync_graph(graph)
+        node_lat, node_lng = csr.node_lat, csr.node_lng
+        src, dst = csr.src_idx, csr.nbr_idx
+        
+        shape_dist = self.shape_calculator.calculate_edge_distances(
+            node_lat[src], node_lng[src], node_lat[dst], node_lng[dst]
+        )
+        
+        # 도형 거리 캐시 채우기 (기본 샘플 수 3)
+        self.shape_calculator.put_edge_distances(
+            csr.node_ids[src].tolist(), csr.node_ids[dst].tolist(), shape_dist.tolist()
+        )
+        
+        target = self.target_distance_km
+        crossing_unit = 1.0 / (self.crossing_calculator.max_crossings + 1)
+        edge_cost = (
+            self.weights[0] * (shape_dist / target) +
+            self.weights[1] * (csr.edge_len / target) +
+            self.weights[2] * np.where(csr.edge_light != 0, crossing_unit, 0.0)
+        )
+        return edge_cost, shape_dist
+    
     def calculate_edge_cost(
         self,
         node1: Node,
@@ -441,6 +1009,25 @@ class CostCalculator:
         Returns:
             엣지 비용
         """
+        return self.calculate_edge_terms(node1, node2, edge)[0]
+    
+    def calculate_edge_terms(
+        self,
+        node1: Node,
+        node2: Node,
+        edge: Edge
+    ) -> Tuple[float, float]:
+        """
+        엣지 비용과 도형 거리를 함께 계산 (A* 누적용)
+        
+        Args:
+            node1: 시작 노드
+            node2: 끝 노드
+            edge: 엣지
+            
+        Returns:
+            (엣지 비용, 도형 거리 km)
+        """
         # 도형 거리
         shape_dist = self.shape_calculator.calculate_edge_distance(node1, node2)
         shape_cost = shape_dist / self.target_distance_km
@@ -453,8 +1040,9 @@ class CostCalculator:
         if node2.has_traffic_light:
             crossing_cost = 1.0 / (self.crossing_calculator.max_crossings + 1)
         
-        return (
+        edge_cost = (
             self.weights[0] * shape_cost +
             self.weights[1] * length_cost +
             self.weights[2] * crossing_cost
         )
+        return edge_cost, shape_dist
@@ -0,0 +1,45 @@
+"""
+최근접 노드 JIT 커널
+노드 좌표 배열 전체에 대한 Haversine 최소 탐색을 스칼라 루프 하나로 처리하여
+NumPy 경로의 (N,) 임시 배열(sin/cos 중간값) 없이 계산 (numba 미설치 시 RoadGraph가 NumPy 경로 사용)
+"""
+import math
+
+import numpy as np
+
+from src._jit import njit
+
+
+# parallel=True(prange)는 사용하지 않음: 검색 서비스가 RouteFinder를 스레드 풀로 돌리므로
+# (프로세스 모드는 spawn) 호출 스레드마다 numba 스레드 풀이 겹치고,
+# 노드 수만 개 규모에서는 단일 스레드 루프도 1ms 미만
+@njit(cache=True, fastmath=True)
+def nearest_node_index(node_lat: np.ndarray, node_lng: np.ndarray, lat: float, lng: float) -> int:
+    """
+    주어진 좌표에서 Haversine 거리가 가장 가까운 노드 인덱스
+
+    거리는 중간값 a에 대해 단조 증가하므로 a만 비교하며, 동률이면 앞선 인덱스를 반환한다.
+
+    Args:
+        node_lat, node_lng: 노드 좌표 배열 (도)
+        lat, lng: 기준 좌표 (도)
+
+    Returns:
+        최근접 노드 인덱스 (노드가 없으면 -1)
+    """
+    deg2rad = math.pi / 180.0
+    lat_rad = lat * deg2rad
+    lng_rad = lng * deg2rad
+    cos_lat = math.cos(lat_rad)
+
+    best = np.inf
+    best_idx = -1
+    for i in range(node_lat.shape[0]):
+        node_lat_rad = node_lat[i] * deg2rad
+        s_lat = math.sin((node_lat_rad - lat_rad) / 2)
+        s_lng = math.sin((node_lng[i] * deg2rad - lng_rad) / 2)
+        a = s_lat * s_lat + cos_lat * math.cos(node_lat_rad) * s_lng * s_lng
+        if a < best:
+            best = a
+            best_idx = i
+    return best_idx
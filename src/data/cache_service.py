@@ -5,9 +5,22 @@
 import hashlib
 import json
 import logging
+import os
 import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, BinaryIO
+
+import numpy as np
+
+try:
+    import orjson  # 선택 의존성: 미설치 시 표준 json 사용
+except ImportError:
+    orjson = None
 
 from src.data.entities import Node, Edge, RoadGraph, RoadType
 from src.domain.entities import BoundingBox
@@ -15,6 +28,9 @@ from src.domain.entities import BoundingBox
 
 logger = logging.getLogger(__name__)
 
+# 도로 타입 값 → RoadType 멤버 (역직렬화 시 Enum 생성자 호출 생략)
+_ROAD_TYPES: Dict[str, RoadType] = {road_type.value: road_type for road_type in RoadType}
+
 
 class GraphCacheService:
     """
@@ -23,14 +39,31 @@ class GraphCacheService:
     파일 시스템 기반 캐싱으로 동일 영역 재요청 시 빠른 응답 제공
     """
     
-    def __init__(self, cache_dir: str = ".cache/graphs"):
+    # 디스크에서 읽은 그래프를 프로세스 메모리에 보관하는 최대 개수 (LRU)
+    MEMORY_CACHE_SIZE = 8
+    # 캐시 통계용 파일 크기 목록을 디렉토리 재조회로 맞추는 주기 (초, 다른 프로세스의 변경 반영)
+    STATS_RESYNC_SECONDS = 300.0
+    # 캐시 파일 확장자 (조회 우선순위 순)
+    CACHE_EXTENSIONS = (".npz", ".json", ".pkl")
+    
+    def __init__(self, cache_dir: str = ".cache/graphs", allow_pickle: bool = False):
         """
         캐시 서비스 초기화
         
         Args:
             cache_dir: 캐시 파일 저장 디렉토리
+            allow_pickle: 이전 형식 pickle 캐시(.pkl) 로드 허용 여부.
+                pickle은 로드 시 임의 코드를 실행할 수 있어 기본값은 사용 안 함 (npz로 다시 저장됨)
         """
         self.cache_dir = Path(cache_dir)
+        self.allow_pickle = allow_pickle
+        # 캐시 키 → 로드된 그래프 (같은 영역 재조회 시 파일 읽기/객체 생성 생략, 읽기 전용으로 공유)
+        self._memory_cache: "OrderedDict[str, RoadGraph]" = OrderedDict()
+        # 인스턴스를 여러 스레드(Streamlit 세션 등)가 공유할 수 있으므로 LRU 조작(순서 갱신/제거)은 잠금 안에서 수행
+        self._memory_lock = threading.Lock()
+        # 파일명 → 크기 (첫 get_cache_stats에서 디렉토리를 조회해 만들고 set/delete/clear_all에서 갱신)
+        self._file_sizes: Optional[Dict[str, int]] = None
+        self._file_sizes_synced_at = 0.0
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"캐시 디렉토리 초기화: {self.cache_dir}")
     
@@ -58,8 +91,8 @@ class GraphCacheService:
         else:
             key_data = f"point_{lat}_{lng}_{distance_m}_{network_type}"
         
-        # MD5 해시로 파일명 생성
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # BLAKE2b(16바이트) 해시로 파일명 생성 (MD5보다 빠르고 길이는 같은 32자)
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
     
     def get(self, cache_key: str) -> Optional[RoadGraph]:
         """
@@ -71,7 +104,32 @@ class GraphCacheService:
         Returns:
             캐시된 그래프 (없으면 None)
         """
-        # JSON 캐시 우선 확인
+        with self._memory_lock:
+            graph = self._memory_cache.get(cache_key)
+            if graph is not None:
+                self._memory_cache.move_to_end(cache_key)
+        if graph is not None:
+            logger.debug(f"캐시 히트 (메모리): {cache_key}")
+            return graph
+        
+        graph = self._load_from_disk(cache_key)
+        if graph is not None:
+            self._remember(cache_key, graph)
+        return graph
+    
+    def _load_from_disk(self, cache_key: str) -> Optional[RoadGraph]:
+        """캐시 파일(npz → JSON → pickle 순)에서 그래프 로드"""
+        # 배열(npz) 캐시 우선 확인
+        npz_file = self.cache_dir / f"{cache_key}.npz"
+        if npz_file.exists():
+            try:
+                graph = self._load_from_npz(npz_file)
+                logger.info(f"캐시 히트 (npz): {cache_key}")
+                return graph
+            except Exception as e:
+                logger.warning(f"npz 캐시 로드 실패: {e}")
+        
+        # 이전 형식인 JSON 캐시 확인 (하위 호환)
         json_file = self.cache_dir / f"{cache_key}.json"
         if json_file.exists():
             try:
@@ -82,9 +140,11 @@ class GraphCacheService:
             except Exception as e:
                 logger.warning(f"JSON 캐시 로드 실패: {e}")
 
-        # 기존 pickle 캐시 확인 (하위 호환)
+        # 기존 pickle 캐시 확인 (하위 호환, allow_pickle일 때만)
         pkl_file = self.cache_dir / f"{cache_key}.pkl"
-        if pkl_file.exists():
+        if pkl_file.exists() and not self.allow_pickle:
+            logger.info(f"pickle 캐시 무시 (allow_pickle=False): {cache_key}")
+        elif pkl_file.exists():
             try:
                 with open(pkl_file, 'rb') as f:
                     graph = pickle.load(f)
@@ -96,9 +156,39 @@ class GraphCacheService:
         logger.debug(f"캐시 미스: {cache_key}")
         return None
     
+    def get_arrays(
+        self,
+        cache_key: str,
+        columns: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        npz 캐시에서 노드/엣지 열 배열만 조회 (Node/Edge 객체를 만들지 않음)
+        
+        좌표나 신호등 여부처럼 배열만 필요한 경우 그래프 구성 비용 없이 사용한다.
+        npz는 열 단위로 압축되어 있어 요청한 열만 읽는다.
+        
+        Args:
+            cache_key: 캐시 키
+            columns: 읽을 열 이름 (예: "node_lat", "edge_len"). None이면 전체
+            
+        Returns:
+            열 이름 → 배열 딕셔너리 (npz 캐시가 없거나 읽기 실패 시 None)
+        """
+        npz_file = self.cache_dir / f"{cache_key}.npz"
+        if not npz_file.exists():
+            return None
+        
+        try:
+            with np.load(npz_file, allow_pickle=False) as data:
+                names = data.files if columns is None else columns
+                return {name: data[name] for name in names}
+        except Exception as e:
+            logger.warning(f"npz 배열 로드 실패: {e}")
+            return None
+    
     def set(self, cache_key: str, graph: RoadGraph) -> bool:
         """
-        그래프를 캐시에 저장(JSON 형식)
+        그래프를 캐시에 저장 (노드/엣지 열 배열을 담은 npz 형식)
         
         Args:
             cache_key: 캐시 키
@@ -107,75 +197,98 @@ class GraphCacheService:
         Returns:
             저장 성공 여부
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        cache_file = self.cache_dir / f"{cache_key}.npz"
         
         try:
-            self._save_to_json(graph, cache_file)
+            self._save_to_npz(graph, cache_file)
+            if self._file_sizes is not None:
+                self._file_sizes[cache_file.name] = cache_file.stat().st_size
+            # 같은 키의 이전 그래프가 메모리에 남지 않도록 제거 (다음 get에서 파일로부터 로드)
+            with self._memory_lock:
+                self._memory_cache.pop(cache_key, None)
             logger.info(f"캐시 저장: {cache_key} ({graph.node_count} 노드, {graph.edge_count} 엣지)")
             return True
         except Exception as e:
             logger.error(f"캐시 저장 실패: {e}")
             return False
     
-    def _save_to_json(self, graph: RoadGraph, filepath: Path) -> None:
-        """그래프를 JSON 파일로 저장"""
-        data = {
-            "nodes": [
-                {
-                    "id": node.id,
-                    "lat": node.lat,
-                    "lng": node.lng,
-                    "has_traffic_light": node.has_traffic_light
-                }
-                for node in graph.nodes.values()
-            ],
-            "edges": [
-                {
-                    "id": edge.id,
-                    "source_id": edge.source_id,
-                    "target_id": edge.target_id,
-                    "length_m": edge.length_m,
-                    "road_type": edge.road_type.value,
-                    "name": edge.name,
-                    "is_oneway": edge.is_oneway
-                }
-                for edge in graph.edges.values()
-            ]
-        }
+    def _remember(self, cache_key: str, graph: RoadGraph) -> None:
+        """메모리 캐시에 그래프 등록 (최대 개수 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        with self._memory_lock:
+            self._memory_cache[cache_key] = graph
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _save_to_npz(self, graph: RoadGraph, filepath: Path) -> None:
+        """
+        그래프를 열 단위 NumPy 배열로 저장 (npz 압축)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
+        엣지 이름은 None과 빈 문자열을 구분하기 위해 별도 마스크로 저장한다.
+        임시 파일에 다 쓴 뒤 교체하므로 저장 도중 중단되어도 깨진 캐시 파일이 남지 않는다.
+        """
+        nodes = list(graph.nodes.values())
+        edges = list(graph.edges.values())
+        
+        with _atomic_write(filepath) as f:
+            np.savez_compressed(
+                f,
+                node_id=np.array([node.id for node in nodes], dtype=np.int64),
+                node_lat=np.array([node.lat for node in nodes], dtype=np.float64),
+                node_lng=np.array([node.lng for node in nodes], dtype=np.float64),
+                node_has_light=np.array([node.has_traffic_light for node in nodes], dtype=bool),
+                edge_id=np.array([edge.id for edge in edges], dtype=np.int64),
+                edge_src=np.array([edge.source_id for edge in edges], dtype=np.int64),
+                edge_dst=np.array([edge.target_id for edge in edges], dtype=np.int64),
+                edge_len=np.array([edge.length_m for edge in edges], dtype=np.float64),
+                edge_type=np.array([edge.road_type.value for edge in edges], dtype=str),
+                edge_name=np.array([edge.name or "" for edge in edges], dtype=str),
+                edge_has_name=np.array([edge.name is not None for edge in edges], dtype=bool),
+                edge_oneway=np.array([edge.is_oneway for edge in edges], dtype=bool),
+            )
     
-    def _load_from_json(self, filepath: Path) -> Optional[RoadGraph]:
-        """JSON 파일에서 그래프 로드"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def _load_from_npz(self, filepath: Path) -> RoadGraph:
+        """npz 파일에서 그래프 로드 (열 배열을 한 번에 파이썬 값으로 변환 후 객체 생성)"""
+        with np.load(filepath, allow_pickle=False) as data:
+            node_cols = [data[k].tolist() for k in ("node_id", "node_lat", "node_lng", "node_has_light")]
+            edge_cols = [
+                data[k].tolist()
+                for k in ("edge_id", "edge_src", "edge_dst", "edge_len",
+                          "edge_type", "edge_name", "edge_has_name", "edge_oneway")
+            ]
         
         graph = RoadGraph()
+        for node_id, lat, lng, has_light in zip(*node_cols):
+            graph.add_node(Node(id=node_id, lat=lat, lng=lng, has_traffic_light=has_light))
         
-        for node_data in data.get("nodes", []):
-            node = Node(
-                id=node_data["id"],
-                lat=node_data["lat"],
-                lng=node_data["lng"],
-                has_traffic_light=node_data.get("has_traffic_light", False)
-            )
-            graph.add_node(node)
+        for edge_id, src, dst, length_m, road_type, name, has_name, oneway in zip(*edge_cols):
+            graph.add_edge(Edge(
+                id=edge_id,
+                source_id=src,
+                target_id=dst,
+                length_m=length_m,
+                road_type=_ROAD_TYPES[road_type],
+                name=name if has_name else None,
+                is_oneway=oneway
+            ))
         
-        for edge_data in data.get("edges", []):
-            road_type = RoadType(edge_data.get("road_type", "unknown"))
-            edge = Edge(
-                id=edge_data["id"],
-                source_id=edge_data["source_id"],
-                target_id=edge_data["target_id"],
-                length_m=edge_data["length_m"],
-                road_type=road_type,
-                name=edge_data.get("name"),
-                is_oneway=edge_data.get("is_oneway", False)
-            )
-            graph.add_edge(edge)
+        # 캐시 그래프는 읽기 전용으로 공유되므로 고정하면서 CSR/색인을 미리 생성
+        return graph.freeze()
+    
+    def _save_to_json(self, graph: RoadGraph, filepath: Path) -> None:
+        """그래프를 JSON 파일로 저장"""
+        with _atomic_write(filepath) as f:
+            _write_graph_json(f, graph)
+    
+    def _load_from_json(self, filepath: Path) -> Optional[RoadGraph]:
+        """JSON 파일에서 그래프 로드"""
+        with open(filepath, 'rb') as f:
+            data = _json_loads(f.read())
         
-        return graph
+        graph = _graph_from_dict(data)
+        
+        # 캐시 그래프는 읽기 전용으로 공유되므로 고정하면서 CSR/색인을 미리 생성
+        return graph.freeze()
     
     def delete(self, cache_key: str) -> bool:
         """
@@ -187,12 +300,16 @@ class GraphCacheService:
         Returns:
             삭제 성공 여부
         """
+        with self._memory_lock:
+            self._memory_cache.pop(cache_key, None)
         try:
-            # JSON과 pickle 둘 다 삭제
-            for ext in [".json", ".pkl"]:
+            # npz, JSON, pickle 모두 삭제
+            for ext in self.CACHE_EXTENSIONS:
                 cache_file = self.cache_dir / f"{cache_key}{ext}"
                 if cache_file.exists():
                     cache_file.unlink()
+                    if self._file_sizes is not None:
+                        self._file_sizes.pop(cache_file.name, None)
                     logger.info(f"캐시 삭제: {cache_key}{ext}")
             return True
         except Exception as e:
@@ -206,12 +323,16 @@ class GraphCacheService:
         Returns:
             삭제된 파일 수
         """
+        with self._memory_lock:
+            self._memory_cache.clear()
         count = 0
-        for ext in ["*.json", "*.pkl"]:
-            for cache_file in self.cache_dir.glob(ext):
+        for ext in self.CACHE_EXTENSIONS:
+            for cache_file in self.cache_dir.glob(f"*{ext}"):
                 try:
                     cache_file.unlink()
                     count += 1
+                    if self._file_sizes is not None:
+                        self._file_sizes.pop(cache_file.name, None)
                 except Exception as e:
                     logger.warning(f"캐시 파일 삭제 실패: {cache_file}, {e}")
         
@@ -222,56 +343,46 @@ class GraphCacheService:
         """
         캐시 통계 반환
         
+        파일 크기 목록을 유지하므로 매 호출마다 디렉토리를 조회하지 않으며,
+        STATS_RESYNC_SECONDS가 지나면 다른 프로세스의 변경을 반영하도록 다시 조회한다.
+        
         Returns:
             캐시 통계 딕셔너리
         """
-        cache_files = list(self.cache_dir.glob("*.json")) + list(self.cache_dir.glob("*.pkl"))
-        total_size = sum(f.stat().st_size for f in cache_files)
+        now = time.monotonic()
+        if self._file_sizes is None or now - self._file_sizes_synced_at > self.STATS_RESYNC_SECONDS:
+            self._file_sizes = {
+                f.name: f.stat().st_size
+                for ext in self.CACHE_EXTENSIONS for f in self.cache_dir.glob(f"*{ext}")
+            }
+            self._file_sizes_synced_at = now
         
         return {
             "cache_dir": str(self.cache_dir),
-            "file_count": len(cache_files),
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "file_count": len(self._file_sizes),
+            "total_size_mb": round(sum(self._file_sizes.values()) / (1024 * 1024), 2),
         }
     
-    def export_to_json(self, graph: RoadGraph, filepath: str) -> bool:
+    def export_to_json(self, graph: RoadGraph, filepath: str, pretty: bool = False) -> bool:
         """
         그래프를 JSON 형식으로 내보내기
         
+        기본은 노드/엣지를 한 건씩 직렬화해 바로 쓰므로 전체 딕셔너리를 메모리에 만들지 않는다.
+        
         Args:
             graph: 내보낼 그래프
             filepath: 저장 경로
+            pretty: True면 들여쓰기한 JSON으로 저장 (전체 딕셔너리를 만든 뒤 한 번에 직렬화)
             
         Returns:
             저장 성공 여부
         """
         try:
-            data = {
-                "nodes": [
-                    {
-                        "id": node.id,
-                        "lat": node.lat,
-                        "lng": node.lng,
-                        "has_traffic_light": node.has_traffic_light
-                    }
-                    for node in graph.nodes.values()
-                ],
-                "edges": [
-                    {
-                        "id": edge.id,
-                        "source_id": edge.source_id,
-                        "target_id": edge.target_id,
-                        "length_m": edge.length_m,
-                        "road_type": edge.road_type.value,
-                        "name": edge.name,
-                        "is_oneway": edge.is_oneway
-                    }
-                    for edge in graph.edges.values()
-                ]
-            }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                if pretty:
+                    f.write(_json_dumps(_graph_to_dict(graph), indent=True))
+                else:
+                    _write_graph_json(f, graph)
             
             logger.info(f"JSON 내보내기 완료: {filepath}")
             return True
@@ -290,37 +401,133 @@ class GraphCacheService:
             로드된 그래프 (실패 시 None)
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            graph = RoadGraph()
-            
-            # 노드 로드
-            for node_data in data.get("nodes", []):
-                node = Node(
-                    id=node_data["id"],
-                    lat=node_data["lat"],
-                    lng=node_data["lng"],
-                    has_traffic_light=node_data.get("has_traffic_light", False)
-                )
-                graph.add_node(node)
-            
-            # 엣지 로드
-            for edge_data in data.get("edges", []):
-                road_type = RoadType(edge_data.get("road_type", "unknown"))
-                edge = Edge(
-                    id=edge_data["id"],
-                    source_id=edge_data["source_id"],
-                    target_id=edge_data["target_id"],
-                    length_m=edge_data["length_m"],
-                    road_type=road_type,
-                    name=edge_data.get("name"),
-                    is_oneway=edge_data.get("is_oneway", False)
-                )
-                graph.add_edge(edge)
+            with open(filepath, 'rb') as f:
+                graph = _graph_from_dict(_json_loads(f.read()))
             
             logger.info(f"JSON 가져오기 완료: {filepath}")
             return graph
         except Exception as e:
             logger.error(f"JSON 가져오기 실패: {e}")
             return None
+
+
+@contextmanager
+def _atomic_write(filepath: Path) -> Iterator[BinaryIO]:
+    """
+    같은 디렉토리의 임시 파일에 쓴 뒤 대상 파일로 교체 (원자적 저장)
+    
+    쓰기 도중 예외가 나면 임시 파일을 지우고 기존 파일은 그대로 둔다.
+    
+    Args:
+        filepath: 최종 저장 경로
+        
+    Yields:
+        임시 파일 바이너리 핸들
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _json_dumps(data: Dict[str, Any], indent: bool = False) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트, orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Dict[str, Any]:
+    """JSON 역직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _node_record(node: Node) -> Dict[str, Any]:
+    """노드 JSON 레코드"""
+    return {
+        "id": node.id,
+        "lat": node.lat,
+        "lng": node.lng,
+        "has_traffic_light": node.has_traffic_light
+    }
+
+
+def _edge_record(edge: Edge) -> Dict[str, Any]:
+    """엣지 JSON 레코드"""
+    return {
+        "id": edge.id,
+        "source_id": edge.source_id,
+        "target_id": edge.target_id,
+        "length_m": edge.length_m,
+        "road_type": edge.road_type.value,
+        "name": edge.name,
+        "is_oneway": edge.is_oneway
+    }
+
+
+def _graph_to_dict(graph: RoadGraph) -> Dict[str, Any]:
+    """그래프를 JSON 직렬화용 딕셔너리로 변환"""
+    return {
+        "nodes": [_node_record(node) for node in graph.nodes.values()],
+        "edges": [_edge_record(edge) for edge in graph.edges.values()]
+    }
+
+
+def _write_graph_json(f: BinaryIO, graph: RoadGraph) -> None:
+    """
+    그래프를 {"nodes": [...], "edges": [...]} JSON으로 스트리밍 저장
+    
+    레코드를 한 건씩 직렬화해 쓰므로 _graph_to_dict 전체를 만들지 않는다 (내용은 동일).
+    """
+    f.write(b'{"nodes":[')
+    for i, node in enumerate(graph.nodes.values()):
+        if i:
+            f.write(b',')
+        f.write(_json_dumps(_node_record(node)))
+    f.write(b'],"edges":[')
+    for i, edge in enumerate(graph.edges.values()):
+        if i:
+            f.write(b',')
+        f.write(_json_dumps(_edge_record(edge)))
+    f.write(b']}')
+
+
+def _graph_from_dict(data: Dict[str, Any]) -> RoadGraph:
+    """JSON 딕셔너리에서 그래프 생성 (선택 필드는 기본값 적용)"""
+    graph = RoadGraph()
+    add_node = graph.add_node
+    add_edge = graph.add_edge
+    
+    # 노드 로드
+    for node_data in data.get("nodes", ()):
+        add_node(Node(
+            node_data["id"],
+            node_data["lat"],
+            node_data["lng"],
+            node_data.get("has_traffic_light", False)
+        ))
+    
+    # 엣지 로드 (도로 타입은 Enum 호출 대신 값 → 멤버 딕셔너리로 조회)
+    for edge_data in data.get("edges", ()):
+        add_edge(Edge(
+            edge_data["id"],
+            edge_data["source_id"],
+            edge_data["target_id"],
+            edge_data["length_m"],
+            _ROAD_TYPES[edge_data.get("road_type", "unknown")],
+            edge_data.get("name"),
+            edge_data.get("is_oneway", False)
+        ))
+    
+    return graph
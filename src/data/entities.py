@@ -2,10 +2,17 @@
 데이터 레이어 엔티티 정의
 도로 네트워크 그래프 구조
 """
-from dataclasses import dataclass, field
+import math
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+import numpy as np
+
+from src._jit import HAS_NUMBA
+from src.data._kernels import nearest_node_index
+
 
 class RoadType(Enum):
     """도로 타입"""
@@ -19,7 +26,45 @@ class RoadType(Enum):
     UNKNOWN = "unknown"           # 알 수 없음
 
 
-@dataclass(frozen=True)
+EARTH_RADIUS_KM = 6371.0
+
+
+def _haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    두 좌표 사이의 Haversine 거리 (km)
+    
+    Args:
+        lat1, lng1: 첫 번째 좌표 (도)
+        lat2, lng2: 두 번째 좌표 (도)
+        
+    Returns:
+        거리 (km)
+    """
+    lat1, lng1 = math.radians(lat1), math.radians(lng1)
+    lat2, lng2 = math.radians(lat2), math.radians(lng2)
+    
+    dlat = lat2 - lat1
+    dlng = lng2 - lng1
+    
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
+    return EARTH_RADIUS_KM * 2 * math.asin(math.sqrt(a))
+
+
+def _slots_setstate(self, state) -> None:
+    """
+    슬롯 데이터클래스 pickle 복원
+    
+    슬롯 도입 이전에 저장된 pickle은 __dict__(dict) 형태, 이후는 필드 값 목록 형태
+    """
+    if isinstance(state, dict):
+        items = state.items()
+    else:
+        items = zip((f.name for f in fields(self)), state)
+    for name, value in items:
+        object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True, slots=True)
 class Node:
     """
     교차로/노드 데이터 모델
@@ -35,6 +80,9 @@ class Node:
     lng: float
     has_traffic_light: bool = False
     
+    # 인스턴스 __dict__ 없이 고정 슬롯으로 속성 접근 (탐색 루프의 속성 조회 비용 감소)
+    __setstate__ = _slots_setstate
+    
     def to_tuple(self) -> Tuple[float, float]:
         """위도, 경도 튜플 반환"""
         return (self.lat, self.lng)
@@ -49,20 +97,7 @@ class Node:
         Returns:
             거리 (km)
         """
-        import math
-        
-        R = 6371  # 지구 반지름 (km)
-        
-        lat1, lng1 = math.radians(self.lat), math.radians(self.lng)
-        lat2, lng2 = math.radians(other.lat), math.radians(other.lng)
-        
-        dlat = lat2 - lat1
-        dlng = lng2 - lng1
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        return R * c
+        return _haversine_km(self.lat, self.lng, other.lat, other.lng)
     
     def distance_to_coord(self, lat: float, lng: float) -> float:
         """
@@ -75,23 +110,10 @@ class Node:
         Returns:
             거리 (km)
         """
-        import math
-        
-        R = 6371  # 지구 반지름 (km)
-        
-        lat1, lng1 = math.radians(self.lat), math.radians(self.lng)
-        lat2, lng2 = math.radians(lat), math.radians(lng)
-        
-        dlat = lat2 - lat1
-        dlng = lng2 - lng1
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        
-        return R * c
+        return _haversine_km(self.lat, self.lng, lat, lng)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
     """
     도로/엣지 데이터 모델
@@ -113,12 +135,96 @@ class Edge:
     name: Optional[str] = None
     is_oneway: bool = False
     
+    __setstate__ = _slots_setstate
+    
     @property
     def length_km(self) -> float:
         """도로 길이 (km)"""
         return self.length_m / 1000.0
 
 
+@dataclass
+class CSRAdjacency:
+    """
+    압축 희소 행(CSR) 형태의 인접 구조 (그래프 스냅샷, 읽기 전용)
+    
+    인덱스 i 노드에서 나가는 방향 엣지는 슬롯 indptr[i] ~ indptr[i+1]-1에 연속 저장된다.
+    두 노드 사이에 엣지가 여러 개면 get_edge_between과 동일하게 먼저 추가된 엣지를 사용한다.
+    
+    Attributes:
+        node_ids: 인덱스 → 노드 ID
+        index_of: 노드 ID → 인덱스
+        indptr: 노드별 슬롯 시작 위치 (길이 N+1)
+        nbr_idx: 슬롯별 도착 노드 인덱스
+        edge_ids: 슬롯별 엣지 ID
+        edge_len: 슬롯별 엣지 길이 (km)
+        edge_light: 슬롯별 도착 노드 신호등 여부 (0/1)
+        src_idx: 슬롯별 출발 노드 인덱스
+        rev_indptr: 도착 노드별 역방향 슬롯 시작 위치 (길이 N+1)
+        rev_slot: 도착 노드 기준으로 묶은 슬롯 번호 (역방향 탐색용)
+        node_lat: 인덱스별 노드 위도
+        node_lng: 인덱스별 노드 경도
+        node_light: 인덱스별 노드 신호등 여부 (0/1)
+        pair_keys: 정렬된 (출발 인덱스 * N + 도착 인덱스) 키 (노드 쌍 → 슬롯 조회용)
+        pair_slot: pair_keys 순서의 슬롯 번호
+    """
+    node_ids: np.ndarray
+    index_of: Dict[int, int]
+    indptr: np.ndarray
+    nbr_idx: np.ndarray
+    edge_ids: np.ndarray
+    edge_len: np.ndarray
+    edge_light: np.ndarray
+    src_idx: np.ndarray
+    rev_indptr: np.ndarray
+    rev_slot: np.ndarray
+    node_lat: np.ndarray
+    node_lng: np.ndarray
+    node_light: np.ndarray
+    pair_keys: np.ndarray
+    pair_slot: np.ndarray
+    
+    @property
+    def slot_count(self) -> int:
+        """방향 엣지(슬롯) 수"""
+        return len(self.nbr_idx)
+    
+    def path_indices(self, path: List[int]) -> Optional[np.ndarray]:
+        """
+        노드 ID 경로를 인덱스 배열로 변환
+        
+        Args:
+            path: 노드 ID 목록
+            
+        Returns:
+            (len(path),) 인덱스 배열 (그래프에 없는 노드가 있으면 None)
+        """
+        index_of = self.index_of
+        try:
+            return np.fromiter((index_of[node_id] for node_id in path), dtype=np.int64, count=len(path))
+        except KeyError:
+            return None
+    
+    def find_slots(self, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """
+        (출발, 도착) 인덱스 쌍의 슬롯 번호 일괄 조회 (get_edge_between의 배열 버전)
+        
+        Args:
+            src: 출발 노드 인덱스 배열
+            dst: 도착 노드 인덱스 배열
+            
+        Returns:
+            슬롯 번호 배열 (엣지가 없으면 -1)
+        """
+        keys = (np.asarray(src, dtype=np.int64) * max(len(self.node_ids), 1) +
+                np.asarray(dst, dtype=np.int64))
+        if len(self.pair_keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        
+        pos = np.minimum(np.searchsorted(self.pair_keys, keys), len(self.pair_keys) - 1)
+        return np.where(self.pair_keys[pos] == keys, self.pair_slot[pos], -1)
+
+
 @dataclass
 class RoadGraph:
     """
@@ -129,15 +235,64 @@ class RoadGraph:
     nodes: Dict[int, Node] = field(default_factory=dict)
     edges: Dict[int, Edge] = field(default_factory=dict)
     _adjacency: Dict[int, Set[int]] = field(default_factory=dict)
+    _csr: Optional[CSRAdjacency] = field(default=None, repr=False, compare=False)
+    # (출발 노드, 도착 노드) → 엣지 ID. 양방향 도로는 역방향 쌍도 등록하며 먼저 추가된 엣지가 우선
+    _edge_index: Optional[Dict[Tuple[int, int], int]] = field(default=None, repr=False, compare=False)
+    # 노드 ID → 그 노드에서 출발하는 엣지 ID 목록 (엣지 추가 순서, 양방향 도로는 양 끝 노드에 등록)
+    _out_edges: Optional[Dict[int, List[int]]] = field(default=None, repr=False, compare=False)
+    # freeze() 이후 True: 노드/엣지 추가 금지 (캐시에서 여러 세션이 공유하는 그래프 보호)
+    _frozen: bool = field(default=False, repr=False, compare=False)
+    # add_node/add_edge마다 증가하는 변경 번호 (그래프에서 파생 배열을 만드는 쪽의 재구성 판단용)
+    _revision: int = field(default=0, repr=False, compare=False)
+    
+    def __setstate__(self, state: dict) -> None:
+        """pickle 복원: 파생 구조는 비워 두고 필요 시 재구성 (구버전의 역방향 인접 리스트는 버림)"""
+        state = dict(state)
+        state.pop('_reverse_adjacency', None)
+        self.__dict__.update(state)
+        self._csr = None
+        self._edge_index = None
+        self._out_edges = None
+        self._frozen = state.get('_frozen', False)
+        self._revision = state.get('_revision', 0)
+        if self._frozen:
+            self.nodes = MappingProxyType(self.nodes)
+            self.edges = MappingProxyType(self.edges)
+    
+    def __getstate__(self) -> dict:
+        """CSR과 엣지 색인은 파생 데이터이므로 저장하지 않음 (로딩 후 필요 시 재구성)"""
+        state = self.__dict__.copy()
+        state['_csr'] = None
+        state['_edge_index'] = None
+        state['_out_edges'] = None
+        # 고정된 그래프의 읽기 전용 뷰는 pickle할 수 없으므로 dict로 저장 (복원 시 다시 감쌈)
+        state['nodes'] = dict(self.nodes)
+        state['edges'] = dict(self.edges)
+        return state
     
     def add_node(self, node: Node) -> None:
         """노드 추가"""
+        self._check_mutable()
+        self._csr = None
+        self._revision += 1
         self.nodes[node.id] = node
         if node.id not in self._adjacency:
             self._adjacency[node.id] = set()
     
     def add_edge(self, edge: Edge) -> None:
         """엣지 추가 (양방향 인접 리스트 업데이트)"""
+        self._check_mutable()
+        self._csr = None
+        self._revision += 1
+        if edge.id in self.edges:
+            # 같은 ID 교체 시 기존 쌍이 남지 않도록 색인을 다음 조회 때 재구성
+            self._edge_index = None
+            self._out_edges = None
+        else:
+            if self._edge_index is not None:
+                self._index_edge(self._edge_index, edge)
+            if self._out_edges is not None:
+                self._index_out_edge(self._out_edges, edge)
         self.edges[edge.id] = edge
         
         # 인접 리스트 업데이트
@@ -152,6 +307,137 @@ class RoadGraph:
         if not edge.is_oneway:
             self._adjacency[edge.target_id].add(edge.source_id)
     
+    def freeze(self) -> 'RoadGraph':
+        """
+        그래프를 읽기 전용으로 고정하고 파생 구조를 미리 생성
+        
+        CSR 배열과 노드 쌍/출발 엣지 색인을 지금 만들어 두므로 이후 조회에서 지연 생성이 일어나지 않고,
+        고정 이후의 add_node/add_edge는 ValueError를 발생시킨다. nodes/edges는 읽기 전용 뷰로 바뀌어
+        직접 대입으로 파생 구조와 어긋나는 일도 막는다 (TypeError). pickle 복원 후에도 고정 상태는 유지된다.
+        
+        Returns:
+            자기 자신 (호출 연결용)
+        """
+        self.build_csr()
+        self._get_edge_index()
+        self._get_out_edges()
+        if not self._frozen:
+            self.nodes = MappingProxyType(self.nodes)
+            self.edges = MappingProxyType(self.edges)
+        self._frozen = True
+        return self
+    
+    @property
+    def is_frozen(self) -> bool:
+        """freeze() 호출 여부"""
+        return self._frozen
+    
+    @property
+    def revision(self) -> int:
+        """변경 번호 (add_node/add_edge마다 증가, 노드/엣지 수가 같아도 구분)"""
+        return self._revision
+    
+    def _check_mutable(self) -> None:
+        """고정된 그래프 수정 시도 시 예외"""
+        if self._frozen:
+            raise ValueError("고정된(freeze) 그래프에는 노드/엣지를 추가할 수 없습니다")
+    
+    @staticmethod
+    def _index_edge(index: Dict[Tuple[int, int], int], edge: Edge) -> None:
+        """엣지의 방향 쌍을 색인에 등록 (이미 있는 쌍은 유지)"""
+        index.setdefault((edge.source_id, edge.target_id), edge.id)
+        if not edge.is_oneway:
+            index.setdefault((edge.target_id, edge.source_id), edge.id)
+    
+    @staticmethod
+    def _index_out_edge(index: Dict[int, List[int]], edge: Edge) -> None:
+        """엣지를 출발 가능한 노드의 목록에 등록 (자기 루프는 한 번만)"""
+        index.setdefault(edge.source_id, []).append(edge.id)
+        if not edge.is_oneway and edge.target_id != edge.source_id:
+            index.setdefault(edge.target_id, []).append(edge.id)
+    
+    def build_csr(self) -> CSRAdjacency:
+        """
+        인접 구조를 CSR 배열로 변환 (그래프가 바뀌기 전까지 캐시)
+        
+        노드/엣지 추가 시 캐시가 무효화되므로 탐색 시작 시점에 호출한다.
+        양 끝 노드가 모두 그래프에 있는 엣지만 포함한다.
+        
+        Returns:
+            CSR 인접 구조
+        """
+        if self._csr is not None:
+            return self._csr
+        
+        node_ids = list(self.nodes.keys())
+        index_of = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+        
+        src: List[int] = []
+        dst: List[int] = []
+        eids: List[int] = []
+        lengths: List[float] = []
+        seen: Set[Tuple[int, int]] = set()
+        
+        for edge in self.edges.values():
+            s = index_of.get(edge.source_id)
+            t = index_of.get(edge.target_id)
+            if s is None or t is None:
+                continue
+            pairs = ((s, t),) if edge.is_oneway else ((s, t), (t, s))
+            for a, b in pairs:
+                # 같은 방향 쌍은 먼저 추가된 엣지가 우선 (get_edge_between과 동일)
+                if (a, b) in seen:
+                    continue
+                seen.add((a, b))
+                src.append(a)
+                dst.append(b)
+                eids.append(edge.id)
+                lengths.append(edge.length_km)
+        
+        src_arr = np.asarray(src, dtype=np.int64)
+        order = np.argsort(src_arr, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.bincount(src_arr, minlength=n))
+        
+        nbr_idx = np.asarray(dst, dtype=np.int32)[order]
+        
+        # 역방향: 도착 노드 기준으로 슬롯 번호를 묶음
+        rev_slot = np.argsort(nbr_idx, kind='stable').astype(np.int32)
+        rev_indptr = np.zeros(n + 1, dtype=np.int32)
+        rev_indptr[1:] = np.cumsum(np.bincount(nbr_idx, minlength=n))
+        node_light = np.fromiter(
+            (node.has_traffic_light for node in self.nodes.values()),
+            dtype=np.uint8, count=n,
+        )
+        node_lat = np.fromiter((node.lat for node in self.nodes.values()), dtype=np.float64, count=n)
+        node_lng = np.fromiter((node.lng for node in self.nodes.values()), dtype=np.float64, count=n)
+        
+        # 노드 쌍 → 슬롯 조회용 정렬 키 (방향 쌍은 중복되지 않음)
+        src_sorted = src_arr[order]
+        pair_key = src_sorted * max(n, 1) + nbr_idx.astype(np.int64)
+        pair_slot = np.argsort(pair_key, kind='stable')
+        
+        self._csr = CSRAdjacency(
+            node_ids=np.asarray(node_ids, dtype=np.int64),
+            index_of=index_of,
+            indptr=indptr,
+            nbr_idx=nbr_idx,
+            edge_ids=np.asarray(eids, dtype=np.int64)[order],
+            # 경로 길이가 CostCalculator.calculate와 정확히 일치하도록 float64 유지
+            edge_len=np.asarray(lengths, dtype=np.float64)[order],
+            edge_light=node_light[nbr_idx],
+            src_idx=src_arr[order].astype(np.int32),
+            rev_indptr=rev_indptr,
+            rev_slot=rev_slot,
+            node_lat=node_lat,
+            node_lng=node_lng,
+            node_light=node_light,
+            pair_keys=pair_key[pair_slot],
+            pair_slot=pair_slot,
+        )
+        return self._csr
+    
     def get_node(self, node_id: int) -> Optional[Node]:
         """노드 ID로 노드 조회"""
         return self.nodes.get(node_id)
@@ -161,23 +447,36 @@ class RoadGraph:
         return self._adjacency.get(node_id, set())
     
     def get_edges_from(self, node_id: int) -> List[Edge]:
-        """특정 노드에서 출발하는 엣지 목록 반환"""
-        result = []
-        for edge in self.edges.values():
-            if edge.source_id == node_id:
-                result.append(edge)
-            elif not edge.is_oneway and edge.target_id == node_id:
-                result.append(edge)
-        return result
+        """특정 노드에서 출발하는 엣지 목록 반환 (노드별 엣지 색인으로 O(차수) 조회)"""
+        edges = self.edges
+        return [edges[edge_id] for edge_id in self._get_out_edges().get(node_id, ())]
+    
+    def _get_out_edges(self) -> Dict[int, List[int]]:
+        """노드별 출발 엣지 색인 (없으면 생성)"""
+        if self._out_edges is None:
+            index: Dict[int, List[int]] = {}
+            for edge in self.edges.values():
+                self._index_out_edge(index, edge)
+            self._out_edges = index
+        return self._out_edges
     
     def get_edge_between(self, source_id: int, target_id: int) -> Optional[Edge]:
-        """두 노드 사이의 엣지 반환"""
-        for edge in self.edges.values():
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-            if not edge.is_oneway and edge.source_id == target_id and edge.target_id == source_id:
-                return edge
-        return None
+        """
+        두 노드 사이의 엣지 반환 (노드 쌍 색인으로 O(1) 조회)
+        
+        같은 방향 쌍을 잇는 엣지가 여러 개면 먼저 추가된 엣지를 반환한다.
+        """
+        edge_id = self._get_edge_index().get((source_id, target_id))
+        return None if edge_id is None else self.edges[edge_id]
+    
+    def _get_edge_index(self) -> Dict[Tuple[int, int], int]:
+        """노드 쌍 → 엣지 ID 색인 (없으면 생성)"""
+        if self._edge_index is None:
+            index: Dict[Tuple[int, int], int] = {}
+            for edge in self.edges.values():
+                self._index_edge(index, edge)
+            self._edge_index = index
+        return self._edge_index
     
     @property
     def node_count(self) -> int:
@@ -190,8 +489,10 @@ class RoadGraph:
         return len(self.edges)
     
     def get_traffic_light_nodes(self) -> List[Node]:
-        """신호등이 있는 노드 목록 반환"""
-        return [node for node in self.nodes.values() if node.has_traffic_light]
+        """신호등이 있는 노드 목록 반환 (CSR 노드 배열에서 조회, 노드 추가 순서 유지)"""
+        csr = self.build_csr()
+        light_ids = csr.node_ids[np.flatnonzero(csr.node_light)].tolist()
+        return [self.nodes[node_id] for node_id in light_ids]
     
     def get_bounding_box(self) -> Tuple[float, float, float, float]:
         """
@@ -203,10 +504,11 @@ class RoadGraph:
         if not self.nodes:
             return (0.0, 0.0, 0.0, 0.0)
         
-        lats = [node.lat for node in self.nodes.values()]
-        lngs = [node.lng for node in self.nodes.values()]
+        # CSR의 노드 좌표 배열(SoA)에서 한 번에 계산
+        csr = self.build_csr()
+        lats, lngs = csr.node_lat, csr.node_lng
         
-        return (max(lats), min(lats), max(lngs), min(lngs))
+        return (float(lats.max()), float(lats.min()), float(lngs.max()), float(lngs.min()))
     
     def find_nearest_node(self, lat: float, lng: float) -> Optional[Node]:
         """
@@ -222,14 +524,16 @@ class RoadGraph:
         if not self.nodes:
             return None
         
-        temp_node = Node(id=-1, lat=lat, lng=lng)
-        nearest = None
-        min_dist = float('inf')
-        
-        for node in self.nodes.values():
-            dist = temp_node.distance_to(node)
-            if dist < min_dist:
-                min_dist = dist
-                nearest = node
+        csr = self.build_csr()
+        if HAS_NUMBA:
+            return self.nodes[int(csr.node_ids[nearest_node_index(csr.node_lat, csr.node_lng, lat, lng)])]
         
-        return nearest
+        # CSR 노드 좌표 배열에 Haversine을 한 번에 적용.
+        # 거리는 중간값 a에 대해 단조 증가하므로 a의 최소 위치가 최근접 노드 (동률이면 먼저 추가된 노드)
+        lat_rad, lng_rad = math.radians(lat), math.radians(lng)
+        node_lat_rad = np.radians(csr.node_lat)
+        a = (
+            np.sin((node_lat_rad - lat_rad) / 2) ** 2 +
+            math.cos(lat_rad) * np.cos(node_lat_rad) * np.sin((np.radians(csr.node_lng) - lng_rad) / 2) ** 2
+        )
+        return self.nodes[int(csr.node_ids[np.argmin(a)])]
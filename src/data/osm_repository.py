@@ -3,6 +3,7 @@ OSM 데이터 Repository 구현
 osmnx 라이브러리를 활용한 OpenStreetMap 데이터 처리
 """
 import logging
+import time
 from typing import Optional, Dict, Any
 
 import osmnx as ox
@@ -67,8 +68,7 @@ class OSMGraphRepository(GraphRepository):
             # osmnx v2.0+ API: bbox를 튜플로 전달 (north, south, east, west)
             bbox_tuple = (bbox.north, bbox.south, bbox.east, bbox.west)
             
-            import time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             G = ox.graph_from_bbox(
                 bbox=bbox_tuple,
@@ -76,7 +76,7 @@ class OSMGraphRepository(GraphRepository):
                 simplify=True
             )
             
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.info(f"OSM 그래프 로딩 완료: {elapsed:.1f}초 소요")
             
             return self._convert_to_road_graph(G)
@@ -154,7 +154,8 @@ class OSMGraphRepository(GraphRepository):
         
         logger.info(f"그래프 변환 완료: {road_graph.node_count} 노드, {road_graph.edge_count} 엣지")
         
-        return road_graph
+        # 변환 후에는 읽기 전용: 고정하면서 CSR/색인을 미리 생성
+        return road_graph.freeze()
     
     def _check_traffic_light(self, node_data: Dict[str, Any]) -> bool:
         """
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
 
 class ShapeType(Enum):
     """미리 정의된 도형 템플릿 타입"""
@@ -26,9 +28,13 @@ class ShapeType(Enum):
     CUSTOM = "custom"  # 사용자 직접 그리기
 
 
-@dataclass
+@dataclass(slots=True)
 class Coordinate:
-    """위도/경도 좌표"""
+    """
+    위도/경도 좌표
+    
+    경로마다 수백 개씩 생성되므로 __dict__ 없이 슬롯으로 저장 (인스턴스 메모리 감소, 속성 조회 가속)
+    """
     lat: float  # 위도
     lng: float  # 경도
     
@@ -36,7 +42,7 @@ class Coordinate:
         return (self.lat, self.lng)
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """지도 범위를 나타내는 사각형 영역"""
     north: float  # 북쪽 위도 (최대)
@@ -88,7 +94,7 @@ class BoundingBox:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Shape:
     """사용자가 선택한 모양"""
     shape_type: ShapeType
@@ -113,7 +119,7 @@ class Constraints:
             raise ValueError("최대 신호등 개수는 0 이상이어야 합니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteInfo:
     """경로 정보"""
     route_id: int
@@ -121,6 +127,14 @@ class RouteInfo:
     total_distance_km: float       # 총 거리
     traffic_light_count: int       # 신호등/횡단보도 수
     shape_similarity: float        # 도형 유사도 점수 (0~1)
+    # coordinates와 같은 좌표의 (N, 2) [위도, 경도] 배열 (생성 시 채움, 지도 표시용)
+    coordinates_arr: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.coordinates_arr is None:
+            self.coordinates_arr = np.array(
+                [(c.lat, c.lng) for c in self.coordinates], dtype=np.float64
+            ).reshape(-1, 2)
     
     @property
     def display_name(self) -> str:
@@ -42,7 +42,73 @@ def render_map(
     # 지도 중심 및 줌 레벨
     center = st.session_state.get('map_center', [37.5665, 126.9780])
     zoom = st.session_state.get('map_zoom', 14)
+    bbox = st.session_state.get('bounding_box')
+    
+    m = _get_map(center, zoom, routes or [], selected_route_id, bbox, show_drawing_tools)
     
+    # 지도 렌더링
+    map_data = st_folium(
+        m,
+        width=None,  # 컨테이너 너비에 맞춤
+        height=500,
+        returned_objects=["all_drawings", "last_active_drawing"],
+        key="main_map",
+    )
+    
+    # 지도 상호작용 결과 처리
+    _process_map_interaction(map_data)
+    
+    return map_data
+
+
+def _get_map(
+    center: List[float],
+    zoom: int,
+    routes: List[RouteInfo],
+    selected_route_id: Optional[int],
+    bbox: Optional[Dict],
+    show_drawing_tools: bool,
+) -> folium.Map:
+    """
+    지도 객체 조회 (입력이 이전 재실행과 같으면 세션에 보관한 지도 재사용)
+    
+    경로 선택과 무관한 위젯 조작으로 재실행될 때 Folium 지도/레이어를 다시 만들지 않는다.
+    세션당 마지막 지도 1개만 보관한다.
+    """
+    key = (
+        tuple(center), zoom, _routes_key(routes), selected_route_id,
+        (bbox['north'], bbox['south'], bbox['east'], bbox['west']) if bbox else None,
+        show_drawing_tools,
+    )
+    cached = st.session_state.get('_map_cache')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    m = _build_map(center, zoom, routes, selected_route_id, bbox, show_drawing_tools)
+    st.session_state['_map_cache'] = (key, m)
+    return m
+
+
+def _routes_key(routes: List[RouteInfo]) -> tuple:
+    """지도에 표시되는 경로 내용의 비교 키 (좌표와 팝업 값)"""
+    return tuple(
+        (
+            route.route_id, route.total_distance_km, route.traffic_light_count, route.shape_similarity,
+            route.coordinates_arr.tobytes(),
+        )
+        for route in routes
+    )
+
+
+def _build_map(
+    center: List[float],
+    zoom: int,
+    routes: List[RouteInfo],
+    selected_route_id: Optional[int],
+    bbox: Optional[Dict],
+    show_drawing_tools: bool,
+) -> folium.Map:
+    """Folium 지도 생성 (그리기 도구, 경로, 선택 영역 추가)"""
     # Folium 지도 생성
     m = folium.Map(
         location=center,
@@ -73,23 +139,10 @@ def render_map(
         _add_routes_to_map(m, routes, selected_route_id)
     
     # 선택된 바운딩 박스 표시
-    bbox = st.session_state.get('bounding_box')
     if bbox:
         _add_bounding_box_to_map(m, bbox)
     
-    # 지도 렌더링
-    map_data = st_folium(
-        m,
-        width=None,  # 컨테이너 너비에 맞춤
-        height=500,
-        returned_objects=["all_drawings", "last_active_drawing"],
-        key="main_map",
-    )
-    
-    # 지도 상호작용 결과 처리
-    _process_map_interaction(map_data)
-    
-    return map_data
+    return m
 
 
 def _add_routes_to_map(
@@ -97,40 +150,68 @@ def _add_routes_to_map(
     routes: List[RouteInfo],
     selected_route_id: Optional[int]
 ):
-    """경로들을 지도에 추가"""
+    """
+    경로들을 지도에 추가
+    
+    경로 라인과 시작점 마커를 각각 GeoJSON 레이어 하나로 묶어
+    경로마다 Leaflet 레이어/팝업 스크립트를 따로 만들지 않는다.
+    """
+    line_features = []
+    start_features = []
+    
     for i, route in enumerate(routes):
-        color = ROUTE_COLORS[i % len(ROUTE_COLORS)]
-        is_selected = route.route_id == selected_route_id
-        
-        # 경로 좌표 변환
-        coords = [(c.lat, c.lng) for c in route.coordinates]
+        if len(route.coordinates_arr) == 0:
+            continue
         
-        # 선택된 경로는 더 두껍게 표시
-        weight = 6 if is_selected else 3
-        opacity = 1.0 if is_selected else 0.7
+        is_selected = route.route_id == selected_route_id
         
-        # 경로 라인 추가
-        folium.PolyLine(
-            coords,
-            color=color,
-            weight=weight,
-            opacity=opacity,
-            popup=f"""
-                <b>{route.display_name}</b><br>
-                거리: {route.total_distance_km:.2f} km<br>
-                신호등: {route.traffic_light_count}개<br>
-                유사도: {route.shape_similarity:.1%}
-            """,
-            tooltip=route.display_name,
-        ).add_to(m)
+        # GeoJSON 좌표 순서는 (경도, 위도): [위도, 경도] 배열의 열을 뒤집어 한 번에 변환
+        coords = route.coordinates_arr[:, ::-1].tolist()
         
-        # 시작점 마커
-        if coords:
-            folium.Marker(
-                coords[0],
-                popup=f"{route.display_name} 시작점",
-                icon=folium.Icon(color='green', icon='play'),
-            ).add_to(m)
+        line_features.append({
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": coords},
+            "properties": {
+                "name": route.display_name,
+                "distance": f"{route.total_distance_km:.2f} km",
+                "lights": f"{route.traffic_light_count}개",
+                "similarity": f"{route.shape_similarity:.1%}",
+                # 선택된 경로는 더 두껍게 표시
+                "style": {
+                    "color": ROUTE_COLORS[i % len(ROUTE_COLORS)],
+                    "weight": 6 if is_selected else 3,
+                    "opacity": 1.0 if is_selected else 0.7,
+                },
+            },
+        })
+        start_features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": coords[0]},
+            "properties": {"name": f"{route.display_name} 시작점"},
+        })
+    
+    if not line_features:
+        return
+    
+    # 경로 라인
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": line_features},
+        name="경로",
+        style_function=lambda feature: feature["properties"]["style"],
+        tooltip=folium.GeoJsonTooltip(fields=["name"], labels=False),
+        popup=folium.GeoJsonPopup(
+            fields=["name", "distance", "lights", "similarity"],
+            aliases=["경로", "거리", "신호등", "유사도"],
+        ),
+    ).add_to(m)
+    
+    # 시작점 마커
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": start_features},
+        name="시작점",
+        marker=folium.Marker(icon=folium.Icon(color='green', icon='play')),
+        popup=folium.GeoJsonPopup(fields=["name"], labels=False),
+    ).add_to(m)
 
 
 def _add_bounding_box_to_map(m: folium.Map, bbox: Dict):
@@ -165,8 +246,8 @@ def _process_map_interaction(map_data: Dict[str, Any]):
         if geo_type == 'Polygon':
             coords = geometry.get('coordinates', [[]])[0]
             if len(coords) >= 4:
-                lats = [c[1] for c in coords]
-                lngs = [c[0] for c in coords]
+                # GeoJSON 좌표는 (경도, 위도) 순서: 한 번에 열로 분리
+                lngs, lats = zip(*((c[0], c[1]) for c in coords))
                 
                 st.session_state.bounding_box = {
                     'north': max(lats),
@@ -2,10 +2,12 @@
 경로 정보 카드 컴포넌트
 검색된 경로들의 정보를 카드 형태로 표시
 """
+import numpy as np
 import streamlit as st
 from typing import List, Optional, Callable
 
 from src.domain.entities import RouteInfo
+from src.presentation.state import build_route_metrics
 
 
 # 경로별 색상 (map_view와 동일)
@@ -17,11 +19,26 @@ ROUTE_COLORS = [
     '#FFEAA7',  # 노랑
 ]
 
+# 유사도 배지 색상 (낮음 < 0.6 ≤ 중간 < 0.8 ≤ 높음)
+_SIMILARITY_COLORS = (
+    '#E74C3C',  # 빨강 (낮음)
+    '#F39C12',  # 주황 (중간)
+    '#27AE60',  # 녹색 (높음)
+)
+
+# 정렬 기준 → (경로 지표 열, 내림차순 여부)
+_SORT_SPECS = {
+    "유사도 높은 순": ('sim', True),
+    "거리 짧은 순": ('dist', False),
+    "신호등 적은 순": ('lights', False),
+}
+
 
 def render_route_cards(
     routes: List[RouteInfo],
     selected_route_id: Optional[int] = None,
     on_select: Optional[Callable[[int], None]] = None,
+    metrics: Optional[np.ndarray] = None,
 ):
     """
     경로 정보 카드 목록 렌더링
@@ -30,6 +47,7 @@ def render_route_cards(
         routes: 표시할 경로 목록
         selected_route_id: 현재 선택된 경로 ID
         on_select: 경로 선택 시 호출될 콜백
+        metrics: set_routes에서 만든 경로 지표 배열 (없으면 여기서 생성)
     """
     if not routes:
         _render_empty_state()
@@ -40,12 +58,14 @@ def render_route_cards(
     # 정렬 옵션
     sort_option = st.selectbox(
         "정렬 기준",
-        options=["유사도 높은 순", "거리 짧은 순", "신호등 적은 순"],
+        options=list(_SORT_SPECS),
         key="route_sort",
     )
     
     # 정렬 적용
-    sorted_routes = _sort_routes(routes, sort_option)
+    if metrics is None or len(metrics) != len(routes):
+        metrics = build_route_metrics(routes)
+    sorted_routes = _sort_routes(routes, sort_option, metrics)
     
     # 각 경로 카드 렌더링
     for i, route in enumerate(sorted_routes):
@@ -69,15 +89,31 @@ def _render_empty_state():
     )
 
 
-def _sort_routes(routes: List[RouteInfo], sort_option: str) -> List[RouteInfo]:
-    """경로 정렬"""
-    if sort_option == "유사도 높은 순":
-        return sorted(routes, key=lambda r: r.shape_similarity, reverse=True)
-    elif sort_option == "거리 짧은 순":
-        return sorted(routes, key=lambda r: r.total_distance_km)
-    elif sort_option == "신호등 적은 순":
-        return sorted(routes, key=lambda r: r.traffic_light_count)
-    return routes
+def _sort_routes(
+    routes: List[RouteInfo],
+    sort_option: str,
+    metrics: np.ndarray
+) -> List[RouteInfo]:
+    """
+    경로 정렬
+    
+    지표 배열의 해당 열을 안정 정렬(argsort)하므로 같은 값은 원래 순서를 유지
+    
+    Args:
+        routes: 경로 목록
+        sort_option: 정렬 기준
+        metrics: routes와 같은 순서의 경로 지표 배열
+        
+    Returns:
+        정렬된 경로 목록
+    """
+    spec = _SORT_SPECS.get(sort_option)
+    if spec is None:
+        return routes
+    column, descending = spec
+    values = metrics[column]
+    order = np.argsort(-values if descending else values, kind='stable')
+    return [routes[i] for i in order.tolist()]
 
 
 def _render_route_card(
@@ -88,49 +124,34 @@ def _render_route_card(
 ):
     """개별 경로 카드 렌더링"""
     color = ROUTE_COLORS[index % len(ROUTE_COLORS)]
+    similarity_pct = route.shape_similarity * 100
+    badge_color = _get_similarity_color(route.shape_similarity)
+    
+    # 선택 상태에 따른 스타일링
+    selected_style = (
+        f"border-left: 4px solid {color}; padding-left: 12px; "
+        "background-color: rgba(0,0,0,0.05); border-radius: 4px;"
+        if is_selected else ""
+    )
     
     # 카드 컨테이너
     with st.container():
-        # 선택 상태에 따른 스타일링
-        if is_selected:
-            st.markdown(
-                f"""
-                <div style="
-                    border-left: 4px solid {color};
-                    padding-left: 12px;
-                    background-color: rgba(0,0,0,0.05);
-                    border-radius: 4px;
-                    margin-bottom: 8px;
-                ">
-                """,
-                unsafe_allow_html=True
-            )
-        
-        # 경로 헤더
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown(
-                f"""
-                <span style="
-                    display: inline-block;
-                    width: 12px;
-                    height: 12px;
-                    background-color: {color};
-                    border-radius: 50%;
-                    margin-right: 8px;
-                "></span>
-                <strong>{route.display_name}</strong>
-                """,
-                unsafe_allow_html=True
-            )
-        
-        with col2:
-            # 유사도 배지
-            similarity_pct = route.shape_similarity * 100
-            badge_color = _get_similarity_color(route.shape_similarity)
-            st.markdown(
-                f"""
+        # 경로 헤더 (색상 점, 이름, 유사도 배지를 한 번의 markdown으로 출력)
+        st.markdown(
+            f"""
+            <div style="display: flex; align-items: center; justify-content: space-between;
+                        margin-bottom: 8px; {selected_style}">
+                <span>
+                    <span style="
+                        display: inline-block;
+                        width: 12px;
+                        height: 12px;
+                        background-color: {color};
+                        border-radius: 50%;
+                        margin-right: 8px;
+                    "></span>
+                    <strong>{route.display_name}</strong>
+                </span>
                 <span style="
                     background-color: {badge_color};
                     color: white;
@@ -138,9 +159,10 @@ def _render_route_card(
                     border-radius: 12px;
                     font-size: 0.8em;
                 ">{similarity_pct:.0f}%</span>
-                """,
-                unsafe_allow_html=True
-            )
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
         
         # 경로 상세 정보
         col1, col2, col3 = st.columns(3)
@@ -163,49 +185,52 @@ def _render_route_card(
                 value=f"{similarity_pct:.1f}%",
             )
         
-        # 선택 버튼
+        # 선택 버튼 (on_click 콜백은 재실행 전에 호출되므로 지도와 모든 카드가 새 선택으로 그려짐)
         button_label = "✓ 선택됨" if is_selected else "선택하기"
         button_type = "primary" if is_selected else "secondary"
         
-        if st.button(
+        st.button(
             button_label,
             key=f"select_route_{route.route_id}",
             type=button_type,
             use_container_width=True,
-        ):
-            if on_select:
-                on_select(route.route_id)
-            else:
-                st.session_state.selected_route_id = route.route_id
-        
-        if is_selected:
-            st.markdown("</div>", unsafe_allow_html=True)
+            on_click=on_select or _select_route,
+            args=(route.route_id,),
+        )
         
         st.divider()
 
 
+def _select_route(route_id: int):
+    """기본 경로 선택 콜백"""
+    st.session_state.selected_route_id = route_id
+
+
 def _get_similarity_color(similarity: float) -> str:
-    """유사도에 따른 색상 반환"""
-    if similarity >= 0.8:
-        return '#27AE60'  # 녹색 (높음)
-    elif similarity >= 0.6:
-        return '#F39C12'  # 주황 (중간)
-    else:
-        return '#E74C3C'  # 빨강 (낮음)
+    """유사도에 따른 색상 반환 (0.6, 0.8 경계를 넘은 횟수로 색상 선택)"""
+    return _SIMILARITY_COLORS[(similarity >= 0.6) + (similarity >= 0.8)]
 
 
-def render_route_summary(routes: List[RouteInfo]):
-    """경로 요약 정보"""
+def render_route_summary(routes: List[RouteInfo], metrics: Optional[np.ndarray] = None):
+    """
+    경로 요약 정보
+    
+    Args:
+        routes: 경로 목록
+        metrics: set_routes에서 만든 경로 지표 배열 (없으면 여기서 생성)
+    """
     if not routes:
         return
     
     st.markdown("---")
     st.subheader("📊 경로 요약")
     
-    # 통계 계산
-    avg_distance = sum(r.total_distance_km for r in routes) / len(routes)
-    avg_lights = sum(r.traffic_light_count for r in routes) / len(routes)
-    avg_similarity = sum(r.shape_similarity for r in routes) / len(routes)
+    # 통계 계산 (지표 열별 평균)
+    if metrics is None or len(metrics) != len(routes):
+        metrics = build_route_metrics(routes)
+    avg_distance = float(metrics['dist'].mean())
+    avg_lights = float(metrics['lights'].mean())
+    avg_similarity = float(metrics['sim'].mean())
     
     col1, col2, col3 = st.columns(3)
     
@@ -4,10 +4,64 @@
 """
 import streamlit as st
 from streamlit_drawable_canvas import st_canvas
+from types import MappingProxyType
 from typing import Callable, Optional
 import json
 
+import numpy as np
+
 from src.domain.entities import ShapeType, Constraints, Shape, Coordinate
+from src.presentation.state import set_custom_points
+
+
+# 캔버스 원 객체의 둘레 점 16개에 대한 단위 원 (모듈 로드 시 1회 계산)
+_UNIT16_ANGLES = 2 * np.pi * np.arange(16) / 16
+_UNIT16_COS = np.cos(_UNIT16_ANGLES)
+_UNIT16_SIN = np.sin(_UNIT16_ANGLES)
+
+# 모양 선택 목록 표시 이름 (읽기 전용, 모듈 로드 시 1회 생성)
+_SHAPE_OPTIONS = MappingProxyType({
+    ShapeType.HEART.value: "❤️ 하트",
+    ShapeType.CIRCLE.value: "⭕ 원",
+    ShapeType.STAR.value: "⭐ 별",
+    ShapeType.DIGIT_0.value: "0️⃣ 숫자 0",
+    ShapeType.DIGIT_1.value: "1️⃣ 숫자 1",
+    ShapeType.DIGIT_2.value: "2️⃣ 숫자 2",
+    ShapeType.DIGIT_3.value: "3️⃣ 숫자 3",
+    ShapeType.DIGIT_4.value: "4️⃣ 숫자 4",
+    ShapeType.DIGIT_5.value: "5️⃣ 숫자 5",
+    ShapeType.DIGIT_6.value: "6️⃣ 숫자 6",
+    ShapeType.DIGIT_7.value: "7️⃣ 숫자 7",
+    ShapeType.DIGIT_8.value: "8️⃣ 숫자 8",
+    ShapeType.DIGIT_9.value: "9️⃣ 숫자 9",
+    ShapeType.CUSTOM.value: "✏️ 직접 그리기",
+})
+
+# 검색 조건 요약용 모양 이름
+_SHAPE_NAMES = MappingProxyType({
+    ShapeType.HEART.value: "하트",
+    ShapeType.CIRCLE.value: "원",
+    ShapeType.STAR.value: "별",
+    ShapeType.DIGIT_0.value: "숫자 0",
+    ShapeType.DIGIT_1.value: "숫자 1",
+    ShapeType.DIGIT_2.value: "숫자 2",
+    ShapeType.DIGIT_3.value: "숫자 3",
+    ShapeType.DIGIT_4.value: "숫자 4",
+    ShapeType.DIGIT_5.value: "숫자 5",
+    ShapeType.DIGIT_6.value: "숫자 6",
+    ShapeType.DIGIT_7.value: "숫자 7",
+    ShapeType.DIGIT_8.value: "숫자 8",
+    ShapeType.DIGIT_9.value: "숫자 9",
+    ShapeType.CUSTOM.value: "사용자 정의",
+})
+
+# 캔버스 그리기 도구 표시 이름
+_DRAWING_MODES = MappingProxyType({
+    "freedraw": "✏️ 자유 그리기",
+    "line": "📏 직선",
+    "circle": "⭕ 원",
+    "rect": "⬜ 사각형",
+})
 
 
 def render_sidebar(on_search: Optional[Callable] = None):
@@ -42,27 +96,10 @@ def _render_shape_section():
     st.subheader("📐 모양 선택")
     
     # 템플릿 선택
-    shape_options = {
-        ShapeType.HEART.value: "❤️ 하트",
-        ShapeType.CIRCLE.value: "⭕ 원",
-        ShapeType.STAR.value: "⭐ 별",
-        ShapeType.DIGIT_0.value: "0️⃣ 숫자 0",
-        ShapeType.DIGIT_1.value: "1️⃣ 숫자 1",
-        ShapeType.DIGIT_2.value: "2️⃣ 숫자 2",
-        ShapeType.DIGIT_3.value: "3️⃣ 숫자 3",
-        ShapeType.DIGIT_4.value: "4️⃣ 숫자 4",
-        ShapeType.DIGIT_5.value: "5️⃣ 숫자 5",
-        ShapeType.DIGIT_6.value: "6️⃣ 숫자 6",
-        ShapeType.DIGIT_7.value: "7️⃣ 숫자 7",
-        ShapeType.DIGIT_8.value: "8️⃣ 숫자 8",
-        ShapeType.DIGIT_9.value: "9️⃣ 숫자 9",
-        ShapeType.CUSTOM.value: "✏️ 직접 그리기",
-    }
-    
     selected = st.selectbox(
         "모양 템플릿",
-        options=list(shape_options.keys()),
-        format_func=lambda x: shape_options[x],
+        options=list(_SHAPE_OPTIONS),
+        format_func=_SHAPE_OPTIONS.__getitem__,
         key="shape_type",
         help="원하는 러닝 코스 모양을 선택하세요"
     )
@@ -79,13 +116,8 @@ def _render_shape_drawing_canvas():
     # 그리기 모드 선택
     drawing_mode = st.radio(
         "그리기 도구",
-        options=["freedraw", "line", "circle", "rect"],
-        format_func=lambda x: {
-            "freedraw": "✏️ 자유 그리기",
-            "line": "📏 직선",
-            "circle": "⭕ 원",
-            "rect": "⬜ 사각형"
-        }.get(x, x),
+        options=list(_DRAWING_MODES),
+        format_func=lambda x: _DRAWING_MODES.get(x, x),
         horizontal=True,
         key="drawing_mode"
     )
@@ -111,21 +143,25 @@ def _render_shape_drawing_canvas():
     # 캔버스 데이터 처리
     if canvas_result.json_data is not None:
         objects = canvas_result.json_data.get("objects", [])
+        # 캔버스 내용이 이전 재실행과 같으면 좌표 추출 생략 (다른 위젯 조작으로 인한 재실행)
+        canvas_hash = hash(json.dumps(objects, sort_keys=True))
+        if canvas_hash != st.session_state.get('_canvas_hash'):
+            if objects:
+                # 그려진 객체에서 좌표 추출
+                set_custom_points(_extract_points_from_canvas(objects, canvas_size))
+            else:
+                set_custom_points(np.empty((0, 2)))
+            st.session_state._canvas_hash = canvas_hash
+        
         if objects:
-            # 그려진 객체에서 좌표 추출
-            all_points = _extract_points_from_canvas(objects, canvas_size)
-            st.session_state.custom_points = all_points
-            
             # 포인트 수 표시
-            st.caption(f"✅ {len(all_points)}개의 점이 추출되었습니다")
-        else:
-            st.session_state.custom_points = []
+            st.caption(f"✅ {len(st.session_state.custom_points)}개의 점이 추출되었습니다")
     
     # 안내 메시지
     st.caption("💡 그린 모양이 러닝 코스의 형태가 됩니다")
 
 
-def _extract_points_from_canvas(objects: list, canvas_size: int) -> list:
+def _extract_points_from_canvas(objects: list, canvas_size: int) -> np.ndarray:
     """
     캔버스 객체에서 좌표점 추출
     
@@ -134,9 +170,10 @@ def _extract_points_from_canvas(objects: list, canvas_size: int) -> list:
         canvas_size: 캔버스 크기 (정규화용)
     
     Returns:
-        정규화된 좌표점 목록 (0~1 범위)
+        정규화된 좌표점 (N, 2) 배열, 열 순서는 [y, x] (0~1 범위)
     """
-    all_points = []
+    # 객체별 (N, 2) [x, y] 캔버스 좌표 블록을 모아 마지막에 한 번에 정규화
+    blocks = []
     
     for obj in objects:
         obj_type = obj.get("type", "")
@@ -144,15 +181,10 @@ def _extract_points_from_canvas(objects: list, canvas_size: int) -> list:
         if obj_type == "path":
             # 자유 그리기 또는 선의 경로 데이터
             path = obj.get("path", [])
-            for cmd in path:
-                if len(cmd) >= 3:
-                    # path 명령어에서 좌표 추출 (M, L, Q 등)
-                    x = cmd[1] if len(cmd) > 1 else 0
-                    y = cmd[2] if len(cmd) > 2 else 0
-                    all_points.append({
-                        'x': x / canvas_size,
-                        'y': y / canvas_size
-                    })
+            # path 명령어에서 좌표 추출 (M, L, Q 등), 정규화는 배열 단위로 한 번에
+            xy = [(cmd[1], cmd[2]) for cmd in path if len(cmd) >= 3]
+            if xy:
+                blocks.append(np.asarray(xy, dtype=np.float64))
         
         elif obj_type == "circle":
             # 원의 중심점과 둘레 점들
@@ -161,15 +193,10 @@ def _extract_points_from_canvas(objects: list, canvas_size: int) -> list:
             radius = obj.get("radius", 0)
             
             # 원 둘레의 점들 생성 (16개 점)
-            import math
-            for i in range(16):
-                angle = 2 * math.pi * i / 16
-                x = left + radius + radius * math.cos(angle)
-                y = top + radius + radius * math.sin(angle)
-                all_points.append({
-                    'x': x / canvas_size,
-                    'y': y / canvas_size
-                })
+            blocks.append(np.column_stack((
+                left + radius + radius * _UNIT16_COS,
+                top + radius + radius * _UNIT16_SIN,
+            )))
         
         elif obj_type == "rect":
             # 사각형의 꼭짓점
@@ -186,11 +213,7 @@ def _extract_points_from_canvas(objects: list, canvas_size: int) -> list:
                 (left, top + height),
                 (left, top),  # 시작점으로 돌아오기
             ]
-            for x, y in corners:
-                all_points.append({
-                    'x': x / canvas_size,
-                    'y': y / canvas_size
-                })
+            blocks.append(np.asarray(corners, dtype=np.float64))
         
         elif obj_type == "line":
             # 직선의 시작점과 끝점
@@ -199,10 +222,13 @@ def _extract_points_from_canvas(objects: list, canvas_size: int) -> list:
             x2 = obj.get("x2", 0) + obj.get("left", 0)
             y2 = obj.get("y2", 0) + obj.get("top", 0)
             
-            all_points.append({'x': x1 / canvas_size, 'y': y1 / canvas_size})
-            all_points.append({'x': x2 / canvas_size, 'y': y2 / canvas_size})
+            blocks.append(np.array([[x1, y1], [x2, y2]], dtype=np.float64))
+    
+    if not blocks:
+        return np.empty((0, 2))
     
-    return all_points
+    # [x, y] → [y, x] (Coordinate(lat=y, lng=x) 순서)
+    return np.concatenate(blocks)[:, ::-1] / canvas_size
 
 
 def _render_constraints_section():
@@ -246,24 +272,7 @@ def _render_search_button(on_search: Optional[Callable]):
     distance = st.session_state.get('target_distance', 5.0)
     lights = st.session_state.get('max_traffic_lights', 5)
     
-    shape_names = {
-        ShapeType.HEART.value: "하트",
-        ShapeType.CIRCLE.value: "원",
-        ShapeType.STAR.value: "별",
-        ShapeType.DIGIT_0.value: "숫자 0",
-        ShapeType.DIGIT_1.value: "숫자 1",
-        ShapeType.DIGIT_2.value: "숫자 2",
-        ShapeType.DIGIT_3.value: "숫자 3",
-        ShapeType.DIGIT_4.value: "숫자 4",
-        ShapeType.DIGIT_5.value: "숫자 5",
-        ShapeType.DIGIT_6.value: "숫자 6",
-        ShapeType.DIGIT_7.value: "숫자 7",
-        ShapeType.DIGIT_8.value: "숫자 8",
-        ShapeType.DIGIT_9.value: "숫자 9",
-        ShapeType.CUSTOM.value: "사용자 정의",
-    }
-    
-    st.caption(f"모양: {shape_names.get(shape_type, '미선택')}")
+    st.caption(f"모양: {_SHAPE_NAMES.get(shape_type, '미선택')}")
     st.caption(f"거리: {distance:.1f}km / 신호등: {lights}개 이하")
     
     # 검색 버튼
@@ -317,10 +326,21 @@ def get_current_shape() -> Shape:
     
     points = []
     if shape_type == ShapeType.CUSTOM:
+        # 점이 바뀌지 않았으면 (custom_points_rev 동일) 이전 변환 결과 재사용
+        rev = st.session_state.get('custom_points_rev', 0)
+        cached = st.session_state.get('_custom_shape_points')
+        if cached is not None and cached[0] == rev:
+            return Shape(shape_type=shape_type, points=list(cached[1]))
+        
         custom_points = st.session_state.get('custom_points', [])
         # 정규화된 좌표 (x, y: 0~1 범위)를 Coordinate로 변환
         # 실제 위경도 변환은 Phase 3에서 bounding box 기준으로 수행
-        points = [Coordinate(p.get('y', 0), p.get('x', 0)) if isinstance(p, dict) 
-                  else p for p in custom_points]
+        if isinstance(custom_points, np.ndarray):
+            points = [Coordinate(y, x) for y, x in custom_points.tolist()]
+        else:
+            points = [Coordinate(p.get('y', 0), p.get('x', 0)) if isinstance(p, dict) 
+                      else p for p in custom_points]
+        st.session_state._custom_shape_points = (rev, points)
+        points = list(points)
     
     return Shape(shape_type=shape_type, points=points)
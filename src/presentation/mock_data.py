@@ -3,13 +3,30 @@ Mock 데이터
 Phase 1 UI 테스트용 더미 데이터
 """
 from typing import List
+
+import numpy as np
+import streamlit as st
+
 from src.domain.entities import RouteInfo, Coordinate
 
 
+# 10도 간격 각도 샘플에 대한 단위 도형 (모듈 로드 시 1회 계산)
+_T = np.radians(np.arange(0, 360, 10))
+# 파라메트릭 하트 방정식 (x, y를 16으로 나눠 scale 1 기준으로 정규화)
+_HEART_X = 16 * np.sin(_T) ** 3 / 16
+_HEART_Y = (13 * np.cos(_T) - 5 * np.cos(2 * _T) - 2 * np.cos(3 * _T) - np.cos(4 * _T)) / 16
+_CIRCLE_COS = np.cos(_T)
+_CIRCLE_SIN = np.sin(_T)
+
+
+@st.cache_data(show_spinner=False)
 def generate_mock_routes(center_lat: float = 37.5665, center_lng: float = 126.9780) -> List[RouteInfo]:
     """
     테스트용 Mock 경로 데이터 생성
     
+    같은 중심 좌표에 대해서는 재실행마다 다시 만들지 않도록 캐시
+    (호출마다 복사본이 반환되므로 결과를 수정해도 캐시에 영향 없음)
+    
     Args:
         center_lat: 중심 위도
         center_lng: 중심 경도
@@ -74,39 +91,17 @@ def generate_mock_routes(center_lat: float = 37.5665, center_lng: float = 126.97
 
 def _generate_heart_coords(center_lat: float, center_lng: float, scale: float = 0.01) -> List[Coordinate]:
     """하트 모양 좌표 생성"""
-    import math
-    
-    coords = []
-    # 파라메트릭 하트 방정식
-    for t in range(0, 360, 10):
-        rad = math.radians(t)
-        # 하트 방정식
-        x = 16 * (math.sin(rad) ** 3)
-        y = 13 * math.cos(rad) - 5 * math.cos(2 * rad) - 2 * math.cos(3 * rad) - math.cos(4 * rad)
-        
-        # 스케일 조정 및 중심 이동
-        lat = center_lat + (y / 16) * scale
-        lng = center_lng + (x / 16) * scale
-        
-        coords.append(Coordinate(lat=lat, lng=lng))
-    
-    # 시작점으로 돌아오기
-    if coords:
-        coords.append(coords[0])
-    
-    return coords
+    return _closed_coords(center_lat + _HEART_Y * scale, center_lng + _HEART_X * scale)
 
 
 def _generate_circle_coords(center_lat: float, center_lng: float, radius: float = 0.01) -> List[Coordinate]:
     """원형 좌표 생성"""
-    import math
-    
-    coords = []
-    for t in range(0, 360, 10):
-        rad = math.radians(t)
-        lat = center_lat + radius * math.cos(rad)
-        lng = center_lng + radius * math.sin(rad)
-        coords.append(Coordinate(lat=lat, lng=lng))
+    return _closed_coords(center_lat + radius * _CIRCLE_COS, center_lng + radius * _CIRCLE_SIN)
+
+
+def _closed_coords(lats: np.ndarray, lngs: np.ndarray) -> List[Coordinate]:
+    """위도/경도 배열을 좌표 목록으로 변환하고 시작점으로 돌아오도록 닫음"""
+    coords = [Coordinate(lat=lat, lng=lng) for lat, lng in zip(lats.tolist(), lngs.tolist())]
     
     # 시작점으로 돌아오기
     if coords:
@@ -2,6 +2,7 @@
 UI 상태 관리
 Streamlit session_state를 활용한 애플리케이션 상태 관리
 """
+import numpy as np
 import streamlit as st
 from typing import Optional, List
 from dataclasses import dataclass, field
@@ -12,6 +13,14 @@ from src.domain.entities import (
 )
 
 
+# 경로 카드 정렬/요약용 지표 열 (route_metrics 구조화 배열)
+ROUTE_METRICS_DTYPE = np.dtype([
+    ('sim', np.float64),
+    ('dist', np.float64),
+    ('lights', np.int32),
+])
+
+
 @dataclass
 class AppState:
     """애플리케이션 전체 상태"""
@@ -42,10 +51,12 @@ def init_session_state():
     defaults = {
         'bounding_box': None,
         'shape_type': ShapeType.HEART.value,
-        'custom_points': [],
+        'custom_points': np.empty((0, 2)),
+        'custom_points_rev': 0,
         'target_distance': 5.0,
         'max_traffic_lights': 5,
         'routes': [],
+        'route_metrics': None,
         'selected_route_id': None,
         'is_loading': False,
         'error_message': None,
@@ -79,9 +90,26 @@ def clear_error():
     st.session_state.error_message = None
 
 
+def build_route_metrics(routes: List[RouteInfo]) -> np.ndarray:
+    """
+    경로 지표를 열 단위 구조화 배열로 변환
+    
+    Args:
+        routes: 경로 목록
+        
+    Returns:
+        ROUTE_METRICS_DTYPE 배열 (경로 순서 유지)
+    """
+    metrics = np.empty(len(routes), dtype=ROUTE_METRICS_DTYPE)
+    for i, r in enumerate(routes):
+        metrics[i] = (r.shape_similarity, r.total_distance_km, r.traffic_light_count)
+    return metrics
+
+
 def set_routes(routes: List[RouteInfo]):
-    """경로 결과 설정"""
+    """경로 결과 설정 (정렬/요약용 지표 배열도 함께 갱신)"""
     st.session_state.routes = routes
+    st.session_state.route_metrics = build_route_metrics(routes)
 
 
 def select_route(route_id: Optional[int]):
@@ -89,21 +117,37 @@ def select_route(route_id: Optional[int]):
     st.session_state.selected_route_id = route_id
 
 
+def set_custom_points(points: np.ndarray):
+    """
+    사용자 정의 점 설정
+    
+    내용이 바뀐 경우에만 저장하고 custom_points_rev를 올려,
+    변환 결과를 캐시하는 쪽(get_current_shape)이 재실행마다 다시 만들지 않도록 함
+    
+    Args:
+        points: (N, 2) [y, x] 정규화 좌표 배열
+    """
+    if np.array_equal(st.session_state.get('custom_points', []), points):
+        return
+    st.session_state.custom_points = points
+    st.session_state.custom_points_rev = st.session_state.get('custom_points_rev', 0) + 1
+
+
 def toggle_drawing_mode():
     """그리기 모드 토글"""
     st.session_state.is_drawing_mode = not st.session_state.is_drawing_mode
     if not st.session_state.is_drawing_mode:
-        st.session_state.custom_points = []
+        set_custom_points(np.empty((0, 2)))
 
 
 def add_drawing_point(lat: float, lng: float):
     """그리기 포인트 추가"""
-    st.session_state.custom_points.append(Coordinate(lat, lng))
+    set_custom_points(np.vstack((st.session_state.custom_points, [(lat, lng)])))
 
 
 def clear_drawing_points():
     """그리기 포인트 초기화"""
-    st.session_state.custom_points = []
+    set_custom_points(np.empty((0, 2)))
 
 
 def set_bounding_box(bbox: BoundingBox):
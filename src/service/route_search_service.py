@@ -4,10 +4,12 @@ UI → 데이터 → 알고리즘 → 결과 파이프라인 통합
 """
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Union
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, Future
 
+import numpy as np
+
 from src.domain.entities import (
     BoundingBox, Shape, ShapeType, Constraints, 
     RouteInfo, Coordinate, SearchResult
@@ -80,16 +82,20 @@ class RouteSearchService:
     def __init__(
         self,
         use_cache: bool = True,
-        cache_dir: str = ".cache/graphs"
+        cache_dir: str = ".cache/graphs",
+        graph_loader: Optional[Callable[[BoundingBox], RoadGraph]] = None
     ):
         """
         Args:
             use_cache: 그래프 캐싱 사용 여부
             cache_dir: 캐시 디렉토리
+            graph_loader: 확장된 영역 → 그래프 로더 (지정 시 fetch_graph 대신 사용,
+                          UI에서 프로세스 단위 메모리 캐시를 주입할 때 사용)
         """
         self.repository = OSMGraphRepository()
         self.shape_processor = ShapeProcessor()
         self.use_cache = use_cache
+        self.graph_loader = graph_loader
         
         if use_cache:
             self.cache_service = GraphCacheService(cache_dir)
@@ -213,9 +219,24 @@ class RouteSearchService:
         expanded_bbox = bbox.expand(expand_ratio)
         logger.info(f"그래프 로딩 영역 확장: {expand_ratio*100:.0f}% 마진 적용")
         
-        # 캐시 확인 (확장된 영역 기준)
+        if self.graph_loader:
+            return self.graph_loader(expanded_bbox)
+        
+        return self.fetch_graph(expanded_bbox)
+    
+    def fetch_graph(self, bbox: BoundingBox) -> RoadGraph:
+        """
+        주어진 영역의 그래프 조회 (파일 캐시 → OSM 순)
+        
+        Args:
+            bbox: 조회 영역 (확장 적용 후)
+            
+        Returns:
+            도로 그래프
+        """
+        # 캐시 확인
         if self.use_cache and self.cache_service:
-            cache_key = self.cache_service.get_cache_key(bbox=expanded_bbox)
+            cache_key = self.cache_service.get_cache_key(bbox=bbox)
             cached = self.cache_service.get(cache_key)
             if cached:
                 logger.info("캐시에서 그래프 로딩")
@@ -223,7 +244,7 @@ class RouteSearchService:
         
         # OSM에서 로딩
         logger.info("OSM에서 그래프 로딩")
-        graph = self.repository.get_graph_by_bbox(expanded_bbox, network_type="walk")
+        graph = self.repository.get_graph_by_bbox(bbox, network_type="walk")
         
         # 캐시 저장
         if self.use_cache and self.cache_service:
@@ -290,7 +311,9 @@ class RouteSearchService:
             max_iterations=10000,
             max_results=5,
             use_parallel=True,
-            max_workers=4
+            max_workers=4,
+            # Streamlit 서버(멀티스레드) 안에서 요청마다 프로세스 풀을 만드는 비용/위험을 피해 스레드 사용
+            executor_type='thread'
         )
         
         finder = RouteFinder(graph=graph, config=config)
@@ -319,7 +342,7 @@ class RouteSearchService:
 def create_search_request(
     bbox_dict: dict,
     shape_type: str,
-    custom_points: List[dict],
+    custom_points: Union[np.ndarray, List[dict]],
     target_distance: float,
     max_traffic_lights: int
 ) -> SearchRequest:
@@ -329,7 +352,7 @@ def create_search_request(
     Args:
         bbox_dict: 바운딩 박스 딕셔너리 (north, south, east, west)
         shape_type: 도형 타입 문자열
-        custom_points: 사용자 정의 점 목록
+        custom_points: 사용자 정의 점 ((N, 2) [y, x] 배열 또는 {'x', 'y'} 딕셔너리 목록, 0~1 정규화)
         target_distance: 목표 거리 (km)
         max_traffic_lights: 최대 신호등 수
         
@@ -348,11 +371,14 @@ def create_search_request(
     shape_type_enum = ShapeType(shape_type)
     points = []
     
-    if shape_type_enum == ShapeType.CUSTOM and custom_points:
-        points = [
-            Coordinate(lat=p.get('y', 0), lng=p.get('x', 0))
-            for p in custom_points
-        ]
+    if shape_type_enum == ShapeType.CUSTOM and len(custom_points) > 0:
+        if isinstance(custom_points, np.ndarray):
+            points = [Coordinate(lat=y, lng=x) for y, x in custom_points.tolist()]
+        else:
+            points = [
+                Coordinate(lat=p.get('y', 0), lng=p.get('x', 0))
+                for p in custom_points
+            ]
     
     shape = Shape(shape_type=shape_type_enum, points=points)
     
@@ -205,7 +205,6 @@ class ShapeTemplateRegistry:
     
     def _create_oval_points(self, num_points: int = 24) -> List[Tuple[float, float]]:
         """타원형 점 생성 (숫자 0용)"""
-        import math
         points = []
         for i in range(num_points):
             angle = 2 * math.pi * i / num_points - math.pi / 2  # 상단에서 시작
@@ -4,7 +4,9 @@
 """
 import math
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 from src.domain.entities import Coordinate, BoundingBox
 
@@ -95,6 +97,36 @@ class ShapeTransformer:
         
         return result
     
+    def rotate_many(
+        self,
+        points: np.ndarray,
+        angles_deg: Sequence[float],
+        center: Tuple[float, float] = (0.0, 0.0)
+    ) -> np.ndarray:
+        """
+        점들을 여러 각도로 한 번에 회전 (rotate의 배치 버전)
+        
+        Args:
+            points: (N, 2) 좌표 배열
+            angles_deg: 회전 각도 목록 (도, 반시계 방향)
+            center: 회전 중심
+            
+        Returns:
+            (K, N, 2) 회전된 좌표 배열 (K = 각도 개수)
+        """
+        theta = np.deg2rad(np.asarray(angles_deg, dtype=np.float64))
+        cos_a, sin_a = np.cos(theta), np.sin(theta)
+        
+        # (K, 2, 2) 회전 행렬: [[cos, -sin], [sin, cos]]
+        R = np.stack([
+            np.stack([cos_a, -sin_a], axis=-1),
+            np.stack([sin_a, cos_a], axis=-1),
+        ], axis=-2)
+        
+        c = np.asarray(center, dtype=np.float64)
+        shifted = np.asarray(points, dtype=np.float64) - c
+        return np.einsum('kij,nj->kni', R, shifted) + c
+    
     def scale(
         self,
         points: List[Tuple[float, float]],
@@ -8,7 +8,13 @@ from src.domain.entities import Coordinate
 from src.data.entities import Node, Edge, RoadGraph
 from src.algorithm.weight_sampler import WeightSampler, WeightVector
 from src.algorithm.astar import AStarPathFinder, PathCandidate
-from src.algorithm.pareto import ParetoFilter, ParetoCandidate
+from src.algorithm import _geom, _pareto_nb
+from src.algorithm import pareto as pareto_module
+from src.algorithm import route_finder as route_finder_module
+from src.algorithm.pareto import (
+    ParetoFilter, ParetoCandidate, ParetoBatch, dominates3, _pareto_front_mask, _top_k_indices,
+    _dominance_matrix
+)
 from src.algorithm.route_finder import RouteFinder, RouteSearchConfig
 
 
@@ -99,6 +105,34 @@ class TestWeightSampler:
         with pytest.raises(ValueError):
             sampler.sample(-5)
     
+    def test_sample_array(self):
+        """배열 샘플링: (n, 3) 형태이고 각 행의 합이 1"""
+        sampler = WeightSampler(seed=42)
+        
+        weights = sampler.sample_array(15)
+        with_corners = sampler.sample_with_corners_array(6)
+        
+        assert weights.shape == (15, 3)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+        assert with_corners.shape == (10, 3)
+        np.testing.assert_allclose(
+            with_corners[:4], [w.to_tuple() for w in sampler.get_corner_weights()]
+        )
+    
+    def test_cyclic_weights(self):
+        """순환 가중치: 각 목적 함수가 한 번씩 주 목적이 됨"""
+        sampler = WeightSampler()
+        
+        weights = sampler.get_cyclic_weights(primary=0.7, secondary=0.2)
+        
+        assert len(weights) == 3
+        for k, w in enumerate(weights):
+            t = w.to_tuple()
+            assert np.argmax(t) == k
+            assert sum(t) == pytest.approx(1.0)
+        # 순환 순열이므로 정렬한 값은 모두 같음
+        assert len({tuple(sorted(round(v, 9) for v in w.to_tuple())) for w in weights}) == 1
+    
     def test_weight_vector_invalid_sum_raises_error(self):
         """가중치 합이 1이 아니면 에러 발생"""
         with pytest.raises(ValueError):
@@ -136,6 +170,29 @@ class TestParetoFilter:
         
         assert pf.dominates(obj1, obj2) is False
     
+    def test_dominates3_matches_generic(self):
+        """3목적 특수화 판정이 4차원 판정과 일치"""
+        pf = ParetoFilter()
+        values = [0.1, 0.2]
+        points = [(a, b, c) for a in values for b in values for c in values]
+        
+        for p in points:
+            for q in points:
+                # 4차원에 같은 값을 덧붙이면 4차원용 생성 함수로 판정됨
+                assert dominates3(p, q) == pf.dominates(p + (0.0,), q + (0.0,))
+    
+    @pytest.mark.parametrize("d", [1, 2, 4, 5])
+    def test_dominates_generated_matches_definition(self, d):
+        """차원별로 생성된 판정 함수가 지배 정의(모두 <=, 하나 이상 <)와 일치"""
+        pf = ParetoFilter()
+        rng = np.random.default_rng(d)
+        
+        for _ in range(200):
+            p = tuple(rng.integers(0, 3, size=d).tolist())
+            q = tuple(rng.integers(0, 3, size=d).tolist())
+            expected = all(a <= b for a, b in zip(p, q)) and any(a < b for a, b in zip(p, q))
+            assert pf.dominates(p, q) == expected
+    
     def test_filter_non_dominated_simple(self):
         """Non-dominated 필터링 테스트"""
         pf = ParetoFilter()
@@ -191,6 +248,111 @@ class TestParetoFilter:
         
         assert len(non_dominated) == 3
     
+    def test_filter_non_dominated_matches_pairwise(self):
+        """벡터화된 필터가 dominates() 쌍별 비교와 같은 결과를 반환"""
+        pf = ParetoFilter()
+        rng = np.random.default_rng(0)
+        
+        # 동일 값/동률이 자주 나오도록 이산 값 사용
+        values = rng.integers(0, 4, size=(40, 3)) / 4.0
+        candidates = [
+            PathCandidate(
+                path=[i], g_cost=0.0, f_cost=0.0,
+                shape_distance=v[0], length_penalty=v[1], crossing_penalty=v[2]
+            )
+            for i, v in enumerate(values)
+        ]
+        
+        objectives = [tuple(v) for v in values]
+        expected = [
+            i for i, obj in enumerate(objectives)
+            if not any(pf.dominates(other, obj) for other in objectives)
+        ]
+        
+        result = pf.filter_non_dominated(candidates)
+        
+        assert [p.path_candidate.path[0] for p in result] == expected
+    
+    def test_filter_non_dominated_keeps_duplicates(self):
+        """같은 목적 함수 벡터(부동소수점 잡음 포함)를 가진 후보는 모두 함께 유지"""
+        pf = ParetoFilter()
+        values = [
+            (0.2, 0.3, 0.0),
+            (0.2 + 1e-13, 0.3, 0.0),
+            (0.2, 0.3, 0.0),
+            (0.5, 0.5, 0.5),
+        ]
+        candidates = [
+            PathCandidate(
+                path=[i], g_cost=0.0, f_cost=0.0,
+                shape_distance=v[0], length_penalty=v[1], crossing_penalty=v[2]
+            )
+            for i, v in enumerate(values)
+        ]
+        
+        result = pf.filter_non_dominated(candidates)
+        
+        assert [p.path_candidate.path[0] for p in result] == [0, 1, 2]
+    
+    @pytest.mark.parametrize("constant_column", [None, 0, 2])
+    def test_pareto_front_mask_matches_broadcast(self, constant_column):
+        """정렬 기반 front 마스크(2D/N차원)가 전체 지배 행렬 결과와 일치"""
+        rng = np.random.default_rng(1)
+        A = rng.integers(0, 5, size=(60, 3)).astype(np.float64)
+        if constant_column is not None:
+            A[:, constant_column] = 0.5  # 2D 경로로 축소되는 경우
+        
+        leq = np.all(A[:, None, :] <= A[None, :, :], axis=2)
+        lt_any = np.any(A[:, None, :] < A[None, :, :], axis=2)
+        expected = ~(leq & lt_any).any(axis=0)
+        
+        np.testing.assert_array_equal(_pareto_front_mask(A), expected)
+    
+    def test_dominance_matrix_matches_broadcast(self):
+        """목적 함수별 누적 지배 행렬이 (n, n, d) 브로드캐스트 결과와 일치"""
+        rng = np.random.default_rng(3)
+        A = rng.integers(0, 4, size=(50, 3)).astype(np.float64)
+        
+        leq = np.all(A[:, None, :] <= A[None, :, :], axis=2)
+        lt_any = np.any(A[:, None, :] < A[None, :, :], axis=2)
+        
+        np.testing.assert_array_equal(_dominance_matrix(A), leq & lt_any)
+    
+    def test_get_pareto_ranks(self):
+        """Pareto 순위가 지배 계층 순서대로 할당되는지 확인"""
+        pf = ParetoFilter()
+        
+        objectives = [
+            (0.1, 0.5, 0.0),  # 순위 0
+            (0.5, 0.1, 0.0),  # 순위 0
+            (0.2, 0.6, 0.0),  # 0번에 지배 → 순위 1
+            (0.6, 0.6, 0.0),  # 1, 2번에 지배 → 순위 2
+            (0.1, 0.5, 0.0),  # 0번과 동일 → 순위 0
+        ]
+        candidates = [
+            PathCandidate(
+                path=[i], g_cost=0.0, f_cost=0.0,
+                shape_distance=s, length_penalty=l, crossing_penalty=c
+            )
+            for i, (s, l, c) in enumerate(objectives)
+        ]
+        
+        ranked = pf.get_pareto_ranks(candidates)
+        
+        assert [p.rank for p in ranked] == [0, 0, 1, 2, 0]
+    
+    def test_pareto_kernels_match_numpy(self, monkeypatch):
+        """JIT 커널(순위/혼잡 거리)이 NumPy 구현과 같은 결과를 반환"""
+        rng = np.random.default_rng(3)
+        A = rng.integers(0, 5, size=(50, 3)) / 4.0
+        
+        monkeypatch.setattr(pareto_module, "HAS_NUMBA", False)
+        expected_ranks = pareto_module._pareto_ranks(A)
+        expected_dist = pareto_module._crowding_distance(A)
+        
+        np.testing.assert_array_equal(_pareto_nb.fast_nds(A), expected_ranks)
+        np.testing.assert_allclose(_pareto_nb.crowding(A), expected_dist)
+    
     def test_select_top_k(self):
         """상위 k개 선택 테스트"""
         pf = ParetoFilter()
@@ -229,6 +391,37 @@ class TestParetoFilter:
         
         assert len(top_5) == 2
     
+    def test_pareto_batch_roundtrip(self):
+        """ParetoBatch는 후보 순서대로 목적 함수 행렬을 만들고 부분 선택/변환 시 값을 유지"""
+        candidates = [
+            PathCandidate(
+                path=[i], g_cost=0.0, f_cost=0.0,
+                shape_distance=0.1 * i, length_penalty=0.2, crossing_penalty=1.0 - 0.1 * i
+            )
+            for i in range(4)
+        ]
+        
+        batch = ParetoBatch.from_candidates(candidates)
+        batch.ranks = np.array([0, 1, 2, 3])
+        sub = batch.subset(np.array([3, 1]))
+        wrapped = sub.to_pareto_candidates()
+        
+        assert len(batch) == 4
+        np.testing.assert_allclose(batch.objectives[2], [0.2, 0.2, 0.8])
+        assert [c.path_candidate for c in wrapped] == [candidates[3], candidates[1]]
+        assert [c.rank for c in wrapped] == [3, 1]
+        assert wrapped[0].objectives == ParetoCandidate.from_path_candidate(candidates[3]).objectives
+    
+    def test_top_k_indices_matches_stable_sort(self):
+        """부분 선택 결과가 안정 내림차순 정렬의 앞 k개와 일치 (동률/무한대 포함)"""
+        rng = np.random.default_rng(2)
+        scores = rng.integers(0, 4, size=30).astype(np.float64)
+        scores[[3, 17]] = np.inf
+        
+        for k in range(1, 32):
+            expected = np.argsort(-scores, kind='stable')[:k]
+            np.testing.assert_array_equal(_top_k_indices(scores, k), expected)
+    
     def test_crowding_distance_calculation(self):
         """혼잡 거리 계산 테스트"""
         pf = ParetoFilter()
@@ -310,6 +503,44 @@ class TestAStarPathFinder:
             Coordinate(lat=37.5, lng=127.0),
         ]
     
+    def test_curve_heuristic_within_haversine_off_latitude(self):
+        """곡선 평균 위도에서 벗어난 고위도 노드에서도 축소한 곡선 거리 휴리스틱이 실제 거리 이하"""
+        graph = RoadGraph()
+        # 위도 60도 부근: 곡선은 59.95~60.05, 노드는 북쪽 60.3까지 퍼짐
+        node_id = 0
+        for lat in np.linspace(59.9, 60.3, 9):
+            for lng in np.linspace(10.0, 10.6, 7):
+                node_id += 1
+                graph.add_node(Node(id=node_id, lat=float(lat), lng=float(lng)))
+        graph.add_edge(Edge(id=1, source_id=1, target_id=2, length_m=100))
+        
+        curve = [
+            Coordinate(lat=59.95, lng=10.0),
+            Coordinate(lat=60.05, lng=10.0),
+            Coordinate(lat=60.05, lng=10.05),
+            Coordinate(lat=59.95, lng=10.05),
+        ]
+        pathfinder = AStarPathFinder(graph, curve, 5.0, 3, weights=(1.0, 0.0, 0.0))
+        pathfinder._sync_csr()
+        scale = pathfinder._curve_dist_scale
+        assert 0.0 < scale < 1.0
+        
+        # 실제 거리: 곡선 선분을 촘촘히 나눈 점까지의 Haversine 최소 거리
+        t = np.linspace(0.0, 1.0, 2001)
+        dense = np.concatenate([
+            np.column_stack((a.lat + t * (b.lat - a.lat), a.lng + t * (b.lng - a.lng)))
+            for a, b in zip(curve, curve[1:])
+        ])
+        exceeded = 0
+        for node in graph.nodes.values():
+            true_dist = min(_geom.haversine(node.lat, node.lng, lat, lng) for lat, lng in dense.tolist())
+            approx = pathfinder._compute_min_distance_to_curve(node)
+            assert scale * approx <= true_dist + 1e-9
+            exceeded += approx > true_dist
+        
+        # 축소하지 않으면 평균 위도보다 북쪽의 노드에서 실제 거리를 넘음
+        assert exceeded > 0
+    
     def test_pathfinder_initialization(self, simple_graph, target_curve):
         """PathFinder 초기화 테스트"""
         pathfinder = AStarPathFinder(
@@ -340,7 +571,121 @@ class TestAStarPathFinder:
         assert result is not None
         assert result.path[0] == 1
         assert result.path[-1] == 3
-    
+
+    def test_find_path_to_goal_bidir(self, simple_graph, target_curve):
+        """양방향 탐색이 단방향 탐색과 같은 비용의 경로를 찾음"""
+        pathfinder = AStarPathFinder(
+            graph=simple_graph,
+            target_curve=target_curve,
+            target_distance_km=5.0,
+            max_crossings=3
+        )
+
+        expected = pathfinder.find_path_to_goal(start_node_id=1, goal_node_id=3)
+        result = pathfinder.find_path_to_goal_bidir(start_node_id=1, goal_node_id=3)
+
+        assert result is not None
+        assert result.path[0] == 1
+        assert result.path[-1] == 3
+        assert len(result.path) == len(set(result.path))
+        assert result.g_cost == pytest.approx(expected.g_cost)
+
+    def test_remove_loops(self):
+        """경로 내 순환 구간 제거"""
+        assert AStarPathFinder._remove_loops([1, 2, 3, 2, 4]) == [1, 2, 4]
+        assert AStarPathFinder._remove_loops([1, 2, 3]) == [1, 2, 3]
+
+    def test_find_path_cycle(self, simple_graph, target_curve):
+        """순환 경로 탐색 테스트 (부모 포인터로 복원된 경로)"""
+        pathfinder = AStarPathFinder(
+            graph=simple_graph,
+            target_curve=target_curve,
+            target_distance_km=4.0,
+            max_crossings=3
+        )
+
+        result = pathfinder.find_path(start_node_id=1)
+
+        assert result is not None
+        assert result.path[0] == 1
+        assert result.path[-1] == 1
+        assert len(result.path) > 3
+        # 시작점을 제외한 중간 노드는 중복 없음
+        inner = result.path[1:-1]
+        assert len(inner) == len(set(inner))
+        # 연속한 노드는 모두 엣지로 연결됨
+        for a, b in zip(result.path, result.path[1:]):
+            assert simple_graph.get_edge_between(a, b) is not None
+        # 탐색 중 누적한 비용이 경로 전체 재계산과 일치
+        expected = pathfinder.cost_calculator.calculate(result.path, simple_graph)
+        assert result.f_cost == pytest.approx(expected.total_cost)
+        assert result.traffic_light_count == expected.traffic_light_count
+
+    def test_find_path_beam_width(self, simple_graph, target_curve):
+        """빔 폭 제한을 걸어도 유효한 순환 경로 반환"""
+        pathfinder = AStarPathFinder(
+            graph=simple_graph,
+            target_curve=target_curve,
+            target_distance_km=4.0,
+            max_crossings=3
+        )
+
+        result = pathfinder.find_path(start_node_id=1, beam_width=4)
+
+        assert result is not None
+        assert result.path[0] == result.path[-1] == 1
+        expected = pathfinder.cost_calculator.calculate(result.path, simple_graph)
+        assert result.f_cost == pytest.approx(expected.total_cost)
+
+    def test_min_distance_to_curve_matches_scalar(self, simple_graph, target_curve):
+        """벡터화된 곡선 거리가 선분별 스칼라 계산과 일치"""
+        pathfinder = AStarPathFinder(
+            graph=simple_graph,
+            target_curve=target_curve,
+            target_distance_km=5.0,
+            max_crossings=3
+        )
+
+        for node in simple_graph.nodes.values():
+            expected = min(
+                _geom.point_to_segment_distance(
+                    node.lat, node.lng, p1.lat, p1.lng, p2.lat, p2.lng,
+                    pathfinder._cos_mean_lat
+                )
+                for p1, p2 in zip(target_curve, target_curve[1:])
+            )
+            assert pathfinder._compute_min_distance_to_curve(node) == pytest.approx(expected)
+
+    def test_fast_distance_close_to_haversine(self, simple_graph, target_curve):
+        """등장방형 근사 거리가 Haversine 거리와 거의 일치"""
+        pathfinder = AStarPathFinder(
+            graph=simple_graph,
+            target_curve=target_curve,
+            target_distance_km=5.0,
+            max_crossings=3
+        )
+
+        node1 = simple_graph.get_node(1)
+        node3 = simple_graph.get_node(3)
+        approx = _geom.fast_distance(
+            node1.lat, node1.lng, node3.lat, node3.lng, pathfinder._cos_mean_lat
+        )
+
+        assert approx == pytest.approx(node1.distance_to(node3), rel=1e-3)
+
+    def test_curve_distance_kernels_agree(self, target_curve):
+        """컴파일 루프 커널과 벡터 커널의 결과가 일치"""
+        curve_lat = np.array([c.lat for c in target_curve])
+        curve_lng = np.array([c.lng for c in target_curve])
+        cos_lat = np.cos(np.radians(curve_lat.mean()))
+
+        for lat, lng in [(37.505, 127.005), (37.52, 127.02), (37.5, 127.0)]:
+            loop = _geom._min_distance_to_curve_loop(lat, lng, curve_lat, curve_lng, cos_lat)
+            vec = _geom._min_distance_to_curve_vec(
+                lat, lng, *_geom.curve_segments(curve_lat, curve_lng), cos_lat
+            )
+            assert loop == pytest.approx(vec, abs=1e-9)
+
     def test_find_path_invalid_start(self, simple_graph, target_curve):
         """존재하지 않는 시작 노드"""
         pathfinder = AStarPathFinder(
@@ -430,6 +775,27 @@ class TestRouteFinder:
         assert start_node is not None
         assert start_node in test_graph.nodes
     
+    def test_find_start_node_prefers_intersection(self, test_graph):
+        """더 가까운 막다른 노드보다 교차로를 선택하고, 그래프가 바뀌면 다시 계산"""
+        finder = RouteFinder(graph=test_graph)
+        curve = [Coordinate(lat=37.4999, lng=126.9999), Coordinate(lat=37.51, lng=127.01)]
+        
+        # 노드 1(모서리)은 이웃이 2개인 교차로
+        assert finder._find_start_node(curve) == 1
+        
+        # 시작점 바로 옆에 이웃 1개짜리 노드를 추가하면 여전히 1을 선택
+        test_graph.add_node(Node(id=100, lat=37.4999, lng=126.9999))
+        test_graph.add_edge(Edge(id=100, source_id=100, target_id=1, length_m=15))
+        assert finder._find_start_node(curve) == 1
+        
+        # 이웃이 2개가 되면 교차로가 되므로 선택됨
+        test_graph.add_edge(Edge(id=101, source_id=100, target_id=2, length_m=500))
+        assert finder._find_start_node(curve) == 100
+        
+        # 노드/엣지 수가 그대로인 교체(같은 ID로 이동)도 반영
+        test_graph.add_node(Node(id=100, lat=37.53, lng=127.03))
+        assert finder._find_start_node(curve) == 1
+    
     def test_generate_rotated_curves(self, test_graph, target_curve):
         """회전된 곡선 생성 테스트"""
         config = RouteSearchConfig(n_rotations=6)
@@ -441,6 +807,88 @@ class TestRouteFinder:
         for curve in rotated:
             assert len(curve) == len(target_curve)
     
+    def test_rotated_curve_arrays_match_coordinates(self, test_graph, target_curve):
+        """회전 배열로 만든 탐색기가 Coordinate 목록으로 만든 탐색기와 같은 곡선/경로 사용"""
+        finder = RouteFinder(graph=test_graph, config=RouteSearchConfig(n_rotations=3))
+        
+        curve_arrays = finder._rotate_curve_arrays(target_curve)
+        rotated = finder._generate_rotated_curves(target_curve)
+        
+        assert curve_arrays.shape == (3, len(target_curve), 2)
+        for curve, curve_arr in zip(rotated, curve_arrays):
+            from_list = AStarPathFinder(test_graph, curve, 1.0, 3)
+            from_arr = AStarPathFinder(test_graph, curve, 1.0, 3, target_curve_arr=curve_arr)
+            
+            np.testing.assert_array_equal(from_arr._curve_lat, from_list._curve_lat)
+            np.testing.assert_array_equal(from_arr._curve_lng, from_list._curve_lng)
+            assert from_arr.find_path(1).path == from_list.find_path(1).path
+    
+    def test_prune_infeasible_curves(self, test_graph):
+        """둘레가 [목표/r, 목표×r] 밖인 회전만 제외 (모두 밖이면 가장 가까운 하나 유지)"""
+        finder = RouteFinder(graph=test_graph)
+        assert finder.config.max_perimeter_ratio == 2.0
+        
+        # 위도 방향 왕복 선분: 0.0045도 ≈ 0.5km (왕복 1km), 0.0225도 ≈ 2.5km (왕복 5km)
+        def out_and_back(dlat):
+            return [[37.5, 127.0], [37.5 + dlat, 127.0], [37.5, 127.0]]
+        
+        curve_arrays = np.array([out_and_back(0.0045), out_and_back(0.0225)])
+        
+        kept = finder._prune_infeasible_curves(curve_arrays, 5.0)
+        assert kept.shape[0] == 1
+        np.testing.assert_array_equal(kept[0], curve_arrays[1])
+        
+        kept = finder._prune_infeasible_curves(curve_arrays, 1.5)
+        assert kept.shape[0] == 1
+        np.testing.assert_array_equal(kept[0], curve_arrays[0])
+        
+        # 두 회전 모두 구간 밖이면 목표에 가까운 쪽 하나만 유지
+        kept = finder._prune_infeasible_curves(curve_arrays, 100.0)
+        assert kept.shape[0] == 1
+        np.testing.assert_array_equal(kept[0], curve_arrays[1])
+        
+        finder.config.max_perimeter_ratio = None
+        assert finder._prune_infeasible_curves(curve_arrays, 5.0).shape[0] == 2
+    
+    def test_prune_infeasible_curves_monotone_in_target(self, test_graph):
+        """목표 거리를 둘레 구간 경계에 걸쳐 바꿔도 남는 회전 수가 단조롭게 변함"""
+        finder = RouteFinder(graph=test_graph)
+        ratio = finder.config.max_perimeter_ratio
+        
+        # 위도 37.5에서 남북으로 긴 타원: 회전에 따라 실제 둘레가 달라짐
+        t = np.linspace(0, 2 * np.pi, 73)
+        ellipse = [
+            Coordinate(lat=37.5 + 0.012 * np.cos(a), lng=127.0 + 0.004 * np.sin(a))
+            for a in t
+        ]
+        curve_arrays = finder._rotate_curve_arrays(ellipse)
+        
+        rad = np.radians(curve_arrays)
+        a = (
+            np.sin(np.diff(rad[:, :, 0], axis=1) / 2) ** 2
+            + np.cos(rad[:, :-1, 0]) * np.cos(rad[:, 1:, 0])
+            * np.sin(np.diff(rad[:, :, 1], axis=1) / 2) ** 2
+        )
+        perimeters = (2 * 6371 * np.arcsin(np.sqrt(a))).sum(axis=1)
+        assert perimeters.max() > perimeters.min() * 1.05
+        
+        # 구간 아래쪽 경계(목표 ≈ 둘레 × r)를 지나며 목표를 늘림
+        targets = np.linspace(perimeters.min() * ratio * 0.9, perimeters.max() * ratio * 1.1, 80)
+        counts = [len(finder._prune_infeasible_curves(curve_arrays, d)) for d in targets]
+        
+        # 목표가 둘레에서 멀어질수록 한 개씩 줄고 끝까지 하나는 남음
+        assert counts[0] == len(curve_arrays)
+        assert counts[-1] == 1
+        assert all(x >= y for x, y in zip(counts, counts[1:]))
+        
+        # 남는 회전은 항상 둘레가 긴 (목표에 가까운) 순서의 앞부분
+        for d in targets:
+            kept = finder._prune_infeasible_curves(curve_arrays, d)
+            kept_perimeters = np.sort([
+                perimeters[np.flatnonzero((curve_arrays == k).all(axis=(1, 2)))[0]] for k in kept
+            ])
+            np.testing.assert_array_equal(kept_perimeters, np.sort(perimeters)[-len(kept):])
+    
     def test_route_finder_empty_curve(self, test_graph):
         """빈 곡선 처리 테스트"""
         finder = RouteFinder(graph=test_graph)
@@ -452,7 +900,80 @@ class TestRouteFinder:
         )
         
         assert result == []
+    
+    def test_cyclic_weight_strategy(self, test_graph):
+        """순환 가중치 방식은 순환 3개 + 코너 4개만 탐색"""
+        finder = RouteFinder(
+            graph=test_graph,
+            config=RouteSearchConfig(weight_strategy='cyclic')
+        )
+        
+        weights = finder._generate_weights()
+        
+        assert len(weights) == 7
+    
+    def test_process_executor_matches_sequential(self, test_graph, target_curve):
+        """프로세스 풀 병렬 탐색이 순차 탐색과 같은 후보를 반환"""
+        common = dict(n_weight_samples=6, n_rotations=2, max_iterations=500)
+        sequential = RouteFinder(
+            graph=test_graph,
+            config=RouteSearchConfig(use_parallel=False, **common)
+        )
+        parallel = RouteFinder(
+            graph=test_graph,
+            config=RouteSearchConfig(
+                use_parallel=True, executor_type='process', max_workers=2, **common
+            )
+        )
+        
+        weights = sequential.weight_sampler.sample_with_corners_array(2)
+        curves = sequential._generate_rotated_curves(target_curve)
+        start_node_id = sequential._find_start_node(target_curve)
+        
+        expected = sequential._search_sequential(curves, weights, 5.0, 3, start_node_id)
+        result = parallel._search_parallel(curves, weights, 5.0, 3, start_node_id)
+        
+        def key(c):
+            return (c.f_cost, c.path)
+        
+        assert len(expected) > 0
+        assert sorted(map(key, result)) == sorted(map(key, expected))
 
+    
+    def test_thread_executor_keeps_task_order(self, test_graph, target_curve, monkeypatch):
+        """스레드 풀 탐색은 순차 탐색과 같은 순서로 결과를 모으고, 실패한 작업은 건너뜀"""
+        common = dict(n_weight_samples=6, n_rotations=2, max_iterations=500)
+        sequential = RouteFinder(
+            graph=test_graph,
+            config=RouteSearchConfig(use_parallel=False, **common)
+        )
+        parallel = RouteFinder(
+            graph=test_graph,
+            config=RouteSearchConfig(use_parallel=True, max_workers=3, **common)
+        )
+        
+        weights = sequential.weight_sampler.sample_with_corners_array(2)
+        curves = sequential._generate_rotated_curves(target_curve)
+        start_node_id = sequential._find_start_node(target_curve)
+        
+        expected = sequential._search_sequential(curves, weights, 5.0, 3, start_node_id)
+        result = parallel._search_parallel(curves, weights, 5.0, 3, start_node_id)
+        
+        assert [(c.f_cost, c.path) for c in result] == [(c.f_cost, c.path) for c in expected]
+        
+        # 첫 번째 가중치 조합만 실패하도록 만들면 나머지 결과는 그대로 수집
+        original = route_finder_module._run_search
+        failing_weight = tuple(weights[0])
+        
+        def flaky_search(graph, curve, curve_arr, weight, *args):
+            if weight == failing_weight:
+                raise RuntimeError("탐색 실패")
+            return original(graph, curve, curve_arr, weight, *args)
+        
+        monkeypatch.setattr(route_finder_module, '_run_search', flaky_search)
+        result = parallel._search_parallel(curves, weights, 5.0, 3, start_node_id)
+        
+        assert len(result) == len(expected) - len(curves)
 
 class TestIntegration:
     """통합 테스트"""
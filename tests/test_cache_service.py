@@ -2,11 +2,14 @@
 그래프 캐싱 서비스 테스트
 """
 import json
+import pickle
 import pytest
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.data.entities import Node, Edge, RoadGraph, RoadType
+from src.data import cache_service as cache_service_module
 from src.data.cache_service import GraphCacheService
 from src.domain.entities import BoundingBox
 
@@ -65,6 +68,13 @@ class TestGraphCacheService:
         assert key1 == key2
         assert key1 != key3
     
+    def test_get_cache_key_is_fixed_length_hex(self, cache_service: GraphCacheService):
+        """캐시 키는 파일명으로 쓸 수 있는 32자 16진수 문자열"""
+        key = cache_service.get_cache_key(lat=37.56, lng=126.97, distance_m=1000)
+        
+        assert len(key) == 32
+        assert all(c in "0123456789abcdef" for c in key)
+    
     def test_set_and_get(self, cache_service: GraphCacheService, sample_graph: RoadGraph):
         """캐시 저장 및 조회 테스트"""
         cache_key = "test_key"
@@ -80,6 +90,115 @@ class TestGraphCacheService:
         assert loaded_graph.node_count == sample_graph.node_count
         assert loaded_graph.edge_count == sample_graph.edge_count
     
+    def test_set_writes_npz_and_preserves_data(self, cache_service: GraphCacheService, sample_graph: RoadGraph):
+        """npz 캐시 왕복 시 노드/엣지 속성 보존 (이름 없는 엣지 포함)"""
+        cache_service.set("npz_key", sample_graph)
+        assert (Path(cache_service.cache_dir) / "npz_key.npz").exists()
+        
+        loaded = cache_service.get("npz_key")
+        
+        assert loaded.nodes == sample_graph.nodes
+        assert loaded.edges == sample_graph.edges
+        assert loaded.get_node(3).has_traffic_light is True
+        assert loaded.edges[2].name is None
+        assert loaded.edges[2].is_oneway is True
+        assert type(loaded.edges[1].id) is int
+        assert loaded.is_frozen
+    
+    def test_failed_set_keeps_previous_cache(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, monkeypatch
+    ):
+        """저장 도중 실패하면 기존 캐시 파일이 유지되고 임시 파일이 남지 않음"""
+        cache_service.set("atomic_key", sample_graph)
+        
+        def failing_savez(f, **arrays):
+            f.write(b"partial")
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(cache_service_module.np, "savez_compressed", failing_savez)
+        assert cache_service.set("atomic_key", RoadGraph()) is False
+        monkeypatch.undo()
+        
+        assert sorted(p.name for p in Path(cache_service.cache_dir).iterdir()) == ["atomic_key.npz"]
+        assert cache_service.get("atomic_key").edges == sample_graph.edges
+    
+    def test_get_arrays(self, cache_service: GraphCacheService, sample_graph: RoadGraph):
+        """npz 캐시에서 요청한 열 배열만 조회"""
+        cache_service.set("arrays_key", sample_graph)
+        
+        arrays = cache_service.get_arrays("arrays_key", columns=["node_id", "node_has_light"])
+        
+        assert set(arrays) == {"node_id", "node_has_light"}
+        assert arrays["node_id"].tolist() == [1, 2, 3]
+        assert arrays["node_has_light"].tolist() == [False, False, True]
+        assert len(cache_service.get_arrays("arrays_key")["edge_len"]) == 2
+        assert cache_service.get_arrays("missing_key") is None
+    
+    def test_get_falls_back_to_json(self, cache_service: GraphCacheService, sample_graph: RoadGraph):
+        """이전 형식인 JSON 캐시 파일도 조회됨"""
+        cache_service._save_to_json(sample_graph, Path(cache_service.cache_dir) / "legacy_key.json")
+        
+        loaded = cache_service.get("legacy_key")
+        
+        assert loaded is not None
+        assert loaded.edges == sample_graph.edges
+    
+    def test_pickle_cache_requires_allow_pickle(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, temp_cache_dir
+    ):
+        """pickle 캐시는 allow_pickle=True일 때만 로드"""
+        with open(Path(temp_cache_dir) / "legacy_key.pkl", 'wb') as f:
+            pickle.dump(sample_graph, f)
+        
+        assert cache_service.get("legacy_key") is None
+        
+        loaded = GraphCacheService(cache_dir=temp_cache_dir, allow_pickle=True).get("legacy_key")
+        assert loaded is not None
+        assert loaded.edges == sample_graph.edges
+    
+    def test_get_keeps_loaded_graphs_in_memory(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, monkeypatch
+    ):
+        """디스크에서 읽은 그래프는 메모리 LRU에서 재사용되고, 삭제/재저장 시 무효화"""
+        monkeypatch.setattr(cache_service, "MEMORY_CACHE_SIZE", 2)
+        for key in ("a", "b", "c"):
+            cache_service.set(key, sample_graph)
+        
+        first = cache_service.get("a")
+        assert first is not sample_graph
+        assert cache_service.get("a") is first
+        cache_service.get("b")
+        cache_service.get("c")
+        assert list(cache_service._memory_cache) == ["b", "c"]
+        
+        cache_service.set("b", RoadGraph())
+        assert cache_service.get("b").node_count == 0
+        
+        cache_service.delete("c")
+        assert cache_service.get("c") is None
+    
+    def test_memory_cache_shared_across_threads(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, monkeypatch
+    ):
+        """여러 스레드가 같은 인스턴스로 조회/재저장해도 LRU가 깨지지 않고 최대 개수 유지"""
+        monkeypatch.setattr(cache_service, "MEMORY_CACHE_SIZE", 2)
+        keys = ["a", "b", "c", "d"]
+        for key in keys:
+            cache_service.set(key, sample_graph)
+        
+        def worker(offset: int) -> None:
+            for i in range(200):
+                key = keys[(i + offset) % len(keys)]
+                if i % 50 == 49:
+                    cache_service.set(key, sample_graph)
+                else:
+                    assert cache_service.get(key) is not None
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(worker, range(4)))
+        
+        assert len(cache_service._memory_cache) <= 2
+    
     def test_get_nonexistent(self, cache_service: GraphCacheService):
         """존재하지 않는 캐시 조회 테스트"""
         result = cache_service.get("nonexistent_key")
@@ -124,6 +243,31 @@ class TestGraphCacheService:
         
         assert stats["file_count"] == 2
         assert stats["total_size_mb"] >= 0
+    
+    def test_get_cache_stats_tracks_changes_without_rescan(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, monkeypatch
+    ):
+        """첫 조회 이후에는 디렉토리 재조회 없이 set/delete/clear_all을 반영"""
+        cache_service.set("key1", sample_graph)
+        assert cache_service.get_cache_stats()["file_count"] == 1
+        
+        def fail_glob(*args, **kwargs):
+            raise AssertionError("캐시 디렉토리를 다시 조회함")
+        
+        monkeypatch.setattr(type(cache_service.cache_dir), "glob", fail_glob)
+        
+        cache_service.set("key2", sample_graph)
+        cache_service.set("key2", sample_graph)
+        assert cache_service.get_cache_stats()["file_count"] == 2
+        
+        cache_service.delete("key1")
+        assert cache_service.get_cache_stats()["file_count"] == 1
+        
+        monkeypatch.undo()
+        cache_service.clear_all()
+        stats = cache_service.get_cache_stats()
+        assert stats["file_count"] == 0
+        assert stats["total_size_mb"] == 0
 
 
 class TestGraphJsonSerialization:
@@ -172,6 +316,18 @@ class TestGraphJsonSerialization:
         assert len(data["edges"]) == 1
         assert data["edges"][0]["name"] == "테스트로"
     
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_export_to_json_streamed_matches_dict(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, temp_cache_dir, pretty: bool
+    ):
+        """스트리밍 저장과 들여쓰기 저장 모두 _graph_to_dict와 같은 내용"""
+        filepath = Path(temp_cache_dir) / "streamed.json"
+        
+        assert cache_service.export_to_json(sample_graph, str(filepath), pretty=pretty) is True
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            assert json.load(f) == cache_service_module._graph_to_dict(sample_graph)
+    
     def test_import_from_json(self, cache_service: GraphCacheService, sample_graph: RoadGraph, temp_cache_dir):
         """JSON 가져오기 테스트"""
         filepath = Path(temp_cache_dir) / "test_graph.json"
@@ -191,6 +347,19 @@ class TestGraphJsonSerialization:
         assert node2 is not None
         assert node2.has_traffic_light is True
     
+    def test_roundtrip_without_orjson(
+        self, cache_service: GraphCacheService, sample_graph: RoadGraph, temp_cache_dir, monkeypatch
+    ):
+        """orjson이 없으면 표준 json으로 같은 내용을 저장/로드"""
+        monkeypatch.setattr(cache_service_module, "orjson", None)
+        filepath = Path(temp_cache_dir) / "stdlib.json"
+        
+        assert cache_service.export_to_json(sample_graph, str(filepath)) is True
+        loaded = cache_service.import_from_json(str(filepath))
+        
+        assert loaded.nodes == sample_graph.nodes
+        assert loaded.edges == sample_graph.edges
+    
     def test_import_nonexistent_file(self, cache_service: GraphCacheService):
         """존재하지 않는 파일 가져오기 테스트"""
         result = cache_service.import_from_json("nonexistent.json")
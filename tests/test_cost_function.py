@@ -4,17 +4,21 @@ Phase 4: ShapeDistance, LengthPenalty, CrossingPenalty
 """
 import pytest
 import math
+import numpy as np
 from typing import List
 
 from src.domain.entities import Coordinate
 from src.data.entities import Node, Edge, RoadGraph, RoadType
 from src.cost.cost_function import (
+    _haversine_vec,
+    KDTREE_MIN_SEGMENTS,
     CostCalculator,
     ShapeDistanceCalculator,
     LengthPenaltyCalculator,
     CrossingPenaltyCalculator,
     CostResult,
 )
+from src.cost._kernels import edge_curve_distance, edge_curve_distances
 
 
 # ============================================================================
@@ -137,6 +141,183 @@ class TestShapeDistanceCalculator:
         
         assert len(samples) >= 3
 
+    
+    def test_point_to_curve_distance_matches_segment_loop(self, target_curve: List[Coordinate]):
+        """배열 연산 곡선 거리가 선분별 스칼라 계산의 최소값과 일치 (길이 0 선분 포함)"""
+        curve = [target_curve[0]] + target_curve  # 첫 선분은 길이 0 (점)
+        calculator = ShapeDistanceCalculator(curve, target_distance_km=5.0)
+        
+        points = [
+            Coordinate(lat=37.505, lng=127.005),
+            Coordinate(lat=37.49, lng=126.99),
+            Coordinate(lat=37.5, lng=127.004),
+            Coordinate(lat=37.52, lng=127.03),
+        ]
+        for point in points:
+            expected = min(
+                calculator._point_to_segment_distance(point, curve[i], curve[i + 1])
+                for i in range(len(curve) - 1)
+            )
+            assert calculator._point_to_curve_distance(point) == pytest.approx(expected, rel=1e-12, abs=1e-12)
+    
+    def test_haversine_vec_matches_scalar(self, target_curve: List[Coordinate]):
+        """배열 Haversine이 스칼라 Haversine과 같은 거리를 반환"""
+        calculator = ShapeDistanceCalculator(target_curve, target_distance_km=5.0)
+        origin = Coordinate(lat=37.505, lng=127.002)
+        
+        dists = _haversine_vec(
+            math.radians(origin.lat), math.radians(origin.lng),
+            np.radians([c.lat for c in target_curve]), np.radians([c.lng for c in target_curve])
+        )
+        
+        for c, d in zip(target_curve, dists):
+            assert d == pytest.approx(calculator._haversine_distance(origin, c), rel=1e-12)
+    
+    def test_edge_distance_cache(self, simple_graph: RoadGraph, target_curve: List[Coordinate]):
+        """엣지 거리는 (노드 ID, 노드 ID, 샘플 수)별로 캐시되고 clear_cache로 비워짐"""
+        calculator = ShapeDistanceCalculator(target_curve, target_distance_km=5.0)
+        node2 = simple_graph.get_node(2)
+        node3 = simple_graph.get_node(3)
+        
+        first = calculator.calculate_edge_distance(node2, node3)
+        calculator.calculate_path_distance([1, 2, 3], simple_graph)
+        
+        assert calculator.calculate_edge_distance(node2, node3) == first
+        assert set(calculator._edge_dist_cache) == {(1, 2, 3), (2, 3, 3)}
+        
+        calculator.clear_cache()
+        assert calculator._edge_dist_cache == {}
+    
+    @pytest.mark.parametrize("min_samples", [1, 2, 3, 5])
+    def test_edge_distance_matches_sampled_points(self, target_curve: List[Coordinate], min_samples: int):
+        """배치 엣지 거리가 샘플 좌표별 곡선 거리의 평균과 일치"""
+        calculator = ShapeDistanceCalculator(target_curve, target_distance_km=5.0)
+        node1 = Node(id=1, lat=37.502, lng=127.003)
+        node2 = Node(id=2, lat=37.507, lng=127.012)
+        
+        samples = calculator._sample_edge_points(node1, node2, min_samples)
+        expected = sum(calculator._point_to_curve_distance(p) for p in samples) / len(samples)
+        
+        result = calculator.calculate_edge_distance(node1, node2, min_samples)
+        
+        assert result == pytest.approx(expected, rel=1e-12)
+    
+    @pytest.mark.parametrize("min_samples", [1, 3, 5])
+    def test_edge_curve_kernel_matches_numpy(self, target_curve: List[Coordinate], min_samples: int):
+        """루프 커널(numba 또는 Python)이 NumPy 배열 연산 경로와 일치 (길이 0 선분 포함)"""
+        curve = target_curve[:2] + [target_curve[1]] + target_curve[2:]
+        calculator = ShapeDistanceCalculator(curve, target_distance_km=5.0)
+        args = (calculator._cs_lat, calculator._cs_lng, calculator._seg_dy, calculator._seg_dx)
+        lat1 = np.array([37.502, 37.499, 37.51])
+        lng1 = np.array([127.003, 127.0, 127.02])
+        lat2 = np.array([37.507, 37.499, 37.5])
+        lng2 = np.array([127.012, 127.0, 127.01])
+        
+        expected = calculator._edge_to_curve_distance_np(lat1[0], lng1[0], lat2[0], lng2[0], min_samples)
+        result = edge_curve_distance(lat1[0], lng1[0], lat2[0], lng2[0], min_samples, *args)
+        assert result == pytest.approx(expected, rel=1e-9)
+        
+        batch = edge_curve_distances(lat1, lng1, lat2, lng2, min_samples, *args)
+        for e in range(len(lat1)):
+            single = calculator._edge_to_curve_distance_np(lat1[e], lng1[e], lat2[e], lng2[e], min_samples)
+            assert batch[e] == pytest.approx(single, rel=1e-9, abs=1e-12)
+    
+    def test_fast_distance_close_to_haversine(self, target_curve: List[Coordinate]):
+        """등장방형 근사 모드는 Haversine 결과와 거의 같고, 커널과 NumPy 경로가 일치"""
+        exact = ShapeDistanceCalculator(target_curve, target_distance_km=5.0)
+        fast = ShapeDistanceCalculator(target_curve, target_distance_km=5.0, fast_distance=True)
+        node1 = Node(id=1, lat=37.502, lng=127.003)
+        node2 = Node(id=2, lat=37.507, lng=127.012)
+        
+        expected = exact.calculate_edge_distance(node1, node2)
+        result = fast.calculate_edge_distance(node1, node2)
+        assert result == pytest.approx(expected, rel=1e-3)
+        
+        numpy_result = fast._edge_to_curve_distance_np(node1.lat, node1.lng, node2.lat, node2.lng, 3)
+        assert result == pytest.approx(numpy_result, rel=1e-9)
+        
+        point = Coordinate(lat=37.503, lng=127.004)
+        assert fast._point_to_curve_distance(point) == pytest.approx(
+            exact._point_to_curve_distance(point), rel=1e-3
+        )
+    
+    @pytest.mark.parametrize("fast_distance", [False, True])
+    def test_kdtree_candidates_match_full_scan(self, fast_distance: bool):
+        """긴 곡선의 KD-tree 후보 계산이 전체 선분 계산과 정확히 일치 (곡선 근처/먼 점 모두)"""
+        n = KDTREE_MIN_SEGMENTS * 2
+        curve = [
+            Coordinate(
+                lat=37.5 + 0.01 * (1 + 0.3 * math.sin(5 * a)) * math.sin(a),
+                lng=127.0 + 0.0125 * (1 + 0.3 * math.sin(5 * a)) * math.cos(a)
+            )
+            for a in np.linspace(0, 2 * math.pi, n + 1)
+        ]
+        curve.insert(10, curve[10])  # 길이 0 선분 포함
+        calculator = ShapeDistanceCalculator(curve, target_distance_km=5.0, fast_distance=fast_distance)
+        assert calculator._curve_tree is not None
+        
+        rng = np.random.default_rng(0)
+        lat = np.radians(37.5 + rng.uniform(-0.05, 0.05, (300, 3)))
+        lng = np.radians(127.0 + rng.uniform(-0.06, 0.06, (300, 3)))
+        
+        np.testing.assert_array_equal(
+            calculator._min_distance_kdtree(lat, lng),
+            calculator._min_distance_full(lat, lng)
+        )
+        
+        point = Coordinate(lat=37.503, lng=127.004)
+        expected = calculator._min_distance_full(np.radians([point.lat]), np.radians([point.lng]))[0]
+        assert calculator._point_to_curve_distance(point) == expected
+    
+    @pytest.mark.parametrize("n_points", [5, KDTREE_MIN_SEGMENTS * 2])
+    def test_float32_close_to_float64(self, n_points: int):
+        """float32 모드 엣지 거리는 float64 결과와 1mm 이내로 일치"""
+        curve = [
+            Coordinate(lat=37.5 + 0.01 * math.sin(a), lng=127.0 + 0.0125 * math.cos(a))
+            for a in np.linspace(0, 2 * math.pi, n_points + 1)
+        ]
+        exact = ShapeDistanceCalculator(curve, target_distance_km=5.0)
+        single = ShapeDistanceCalculator(curve, target_distance_km=5.0, use_float32=True)
+        assert single._cs_lat.dtype == np.float32
+        
+        rng = np.random.default_rng(1)
+        lat1 = 37.5 + rng.uniform(-0.02, 0.02, 200)
+        lng1 = 127.0 + rng.uniform(-0.02, 0.02, 200)
+        lat2 = lat1 + 0.001
+        lng2 = lng1 - 0.001
+        
+        np.testing.assert_allclose(
+            single.calculate_edge_distances(lat1, lng1, lat2, lng2),
+            exact.calculate_edge_distances(lat1, lng1, lat2, lng2),
+            rtol=0, atol=1e-6
+        )
+        
+        node1 = Node(id=1, lat=lat1[0], lng=lng1[0])
+        node2 = Node(id=2, lat=lat2[0], lng=lng2[0])
+        assert single.calculate_edge_distance(node1, node2) == pytest.approx(
+            exact.calculate_edge_distance(node1, node2), abs=1e-6
+        )
+    
+    @pytest.mark.parametrize("fast_distance", [False, True])
+    def test_min_distance_reuses_scratch_buffers(self, target_curve: List[Coordinate], fast_distance: bool):
+        """재사용 버퍼 계산이 점-투영점 거리 배열의 최소값과 일치하고, 같은 형태면 버퍼를 재사용"""
+        calculator = ShapeDistanceCalculator(target_curve, target_distance_km=5.0, fast_distance=fast_distance)
+        lat = np.radians([37.501, 37.503, 37.507])
+        lng = np.radians([127.002, 127.006, 127.011])
+        
+        result = calculator._min_distance_full(lat, lng)
+        buffers = calculator._scratch
+        calculator._min_distance_full(lat + 1e-5, lng)
+        assert calculator._scratch is buffers
+        
+        t = np.clip(((lng[:, None] - calculator._cs_lng) * calculator._seg_dx +
+                     (lat[:, None] - calculator._cs_lat) * calculator._seg_dy) / calculator._seg_len_sq, 0.0, 1.0)
+        t[:, calculator._seg_is_point] = 0.0
+        expected = calculator._distance_vec(
+            lat[:, None], lng[:, None],
+            calculator._cs_lat + t * calculator._seg_dy, calculator._cs_lng + t * calculator._seg_dx
+        ).min(axis=1)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
 
 # ============================================================================
 # LengthPenaltyCalculator 테스트
@@ -233,6 +414,13 @@ class TestCrossingPenaltyCalculator:
         # 중간 노드: 2(신호등), 3(없음) -> 1개
         assert count == 1
     
+    def test_count_traffic_lights_with_unknown_node(self, simple_graph: RoadGraph):
+        """그래프에 없는 노드가 섞여 있어도 있는 노드의 신호등만 카운트"""
+        calculator = CrossingPenaltyCalculator(max_crossings=5)
+        
+        # 중간 노드: 2(신호등), 99(없는 노드), 4(신호등) -> 2개
+        assert calculator.count_traffic_lights([1, 2, 99, 4, 3], simple_graph) == 2
+    
     def test_within_limit_returns_zero_penalty(self, simple_graph: RoadGraph):
         """허용 범위 내면 페널티 0"""
         calculator = CrossingPenaltyCalculator(max_crossings=5)
@@ -346,6 +534,118 @@ class TestCostCalculator:
         
         assert abs(result.total_cost - expected_total) < 0.001
     
+    def test_finalize_matches_calculate(self, simple_graph: RoadGraph, target_curve: List[Coordinate]):
+        """엣지별 누적 값으로 만든 결과가 calculate()와 동일"""
+        calculator = CostCalculator(
+            target_curve=target_curve,
+            target_distance_km=3.0,
+            max_crossings=0,
+            weights=(0.5, 0.3, 0.2)
+        )
+        
+        path = [1, 2, 3, 4, 1]
+        shape_km = 0.0
+        length_km = 0.0
+        for a, b in zip(path, path[1:]):
+            node1, node2 = simple_graph.get_node(a), simple_graph.get_node(b)
+            edge = simple_graph.get_edge_between(a, b)
+            _, shape_dist = calculator.calculate_edge_terms(node1, node2, edge)
+            shape_km += shape_dist
+            length_km += edge.length_km
+        lights = sum(simple_graph.get_node(n).has_traffic_light for n in path[1:-1])
+        
+        expected = calculator.calculate(path, simple_graph)
+        result = calculator.finalize(shape_km, length_km, lights)
+        
+        assert result == expected
+    
+    @pytest.mark.parametrize("path", [[1, 2, 3, 4], [1, 2, 99, 4], [4, 3, 2, 1, 2]])
+    def test_walk_path_matches_separate_calculators(
+        self, simple_graph: RoadGraph, target_curve: List[Coordinate], path: List[int]
+    ):
+        """한 번의 경로 순회 결과가 계산기별 개별 계산과 일치 (없는 노드 포함 경로 포함)"""
+        calculator = CostCalculator(target_curve, 3.0, max_crossings=1)
+        
+        shape_km, length_km, lights = calculator._walk_path(path, simple_graph)
+        
+        assert shape_km == calculator.shape_calculator.calculate_path_distance(path, simple_graph)
+        assert length_km == calculator.length_calculator.calculate_path_length(path, simple_graph)
+        assert lights == calculator.crossing_calculator.count_traffic_lights(path, simple_graph)
+    
+    def test_calculate_uses_cost_cache(self, simple_graph: RoadGraph, target_curve: List[Coordinate]):
+        """같은 경로는 캐시된 결과를 반환하고, 그래프가 바뀌면 다시 계산"""
+        calculator = CostCalculator(target_curve, 3.0, max_crossings=1)
+        path = [1, 2, 3]
+        
+        first = calculator.calculate(path, simple_graph)
+        assert calculator.calculate(list(path), simple_graph) is first
+        
+        simple_graph.add_edge(Edge(id=99, source_id=4, target_id=1, length_m=10.0, is_oneway=True))
+        recalculated = calculator.calculate(path, simple_graph)
+        assert recalculated is not first
+        assert recalculated == first
+        
+        calculator.clear_cost_cache()
+        assert calculator._cost_cache == {}
+    
+    def test_graph_change_clears_edge_distance_cache(
+        self, simple_graph: RoadGraph, target_curve: List[Coordinate]
+    ):
+        """노드 좌표가 바뀌면 경로 비용 캐시와 함께 엣지 거리 캐시도 다시 계산"""
+        calculator = CostCalculator(target_curve, 3.0, max_crossings=1)
+        path = [1, 2, 3]
+        calculator.calculate(path, simple_graph)
+        
+        moved = simple_graph.get_node(2)
+        simple_graph.add_node(Node(id=2, lat=moved.lat + 0.003, lng=moved.lng))
+        
+        recalculated = calculator.calculate(path, simple_graph)
+        fresh = CostCalculator(target_curve, 3.0, max_crossings=1).calculate(path, simple_graph)
+        assert recalculated == fresh
+    
+    def test_put_edge_distances_keeps_existing(self, target_curve: List[Coordinate]):
+        """배치 저장 값은 calculate_edge_distance 캐시로 쓰이고, 이미 있는 값은 유지"""
+        calculator = ShapeDistanceCalculator(target_curve, 3.0)
+        node1 = Node(id=1, lat=37.5, lng=127.0)
+        node2 = Node(id=2, lat=37.51, lng=127.0)
+        calculator.put_edge_distances([1, 2], [2, 1], [0.5, 0.7])
+        calculator.put_edge_distances([1], [2], [9.9])
+        
+        assert calculator.calculate_edge_distance(node1, node2) == 0.5
+        assert calculator.calculate_edge_distance(node2, node1) == 0.7
+        assert calculator.calculate_edge_distance(node1, node2, min_samples=5) != 0.5
+    
+    def test_cost_cache_is_bounded(self, simple_graph: RoadGraph, target_curve: List[Coordinate], monkeypatch):
+        """캐시 크기 상한을 넘으면 가장 오래 사용하지 않은 경로부터 제거"""
+        calculator = CostCalculator(target_curve, 3.0, max_crossings=1)
+        monkeypatch.setattr(calculator, "COST_CACHE_SIZE", 2)
+        
+        calculator.calculate([1, 2], simple_graph)
+        calculator.calculate([2, 3], simple_graph)
+        calculator.calculate([1, 2], simple_graph)
+        calculator.calculate([3, 4], simple_graph)
+        
+        assert list(calculator._cost_cache) == [(1, 2), (3, 4)]
+
+    def test_precompute_edge_costs_matches_edge_terms(self, simple_graph: RoadGraph, target_curve: List[Coordinate]):
+        """CSR 슬롯별 일괄 계산 비용이 엣지별 calculate_edge_terms와 일치"""
+        weights = (0.5, 0.3, 0.2)
+        batch = CostCalculator(target_curve, 3.0, max_crossings=1, weights=weights)
+        single = CostCalculator(target_curve, 3.0, max_crossings=1, weights=weights)
+        
+        edge_cost, shape_dist = batch.precompute_edge_costs(simple_graph)
+        csr = simple_graph.build_csr()
+        
+        assert edge_cost.shape == shape_dist.shape == (csr.slot_count,)
+        for slot in range(csr.slot_count):
+            node1 = simple_graph.get_node(int(csr.node_ids[csr.src_idx[slot]]))
+            node2 = simple_graph.get_node(int(csr.node_ids[csr.nbr_idx[slot]]))
+            edge = simple_graph.edges[int(csr.edge_ids[slot])]
+            
+            expected_cost, expected_shape = single.calculate_edge_terms(node1, node2, edge)
+            assert edge_cost[slot] == pytest.approx(expected_cost, rel=1e-12)
+            assert shape_dist[slot] == pytest.approx(expected_shape, rel=1e-12, abs=1e-15)
+    
     def test_empty_path_raises_error(self, simple_graph: RoadGraph, target_curve: List[Coordinate]):
         """빈 경로는 에러"""
         calculator = CostCalculator(
@@ -1,6 +1,9 @@
 """
 데이터 레이어 엔티티 테스트
 """
+import pickle
+
+import numpy as np
 import pytest
 from src.data.entities import Node, Edge, RoadGraph, RoadType
 
@@ -57,6 +60,18 @@ class TestNode:
         # set에 추가 가능해야 함
         node_set = {node}
         assert node in node_set
+    
+    def test_node_pickle_roundtrip(self):
+        """슬롯 노드 pickle 복원 및 슬롯 도입 전(dict 상태) 호환 테스트"""
+        import pickle
+        
+        node = Node(id=1, lat=37.5665, lng=126.9780, has_traffic_light=True)
+        assert not hasattr(node, '__dict__')
+        assert pickle.loads(pickle.dumps(node)) == node
+        
+        legacy = Node.__new__(Node)
+        legacy.__setstate__({'id': 1, 'lat': 37.5665, 'lng': 126.9780, 'has_traffic_light': True})
+        assert legacy == node
 
 
 class TestEdge:
@@ -181,6 +196,69 @@ class TestRoadGraph:
         # 2 -> 1 불가능
         assert 1 not in graph.get_neighbors(2)
     
+    def test_build_csr(self, sample_graph: RoadGraph):
+        """CSR 인접 구조가 인접 리스트/엣지 조회와 일치하는지 테스트"""
+        csr = sample_graph.build_csr()
+        node_ids = csr.node_ids.tolist()
+    
+        for node_id in sample_graph.nodes:
+            i = csr.index_of[node_id]
+            slots = range(csr.indptr[i], csr.indptr[i + 1])
+            assert {node_ids[csr.nbr_idx[k]] for k in slots} == sample_graph.get_neighbors(node_id)
+    
+            for k in slots:
+                target_id = node_ids[csr.nbr_idx[k]]
+                edge = sample_graph.get_edge_between(node_id, target_id)
+                assert csr.edge_ids[k] == edge.id
+                assert csr.edge_len[k] == pytest.approx(edge.length_km)
+                assert csr.edge_light[k] == sample_graph.get_node(target_id).has_traffic_light
+                assert csr.src_idx[k] == i
+    
+            # 역방향 슬롯은 이 노드로 이동할 수 있는 이전 노드 집합과 일치
+            rev = csr.rev_slot[csr.rev_indptr[i]:csr.rev_indptr[i + 1]]
+            predecessors = {u for u in sample_graph.nodes if node_id in sample_graph.get_neighbors(u)}
+            assert {node_ids[csr.src_idx[k]] for k in rev} == predecessors
+    
+    def test_csr_node_arrays_and_find_slots(self, sample_graph: RoadGraph):
+        """CSR 노드 배열과 (출발, 도착) 슬롯 조회가 그래프 조회와 일치하는지 테스트"""
+        csr = sample_graph.build_csr()
+        node_ids = csr.node_ids.tolist()
+    
+        for i, node_id in enumerate(node_ids):
+            node = sample_graph.get_node(node_id)
+            assert csr.node_lat[i] == node.lat
+            assert csr.node_lng[i] == node.lng
+            assert csr.node_light[i] == node.has_traffic_light
+    
+        src = [i for i in range(len(node_ids)) for _ in node_ids]
+        dst = [j for _ in node_ids for j in range(len(node_ids))]
+        slots = csr.find_slots(src, dst)
+        for i, j, slot in zip(src, dst, slots.tolist()):
+            edge = sample_graph.get_edge_between(node_ids[i], node_ids[j])
+            if edge is None:
+                assert slot == -1
+            else:
+                assert csr.edge_ids[slot] == edge.id
+    
+    def test_csr_path_indices(self, sample_graph: RoadGraph):
+        """경로 노드 ID를 CSR 인덱스로 변환 (그래프에 없는 노드면 None)"""
+        csr = sample_graph.build_csr()
+    
+        idx = csr.path_indices([1, 2, 3])
+        assert [csr.node_ids[i] for i in idx] == [1, 2, 3]
+        assert csr.path_indices([1, 99]) is None
+    
+    def test_build_csr_cache_invalidation(self, sample_graph: RoadGraph):
+        """CSR은 캐시되고, 그래프가 바뀌면 다시 생성되는지 테스트"""
+        csr = sample_graph.build_csr()
+        assert sample_graph.build_csr() is csr
+    
+        sample_graph.add_edge(Edge(id=3, source_id=3, target_id=1, length_m=120.0, is_oneway=True))
+        rebuilt = sample_graph.build_csr()
+    
+        assert rebuilt is not csr
+        assert rebuilt.slot_count == csr.slot_count + 1
+    
     def test_get_edges_from(self, sample_graph: RoadGraph):
         """특정 노드에서 출발하는 엣지 조회 테스트"""
         edges = sample_graph.get_edges_from(2)
@@ -188,6 +266,18 @@ class TestRoadGraph:
         # 노드 2에서 출발하는 엣지 (2->3)와 양방향으로 도착하는 엣지 (1->2)
         assert len(edges) == 2
     
+    def test_get_edges_from_index_updates(self, sample_graph: RoadGraph):
+        """색인 조회 후 추가/교체된 엣지가 반영되고, 자기 루프는 한 번만 포함"""
+        assert [edge.id for edge in sample_graph.get_edges_from(1)] == [1]
+        
+        sample_graph.add_edge(Edge(id=5, source_id=3, target_id=1, length_m=120.0))
+        sample_graph.add_edge(Edge(id=6, source_id=1, target_id=1, length_m=10.0))
+        assert [edge.id for edge in sample_graph.get_edges_from(1)] == [1, 5, 6]
+        
+        sample_graph.add_edge(Edge(id=5, source_id=3, target_id=1, length_m=120.0, is_oneway=True))
+        assert [edge.id for edge in sample_graph.get_edges_from(1)] == [1, 6]
+        assert [edge.id for edge in sample_graph.get_edges_from(3)] == [2, 5]
+    
     def test_get_edge_between(self, sample_graph: RoadGraph):
         """두 노드 사이 엣지 조회 테스트"""
         edge = sample_graph.get_edge_between(1, 2)
@@ -208,6 +298,63 @@ class TestRoadGraph:
         
         assert edge is None
     
+    def test_get_edge_between_index_updates(self, sample_graph: RoadGraph):
+        """색인 조회 후 추가된 엣지도 조회되고, 같은 쌍은 먼저 추가된 엣지가 우선"""
+        assert sample_graph.get_edge_between(3, 1) is None
+        
+        sample_graph.add_edge(Edge(id=3, source_id=3, target_id=1, length_m=120.0, is_oneway=True))
+        sample_graph.add_edge(Edge(id=4, source_id=1, target_id=2, length_m=50.0))
+        
+        assert sample_graph.get_edge_between(3, 1).id == 3
+        assert sample_graph.get_edge_between(1, 3) is None
+        assert sample_graph.get_edge_between(2, 1).id == 1
+    
+    def test_get_edge_between_after_edge_replaced(self, sample_graph: RoadGraph):
+        """같은 ID로 엣지를 교체하면 이전 노드 쌍은 더 이상 조회되지 않음"""
+        assert sample_graph.get_edge_between(1, 2).id == 1
+        
+        sample_graph.add_edge(Edge(id=1, source_id=1, target_id=3, length_m=80.0, is_oneway=True))
+        
+        assert sample_graph.get_edge_between(1, 2) is None
+        assert sample_graph.get_edge_between(1, 3).id == 1
+    
+    def test_freeze_prebuilds_and_blocks_mutation(self, sample_graph: RoadGraph):
+        """freeze 후 파생 구조가 준비되고 노드/엣지 추가는 거부, pickle 복원 후에도 유지"""
+        assert sample_graph.freeze() is sample_graph
+        assert sample_graph.is_frozen
+        assert sample_graph._csr is not None
+        assert sample_graph._edge_index is not None and sample_graph._out_edges is not None
+        
+        with pytest.raises(ValueError):
+            sample_graph.add_node(Node(id=9, lat=37.6, lng=126.9))
+        with pytest.raises(ValueError):
+            sample_graph.add_edge(Edge(id=9, source_id=1, target_id=3, length_m=10.0))
+        assert sample_graph.node_count == 3
+        
+        # 직접 대입도 막아 CSR/색인과 어긋나지 않게 함
+        with pytest.raises(TypeError):
+            sample_graph.nodes[9] = Node(id=9, lat=37.6, lng=126.9)
+        with pytest.raises(TypeError):
+            del sample_graph.edges[1]
+        
+        restored = pickle.loads(pickle.dumps(sample_graph))
+        assert restored.is_frozen
+        assert restored.get_edge_between(2, 1).id == 1
+        assert restored.nodes == sample_graph.nodes
+        with pytest.raises(TypeError):
+            restored.nodes[9] = Node(id=9, lat=37.6, lng=126.9)
+    
+    def test_revision_changes_when_counts_do_not(self, sample_graph: RoadGraph):
+        """같은 ID로 교체해 노드/엣지 수가 그대로여도 변경 번호는 증가"""
+        revision = sample_graph.revision
+        counts = (sample_graph.node_count, sample_graph.edge_count)
+        
+        sample_graph.add_node(Node(id=1, lat=37.7, lng=127.1))
+        sample_graph.add_edge(Edge(id=1, source_id=1, target_id=3, length_m=80.0))
+        
+        assert (sample_graph.node_count, sample_graph.edge_count) == counts
+        assert sample_graph.revision == revision + 2
+    
     def test_get_traffic_light_nodes(self, sample_graph: RoadGraph):
         """신호등 노드 조회 테스트"""
         traffic_nodes = sample_graph.get_traffic_light_nodes()
@@ -224,6 +371,14 @@ class TestRoadGraph:
         assert east == pytest.approx(126.98, rel=1e-3)
         assert west == pytest.approx(126.97, rel=1e-3)
     
+    def test_node_array_queries_follow_added_nodes(self, sample_graph: RoadGraph):
+        """노드 추가 후 바운딩 박스와 신호등 노드 조회에 새 노드 반영"""
+        sample_graph.get_bounding_box()
+        sample_graph.add_node(Node(id=9, lat=37.60, lng=126.90, has_traffic_light=True))
+        
+        assert sample_graph.get_bounding_box() == (37.60, 37.56, 126.98, 126.90)
+        assert [node.id for node in sample_graph.get_traffic_light_nodes()] == [3, 9]
+    
     def test_get_bounding_box_empty_graph(self):
         """빈 그래프 바운딩 박스 테스트"""
         graph = RoadGraph()
@@ -240,6 +395,18 @@ class TestRoadGraph:
         assert nearest is not None
         assert nearest.id == 1
     
+    def test_find_nearest_node_matches_distance_to(self):
+        """배열 계산 결과가 노드별 distance_to 최소값과 일치"""
+        rng = np.random.default_rng(0)
+        graph = RoadGraph()
+        for i, (lat, lng) in enumerate(zip(rng.uniform(37.5, 37.6, 200), rng.uniform(126.9, 127.1, 200))):
+            graph.add_node(Node(id=i, lat=float(lat), lng=float(lng)))
+        
+        for lat, lng in zip(rng.uniform(37.45, 37.65, 20), rng.uniform(126.85, 127.15, 20)):
+            query = Node(id=-1, lat=float(lat), lng=float(lng))
+            expected = min(graph.nodes.values(), key=query.distance_to)
+            assert graph.find_nearest_node(query.lat, query.lng).id == expected.id
+    
     def test_find_nearest_node_empty_graph(self):
         """빈 그래프에서 가장 가까운 노드 찾기 테스트"""
         graph = RoadGraph()
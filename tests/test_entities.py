@@ -1,6 +1,8 @@
 """
 도메인 엔티티 테스트
 """
+import pickle
+
 import pytest
 from src.domain.entities import (
     Coordinate, BoundingBox, Shape, ShapeType,
@@ -25,6 +27,13 @@ class TestCoordinate:
         result = coord.to_tuple()
         
         assert result == (37.5665, 126.9780)
+    
+    def test_slots_and_pickle(self):
+        """슬롯 기반 인스턴스(__dict__ 없음)이며 pickle 왕복 가능"""
+        coord = Coordinate(lat=37.5665, lng=126.9780)
+        
+        assert not hasattr(coord, "__dict__")
+        assert pickle.loads(pickle.dumps(coord)) == coord
 
 
 class TestBoundingBox:
@@ -147,3 +156,21 @@ class TestRouteInfo:
         )
         
         assert route.display_name == "경로 3"
+    
+    def test_coordinates_arr(self):
+        """좌표 배열은 coordinates에서 자동으로 채워지고 비교에는 쓰이지 않음"""
+        coords = [
+            Coordinate(lat=37.56, lng=126.97),
+            Coordinate(lat=37.57, lng=126.98),
+        ]
+        route = RouteInfo(
+            route_id=1,
+            coordinates=coords,
+            total_distance_km=5.2,
+            traffic_light_count=3,
+            shape_similarity=0.85
+        )
+        
+        assert route.coordinates_arr.tolist() == [[37.56, 126.97], [37.57, 126.98]]
+        assert route == RouteInfo(1, list(coords), 5.2, 3, 0.85)
+        assert RouteInfo(2, [], 1.0, 0, 0.5).coordinates_arr.shape == (0, 2)
@@ -5,6 +5,7 @@
 import pytest
 import sys
 from unittest.mock import Mock, patch, MagicMock
+import numpy as np
 
 from src.domain.entities import (
     BoundingBox, Shape, ShapeType, Constraints, 
@@ -90,6 +91,25 @@ class TestSearchRequest:
         assert request.shape.is_custom
         assert len(request.shape.points) == 3
         assert request.constraints.target_distance_km == 10.0
+    
+    def test_create_search_request_with_custom_points_array(self):
+        """캔버스 점 배열 ((N, 2) [y, x])로 요청 생성"""
+        bbox_dict = {'north': 37.57, 'south': 37.56, 'east': 127.01, 'west': 127.0}
+        custom_points = np.array([[0.1, 0.2], [0.9, 0.3], [0.5, 0.8]])
+        
+        request = create_search_request(
+            bbox_dict=bbox_dict,
+            shape_type='custom',
+            custom_points=custom_points,
+            target_distance=10.0,
+            max_traffic_lights=5
+        )
+        
+        assert request.shape.points == [
+            Coordinate(lat=0.1, lng=0.2),
+            Coordinate(lat=0.9, lng=0.3),
+            Coordinate(lat=0.5, lng=0.8),
+        ]
 
 
 @pytest.mark.skipif(not HAS_OSMNX, reason="osmnx not installed")
@@ -170,6 +190,25 @@ class TestRouteSearchService:
         assert response.status in [SearchStatus.COMPLETED, SearchStatus.ERROR]
         assert response.search_area == request.bounding_box
     
+    def test_search_with_graph_loader(self, mock_graph):
+        """주입된 그래프 로더가 확장된 영역으로 호출됨"""
+        requested = []
+
+        def loader(bbox):
+            requested.append(bbox)
+            return mock_graph
+
+        service = RouteSearchService(use_cache=False, graph_loader=loader)
+        service.repository = MagicMock()
+
+        request_bbox = BoundingBox(north=37.57, south=37.56, east=127.01, west=127.0)
+        graph = service._load_graph(request_bbox)
+
+        assert graph is mock_graph
+        assert len(requested) == 1
+        assert requested[0].north > request_bbox.north
+        service.repository.get_graph_by_bbox.assert_not_called()
+
     def test_search_with_empty_graph(self):
         """빈 그래프로 검색 테스트"""
         service = RouteSearchService(use_cache=False)
@@ -3,6 +3,7 @@
 """
 import math
 import pytest
+import numpy as np
 from src.domain.entities import Coordinate, BoundingBox, Shape, ShapeType
 from src.shape.templates import ShapeTemplate, ShapeTemplateRegistry
 from src.shape.transformer import ShapeTransformer, TransformParams
@@ -153,6 +154,19 @@ class TestShapeTransformer:
         assert result[0][0] == pytest.approx(-1, abs=1e-10)
         assert result[0][1] == pytest.approx(0, abs=1e-10)
     
+    def test_rotate_many_matches_rotate(self, transformer: ShapeTransformer):
+        """배치 회전이 각도별 rotate 결과와 일치"""
+        points = [(1.0, 0.5), (-0.3, 2.0), (0.0, -1.0)]
+        angles = [0, 60, 135, 270]
+        center = (0.2, -0.1)
+        
+        result = transformer.rotate_many(np.array(points), angles, center=center)
+        
+        assert result.shape == (len(angles), len(points), 2)
+        for k, angle in enumerate(angles):
+            expected = transformer.rotate(points, angle, center=center)
+            np.testing.assert_allclose(result[k], expected, atol=1e-12)
+    
     def test_scale(self, transformer: ShapeTransformer):
         """스케일링 테스트"""
         points = [(1, 1), (-1, -1)]